@@ -1,10 +1,8 @@
-import pyrebase
 import streamlit as st
-import os
 from frontend.user_dashboard import start_interview
 from frontend.hr_dashboard import hr_dashboard
-import dotenv
-import json
+from backend.repository import get_auth, get_repositories
+from backend.deferred_scoring import forget
 import time
 
 # Configure the Streamlit page
@@ -15,51 +13,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load environment variables and initialize Firebase
-@st.cache_resource
-def init_firebase():
-    """Initialize Firebase connection (cached)"""
-    try:
-        # Try to get Firebase config from Streamlit secrets first (for cloud deployment)
-        if hasattr(st, 'secrets') and 'FIREBASE_CONFIG' in st.secrets:
-            config = dict(st.secrets["FIREBASE_CONFIG"])
-        else:
-            # Fallback to environment variables (for local development)
-            dotenv.load_dotenv()
-            firebaseConfig = os.getenv("FIREBASE_CONFIG")
-            if not firebaseConfig:
-                # Try to read from secrets.toml directly for local development
-                try:
-                    import toml
-                    secrets_path = os.path.join(os.path.dirname(__file__), ".streamlit", "secrets.toml")
-                    if os.path.exists(secrets_path):
-                        secrets = toml.load(secrets_path)
-                        if 'FIREBASE_CONFIG' in secrets:
-                            config = secrets['FIREBASE_CONFIG']
-                        else:
-                            st.error("❌ Firebase configuration not found in secrets.toml")
-                            st.stop()
-                    else:
-                        st.error("❌ System configuration error. Please contact support.")
-                        st.stop()
-                except ImportError:
-                    st.error("❌ Missing toml package. Install with: pip install toml")
-                    st.stop()
-            else:
-                config = json.loads(firebaseConfig)
-        
-        firebase = pyrebase.initialize_app(config)
-        auth = firebase.auth()
-        db = firebase.database()
-        return auth, db
-    except Exception as e:
-        st.error(f"❌ Failed to connect to authentication service: {str(e)}")
-        st.info("💡 Check your Firebase configuration in .streamlit/secrets.toml")
-        st.stop()
-        st.stop()
-
-# Initialize Firebase
-auth, db = init_firebase()
+# Initialize the data backend (shared Firebase app, or local SQLite for offline runs)
+auth = get_auth()
+_, users = get_repositories()
+if not auth or not users:
+    st.info("💡 Check your Firebase configuration in .streamlit/secrets.toml")
+    st.stop()
 
 def create_enhanced_user_profile(uid, email, role, name=""):
     """Create simple user profile"""
@@ -86,7 +45,10 @@ def create_enhanced_user_profile(uid, email, role, name=""):
 
 def logout_user():
     """Logout user and clear session"""
-    for key in ['user', 'role', 'interview_active', 'interview_data', 'extracted_skills', 'extracted_projects', 'user_data']:
+    if 'interview_data' in st.session_state:
+        forget(st.session_state.interview_data.get('interview_id'))
+    for key in ['user', 'role', 'interview_active', 'interview_data', 'extracted_skills', 'extracted_projects', 'user_data',
+                'pending_checkpoint']:
         if key in st.session_state:
             del st.session_state[key]
     st.success("✅ Logged out successfully!")
@@ -179,7 +141,7 @@ def main():
                             with st.spinner("Logging in..."):
                                 user = auth.sign_in_with_email_and_password(email, password)
                                 uid = user['localId']
-                                user_data = db.child("users").child(uid).get().val()
+                                user_data = users.get_user(uid)
                                 
                                 # If user data exists in Firebase, use it
                                 if user_data:
@@ -191,7 +153,7 @@ def main():
                                         
                                         # Update last login for HR users
                                         if role.lower() == "hr":
-                                            db.child("users").child(uid).child("last_login").set(int(time.time() * 1000))
+                                            users.update_user(uid, {"last_login": int(time.time() * 1000)})
                                         
                                         st.success(f"✅ {role} login successful!")
                                         st.rerun()
@@ -200,7 +162,7 @@ def main():
                                 else:
                                     # For new users or missing data, create profile
                                     user_profile = create_enhanced_user_profile(uid, email, role.lower())
-                                    db.child("users").child(uid).set(user_profile)
+                                    users.set_user(uid, user_profile)
                                     st.session_state.user = user
                                     st.session_state.role = role
                                     st.session_state.user_data = user_profile
@@ -235,7 +197,7 @@ def main():
                                     
                                     # Create enhanced user profile
                                     user_data = create_enhanced_user_profile(uid, signup_email, "candidate", signup_name)
-                                    db.child("users").child(uid).set(user_data)
+                                    users.set_user(uid, user_data)
                                     
                                     st.success("✅ Account created successfully! You can now log in.")
                             except Exception:
@@ -0,0 +1,106 @@
+"""
+Choosing the next question category and deciding when an interview is over
+
+INTERVIEW_MODE=fixed (the default) asks 2 questions in each of the 5
+categories, in order. INTERVIEW_MODE=adaptive:
+
+- covers every category once, then asks again where the candidate's score
+  differs most from their running average (the answer that tells us most);
+- picks the difficulty from the scores so far in that category (or overall);
+- stops once the average score is settled: its confidence interval
+  (ADAPTIVE_CONFIDENCE, default 0.95) lies inside one rating band (below 6,
+  6 to 8, 8 and up), after at least ADAPTIVE_MIN_QUESTIONS answers.
+
+Interviews never go past MAX_QUESTIONS either way.
+"""
+import os
+import math
+from statistics import NormalDist, mean, stdev
+
+INTERVIEW_MODE = os.getenv("INTERVIEW_MODE", "fixed").lower()  # fixed / adaptive
+ADAPTIVE_CONFIDENCE = float(os.getenv("ADAPTIVE_CONFIDENCE", "0.95"))
+ADAPTIVE_MIN_QUESTIONS = int(os.getenv("ADAPTIVE_MIN_QUESTIONS", "5"))
+
+CATEGORIES = ['technical_skills', 'communication', 'problem_solving', 'leadership', 'experience']
+QUESTIONS_PER_CATEGORY = 2
+MAX_QUESTIONS = QUESTIONS_PER_CATEGORY * len(CATEGORIES)
+
+SCORE_BANDS = (6, 8)  # the rating boundaries the summaries use
+MIN_SPREAD = 1.0      # floor for the score standard deviation, so a few equal scores don't look certain
+
+
+def interview_finished(interview_data):
+    return bool(interview_data.get('finished')) or interview_data.get('question_count', 0) >= MAX_QUESTIONS
+
+
+def category_scores(interview_data):
+    """{category: [scores]} from the answers recorded so far"""
+    scores = {category: [] for category in CATEGORIES}
+    for answer in interview_data.get('answers', {}).values():
+        if answer.get('score') is not None:
+            scores.setdefault(answer.get('category'), []).append(answer['score'])
+    return scores
+
+
+def score_interval(scores, confidence=ADAPTIVE_CONFIDENCE):
+    """(mean, half width) of the confidence interval for the average score"""
+    spread = max(stdev(scores) if len(scores) > 1 else 0.0, MIN_SPREAD)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return mean(scores), z * spread / math.sqrt(len(scores))
+
+
+def is_settled(scores, categories_covered, confidence=ADAPTIVE_CONFIDENCE):
+    """True once more questions can't plausibly move the average into another band"""
+    if len(scores) < ADAPTIVE_MIN_QUESTIONS or categories_covered < len(CATEGORIES):
+        return False
+    average, half_width = score_interval(scores, confidence)
+    low, high = average - half_width, average + half_width
+    return not any(low < boundary <= high for boundary in SCORE_BANDS)
+
+
+def should_stop(interview_data, category, score, mode=INTERVIEW_MODE):
+    """Whether the interview ends with this answer (not yet recorded in interview_data)"""
+    if interview_data.get('question_count', 0) + 1 >= MAX_QUESTIONS:
+        return True
+    if mode != "adaptive":
+        return False
+    by_category = category_scores(interview_data)
+    if score is not None:  # None while the answer waits for deferred scoring
+        by_category.setdefault(category, []).append(score)
+    scores = [s for values in by_category.values() for s in values]
+    return is_settled(scores, sum(1 for c in CATEGORIES if by_category.get(c)))
+
+
+def difficulty_for(scores):
+    if not scores:
+        return None
+    average = mean(scores)
+    if average < 5:
+        return 'easy'
+    if average >= 7.5:
+        return 'challenging'
+    return 'standard'
+
+
+def next_step(interview_data, mode=INTERVIEW_MODE):
+    """(category, difficulty) for the next question, or None if every category is used up"""
+    used = interview_data['categories_used']
+    if mode != "adaptive":
+        for category in CATEGORIES:
+            if used[category] < QUESTIONS_PER_CATEGORY:
+                return category, None
+        return None
+
+    by_category = category_scores(interview_data)
+    all_scores = [s for values in by_category.values() for s in values]
+    for category in CATEGORIES:
+        if used[category] == 0:
+            return category, difficulty_for(all_scores)
+
+    open_categories = [c for c in CATEGORIES if used[c] < QUESTIONS_PER_CATEGORY]
+    if not open_categories:
+        return None
+    average = mean(all_scores) if all_scores else 0
+    category = max(open_categories,
+                   key=lambda c: abs(mean(by_category[c]) - average) if by_category[c] else 0)
+    return category, difficulty_for(by_category[category] or all_scores)
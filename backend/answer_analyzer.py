@@ -1,10 +1,18 @@
+import re
 import json
+from backend.llm import chat, stream_chat
+from backend.telemetry import count
+from backend.model_router import policy
+FAILED_ANALYSIS = (None, "Unable to analyze response at this time.", "general")
 
+# Scoring settings: low temperature for consistent scores, room for the whole JSON object
+SCORING_MAX_TOKENS = 300
+SCORING_TEMPERATURE = 0.3
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
 
 
-
-def analyze_answer_with_ai(answer, question, groq_client, model="llama-3.3-70b-versatile"):
-    prompt = (
+def _analysis_prompt(answer, question):
+    return (
         f"Question: {question}\n"
         f"Candidate's Answer: {answer}\n"
         "As an HR interviewer, analyze this answer and provide:\n"
@@ -13,18 +21,260 @@ def analyze_answer_with_ai(answer, question, groq_client, model="llama-3.3-70b-v
         "3. The category this question falls under (technical, communication, analytical, leadership, problem_solving)\n"
         "Respond in JSON: {\"score\": <score>, \"justification\": \"...\", \"category\": \"...\"}"
     )
-    response = groq_client.chat.completions.create(
-        model=model,
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=150,
-        temperature=0.9,
-        n=1,
+
+
+def _repair_prompt(content):
+    return (
+        "The following reply was supposed to be a single JSON object with the keys "
+        "\"score\" (a number from 1 to 10), \"justification\" (a string) and \"category\" (a string), "
+        "but it could not be parsed:\n"
+        f"{content}\n"
+        "Return only the corrected JSON object."
+    )
+
+
+def _coerce_score(value):
+    """A number from 1 to 10 out of 8, 8.5, "8", "8/10" or "Score: 8"; None if there's none"""
+    if isinstance(value, bool):
+        return None
+    if not isinstance(value, (int, float)):
+        match = re.search(r'-?\d+(?:\.\d+)?', str(value))
+        if not match:
+            return None
+        value = float(match.group())
+    score = min(max(float(value), 1.0), 10.0)
+    return int(score) if score.is_integer() else round(score, 1)
+
+
+def _json_candidates(content):
+    """The reply itself, the inside of a code fence, then each {...} span in it"""
+    yield content
+    for fenced in re.findall(r'```(?:json)?\s*(.*?)```', content, re.DOTALL):
+        yield fenced
+    depth = 0
+    start = None
+    for i, char in enumerate(content):
+        if char == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                yield content[start:i + 1]
+
+
+def extract_analysis(content):
+    """(score, justification, category) from a model reply, or None.
+    
+    Tolerates code fences and text around the JSON object, numbers sent as
+    strings, out-of-range scores (clamped to 1-10) and, for truncated replies,
+    falls back to picking the score and justification fields out of the text.
+    """
+    if not content:
+        return None
+    for candidate in _json_candidates(content.strip()):
+        try:
+            result = json.loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(result, dict):
+            score = _coerce_score(result.get("score"))
+            if score is not None:
+                justification = str(result.get("justification") or "").strip() or "No justification given."
+                return score, justification, str(result.get("category") or "general")
+    
+    # Truncated or otherwise broken JSON: take the fields we can still find
+    score = re.search(r'"score"\s*:\s*"?(-?\d+(?:\.\d+)?)', content)
+    if not score:
+        return None
+    justification = re.search(r'"justification"\s*:\s*"((?:[^"\\]|\\.)*)', content)
+    category = re.search(r'"category"\s*:\s*"([^"]*)"', content)
+    return (
+        _coerce_score(score.group(1)),
+        justification.group(1).replace('\\"', '"').strip() if justification else "No justification given.",
+        category.group(1) if category else "general",
     )
 
+
+def _repair_analysis(content, groq_client, model, route=None):
+    """One JSON-mode call asking the model to fix its own unparseable reply"""
+    count("llm_retries", stage="scoring", reason="parse_error")
+    try:
+        repaired = chat(groq_client, _repair_prompt(content), model, route=route,
+                        max_tokens=SCORING_MAX_TOKENS,
+                        temperature=0,
+                        response_format=JSON_RESPONSE_FORMAT)
+    except Exception:
+        return None
+    return extract_analysis(repaired)
+
+
+def _finish_analysis(content, groq_client, model, route=None):
+    """Parse a scoring reply, repairing it once if needed; counts the outcome"""
+    result = extract_analysis(content)
+    if result is not None:
+        count("scoring_parse", outcome="ok")
+        return result
+    result = _repair_analysis(content, groq_client, model, route)
+    count("scoring_parse", outcome="repaired" if result else "failed")
+    return result or FAILED_ANALYSIS
+
+
+def _score_with(answer, question, groq_client, model, route=None):
+    try:
+        content = chat(groq_client, _analysis_prompt(answer, question), model, route=route,
+                       max_tokens=SCORING_MAX_TOKENS,
+                       temperature=SCORING_TEMPERATURE,
+                       response_format=JSON_RESPONSE_FORMAT)
+    except Exception as e:
+        content = _failed_generation(e)
+        if content is None:
+            raise
+    return _finish_analysis(content, groq_client, model, route)
+
+
+def analyze_answer_with_ai(answer, question, groq_client, model=None, category=None):
+    """Score an answer using the provider's JSON response format.
+    
+    Without an explicit model the routing policy picks one, and a borderline
+    score from the small model is re-scored by the large one.
+    """
+    if model is not None:
+        return _score_with(answer, question, groq_client, model)
+    tier, model = policy.scoring_model(answer, question, category)
+    result = _score_with(answer, question, groq_client, model, f"scoring/{tier}")
+    return _escalate(result, tier, answer, question, groq_client)
+
+
+def _escalate(result, tier, answer, question, groq_client):
+    """Re-score with the large model if the policy asks for a second opinion"""
+    large_model = policy.escalation_model(tier, result[0])
+    if large_model is None:
+        return result
     try:
-        result = json.loads(response.choices[0].message.content)
-        return result["score"], result["justification"], result.get("category", "general")
+        escalated = _score_with(answer, question, groq_client, large_model, "scoring/escalated")
     except Exception:
-        return None, "Unable to analyze response at this time.", "general"
+        return result
+    return escalated if escalated[0] is not None else result
+
+
+def _failed_generation(error):
+    """The invalid output from a JSON-mode "json_validate_failed" API error, else None"""
+    body = getattr(error, "body", None)
+    if not isinstance(body, dict):
+        return None
+    details = body.get("error", body)
+    return details.get("failed_generation") if isinstance(details, dict) else None
+
+
+_JUSTIFICATION_START = re.compile(r'"justification"\s*:\s*"')
+_JSON_ESCAPES = {'n': '\n', 't': '\t', '"': '"', '\\': '\\', '/': '/'}
+
+
+class AnswerAnalysisStream:
+    """Streams the justification of an answer analysis while it is generated.
+
+    Iterate it (e.g. with st.write_stream) to get the justification text as the
+    model writes it; afterwards result() returns (score, justification,
+    category) like analyze_answer_with_ai. JSON mode can't be combined with
+    streaming, so the reply goes through the tolerant parser and, if that
+    fails, one JSON-mode repair call; if the stream breaks off, the answer is
+    scored again in JSON mode. When the reply had no justification field to
+    stream, the parsed justification is yielded at the end instead, so what
+    is shown always comes from the structured result. Routing and escalation
+    work as in analyze_answer_with_ai; an escalated result replaces the
+    streamed one, and `escalated` is then True so the caller can replace the
+    feedback it showed.
+    """
+
+    def __init__(self, answer, question, groq_client, model=None, category=None):
+        self._client = groq_client
+        self._answer = answer
+        self._question = question
+        self._tier = None
+        self._route = None
+        if model is None:
+            self._tier, model = policy.scoring_model(answer, question, category)
+            self._route = f"scoring/{self._tier}"
+        self._model = model
+        self._chunks = stream_chat(groq_client, _analysis_prompt(answer, question), model, route=self._route,
+                                   max_tokens=SCORING_MAX_TOKENS,
+                                   temperature=SCORING_TEMPERATURE)
+        self._content = ""
+        self._done = False
+        self._stream_failed = False
+        self._parsed = None
+        self.escalated = False
+
+    def __iter__(self):
+        emitted = 0    # position in _content up to which the justification was yielded
+        closed = False
+        try:
+            for delta in self._chunks:
+                self._content += delta
+                if closed:
+                    continue
+                if not emitted:
+                    match = _JUSTIFICATION_START.search(self._content)
+                    if not match:
+                        continue
+                    emitted = match.end()
+                text, emitted, closed = self._read_string(emitted)
+                if text:
+                    yield text
+        except Exception:
+            self._stream_failed = True
+        self._done = True
+        if not emitted:
+            score, justification, _ = self._parse()
+            if score is not None:
+                yield justification
+
+    def _parse(self):
+        """The streamed reply handled like a JSON-mode one: tolerant parse, then one repair"""
+        if self._parsed is None:
+            if self._stream_failed and extract_analysis(self._content) is None:
+                # Nothing usable arrived before the stream broke off: score it in JSON mode
+                count("llm_retries", stage="scoring", reason="stream_error")
+                try:
+                    self._parsed = _score_with(self._answer, self._question, self._client, self._model,
+                                               self._route)
+                except Exception:
+                    self._parsed = FAILED_ANALYSIS
+            else:
+                self._parsed = _finish_analysis(self._content, self._client, self._model, self._route)
+        return self._parsed
 
+    def _read_string(self, pos):
+        """Decode the JSON string from pos as far as it has arrived"""
+        out = []
+        content = self._content
+        while pos < len(content):
+            char = content[pos]
+            if char == '"':
+                return "".join(out), pos + 1, True
+            if char == '\\':
+                if pos + 1 >= len(content) or (content[pos + 1] == 'u' and pos + 6 > len(content)):
+                    break  # wait for the rest of the escape
+                if content[pos + 1] == 'u':
+                    out.append(chr(int(content[pos + 2:pos + 6], 16)))
+                    pos += 6
+                    continue
+                out.append(_JSON_ESCAPES.get(content[pos + 1], content[pos + 1]))
+                pos += 2
+                continue
+            out.append(char)
+            pos += 1
+        return "".join(out), pos, False
 
+    def result(self):
+        if not self._done:
+            for _ in self:
+                pass
+        result = self._parse()
+        if self._tier is None:
+            return result
+        final = _escalate(result, self._tier, self._answer, self._question, self._client)
+        self.escalated = final is not result
+        return final
@@ -0,0 +1,191 @@
+"""
+Background, paged deletion of interview data
+
+A delete job walks the interviews one page of candidates at a time and
+issues one delete request per candidate shard. Progress is checkpointed to a
+small JSON file after every page, so a job that fails (e.g. expired token,
+network error) can be resumed from the last finished candidate.
+
+An empty scope deletes everything, so nothing needs to be inspected: the job
+lists candidate keys with a single shallow read and deletes each shard
+without downloading its interviews.
+
+A scope narrows what gets deleted:
+    {"start_date": ms, "end_date": ms, "status": "completed", "candidate": "email or uid"}
+Missing / None keys match everything.
+"""
+import os
+import json
+import time
+import uuid
+import threading
+
+from backend.cache import interview_cache
+
+DELETE_PAGE_SIZE = 50  # candidates per page
+JOBS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "delete_jobs")
+
+
+def matches_scope(uid, interview_data, scope):
+    """True if the interview falls inside the delete scope"""
+    scope = scope or {}
+    candidate = scope.get('candidate')
+    if candidate and candidate not in (uid, interview_data.get('user_email')):
+        return False
+    status = scope.get('status')
+    if status and (interview_data.get('status') or '').lower() != status.lower():
+        return False
+    date = interview_data.get('interview_date', 0)
+    if scope.get('start_date') is not None and date < scope['start_date']:
+        return False
+    if scope.get('end_date') is not None and date > scope['end_date']:
+        return False
+    return True
+
+
+class BulkDeleteJob:
+    """One delete run; state is saved to JOBS_DIR/<job_id>.json after each page"""
+
+    def __init__(self, scope=None, job_id=None, state=None):
+        self.job_id = job_id or uuid.uuid4().hex[:12]
+        self.state = state or {
+            'job_id': self.job_id,
+            'scope': scope or {},
+            'status': 'pending',           # pending / running / completed / failed
+            'last_uid': None,              # checkpoint: every candidate up to here is done
+            'candidates_total': None,
+            'candidates_done': 0,
+            'interviews_deleted': 0,
+            'candidates_deleted': 0,       # whole shards removed by an unscoped job
+            'error': None,
+            'updated_at': None,
+        }
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return os.path.join(JOBS_DIR, f"{self.job_id}.json")
+
+    @classmethod
+    def load(cls, job_id):
+        with open(os.path.join(JOBS_DIR, f"{job_id}.json")) as f:
+            state = json.load(f)
+        return cls(job_id=job_id, state=state)
+
+    def _save(self, **changes):
+        with self._lock:
+            self.state.update(changes, updated_at=int(time.time() * 1000))
+            snapshot = dict(self.state)
+        os.makedirs(JOBS_DIR, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self.path)
+
+    def progress(self):
+        """Copy of the job state for display"""
+        with self._lock:
+            return dict(self.state)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interviews, token=None):
+        """Run (or resume) the job in a background thread"""
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self.run, args=(interviews, token),
+                                        name=f"bulk-delete-{self.job_id}", daemon=True)
+        self._thread.start()
+
+    def run(self, interviews, token=None):
+        scope = self.state['scope']
+        self._save(status='running', error=None)
+        try:
+            if not any(value is not None for value in scope.values()):
+                self._delete_all_candidates(interviews, token)
+                self._save(status='completed')
+                return
+
+            if self.state['candidates_total'] is None:
+                self._save(candidates_total=interviews.count_candidates(token))
+
+            for page in interviews.iter_pages(DELETE_PAGE_SIZE, token, start_after=self.state['last_uid']):
+                deleted = 0
+                for uid, user_interviews in page.items():
+                    user_interviews = user_interviews or {}
+                    doomed = [iid for iid, data in user_interviews.items() if matches_scope(uid, data or {}, scope)]
+                    if doomed and len(doomed) == len(user_interviews):
+                        interviews.delete_candidate(uid, token)
+                    elif doomed:
+                        interviews.delete_interviews(uid, doomed, token)
+                    deleted += len(doomed)
+
+                # Checkpoint, then make sure no dashboard keeps serving deleted data
+                self._save(last_uid=next(reversed(page)),
+                           candidates_done=self.state['candidates_done'] + len(page),
+                           interviews_deleted=self.state['interviews_deleted'] + deleted)
+                if deleted:
+                    interview_cache.invalidate(("interviews",))
+
+            self._save(status='completed')
+        except Exception as e:
+            self._save(status='failed', error=str(e))
+        finally:
+            interview_cache.invalidate(("interviews",))
+
+    def _delete_all_candidates(self, interviews, token):
+        """Unscoped run: delete every candidate shard, paging over keys only"""
+        uids = interviews.list_candidates(token)
+        if self.state['candidates_total'] is None:
+            self._save(candidates_total=len(uids))
+        last_uid = self.state['last_uid']
+        if last_uid is not None:
+            uids = [uid for uid in uids if uid > last_uid]
+
+        for start in range(0, len(uids), DELETE_PAGE_SIZE):
+            page = uids[start:start + DELETE_PAGE_SIZE]
+            for uid in page:
+                interviews.delete_candidate(uid, token)
+            self._save(last_uid=page[-1],
+                       candidates_done=self.state['candidates_done'] + len(page),
+                       candidates_deleted=self.state.get('candidates_deleted', 0) + len(page))
+            interview_cache.invalidate(("interviews",))
+
+
+_current_job = None
+_jobs_scanned = False
+_jobs_lock = threading.Lock()
+
+
+def get_current_job():
+    """The most recent delete job: started in this process, or an unfinished
+    one left behind by a previous process (so it can be resumed)"""
+    global _current_job, _jobs_scanned
+    with _jobs_lock:
+        if _current_job is None and not _jobs_scanned and os.path.isdir(JOBS_DIR):
+            _jobs_scanned = True
+            job_files = [f for f in os.listdir(JOBS_DIR) if f.endswith(".json")]
+            if job_files:
+                latest = max(job_files, key=lambda f: os.path.getmtime(os.path.join(JOBS_DIR, f)))
+                job = BulkDeleteJob.load(latest[:-len(".json")])
+                if job.state['status'] in ('pending', 'running'):
+                    # Its process went away mid-run
+                    job.state.update(status='failed', error="interrupted")
+                if job.state['status'] == 'failed':
+                    _current_job = job
+        return _current_job
+
+
+def start_delete_job(interviews, scope=None, token=None, resume_job_id=None):
+    """Start a new delete job, or resume a failed one, unless one is running"""
+    global _current_job
+    with _jobs_lock:
+        if _current_job is not None and _current_job.running:
+            return _current_job
+        job = BulkDeleteJob.load(resume_job_id) if resume_job_id else BulkDeleteJob(scope)
+        _current_job = job
+        job.start(interviews, token)
+        return job
@@ -0,0 +1,97 @@
+"""
+Process-wide stale-while-revalidate cache for dashboard reads
+
+Entries younger than `ttl` are served as-is. Older entries are still served
+immediately while a single background thread reloads them; entries older than
+`max_stale` (or explicitly invalidated) are reloaded before returning.
+Concurrent callers for the same key share one load.
+"""
+import os
+import time
+import threading
+
+from backend.telemetry import count
+
+
+class StaleWhileRevalidateCache:
+    def __init__(self, ttl=60, max_stale=600):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._entries = {}       # key -> (loaded_at, value)
+        self._refreshing = set()
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._generation = 0     # bumped by invalidate() so in-flight loads are discarded
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _store(self, key, value, generation):
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic(), value)
+
+    def _load(self, key, loader):
+        with self._lock:
+            generation = self._generation
+        value = loader()
+        self._store(key, value, generation)
+        return value
+
+    def _refresh_in_background(self, key, loader):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._load(key, loader)
+            except Exception:
+                pass  # keep serving the stale value; the next read retries
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f"swr-refresh-{key}", daemon=True).start()
+
+    def get(self, key, loader):
+        """Return the cached value for key, loading it with loader() when needed"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl:
+                count("cache_requests", cache=key[0], result="hit")
+                return entry[1]
+            if age < self.max_stale:
+                count("cache_requests", cache=key[0], result="stale")
+                self._refresh_in_background(key, loader)
+                return entry[1]
+        count("cache_requests", cache=key[0], result="miss")
+
+        # Missing or too old: load now, once for all waiting callers
+        with self._key_lock(key):
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+            return self._load(key, loader)
+
+    def invalidate(self, prefix=None):
+        """Drop all entries, or those whose key tuple starts with prefix"""
+        with self._lock:
+            self._generation += 1
+            if prefix is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[:len(prefix)] == prefix]:
+                    del self._entries[key]
+
+
+# Shared by every HR session in this process
+interview_cache = StaleWhileRevalidateCache(
+    ttl=float(os.getenv("HR_CACHE_TTL", "60")),
+    max_stale=float(os.getenv("HR_CACHE_MAX_STALE", "600")),
+)
@@ -2,20 +2,319 @@
 Simplified audio handler that definitely works
 """
 import streamlit as st
-import speech_recognition as sr
 import io
-import numpy as np
+import re
+import hashlib
+import time
+import queue
+import asyncio
+import threading
+import os
+from backend.lazy_imports import lazy_import
+from backend.telemetry import span, count
+
+# Heavy audio dependencies load on first use
+sr = lazy_import("speech_recognition")
+np = lazy_import("numpy")
+
+# Edge-TTS voice and output format (the default format is 24kHz / 48kbit/s mono MP3)
+TTS_VOICE = "en-US-JennyNeural"  # Natural-sounding female voice
+TTS_BITRATE = 48000
+TTS_TIMEOUT = 10  # seconds
+# "edge" (default, needs internet) or "offline" (local pyttsx3 engine, for kiosk deployments)
+TTS_BACKEND = os.getenv("TTS_BACKEND", "edge").lower()
+
+# Longest spoken answer kept; anything after it is cut (and the candidate told)
+MAX_ANSWER_SECONDS = float(os.getenv("MAX_ANSWER_SECONDS", "300"))
+
+
+# Speech recognition input format and preprocessing thresholds
+TARGET_SAMPLE_RATE = 16000
+TARGET_RMS_DBFS = -20.0
+PEAK_LIMIT = 0.97
+SILENCE_FRAME_MS = 20
+SILENCE_THRESHOLD_DB = -40.0  # relative to the loudest frame
+SILENCE_FLOOR_DBFS = -60.0
+SILENCE_PADDING_MS = 200
+CLIP_LEVEL = 0.999
+CLIP_WARN_RATIO = 0.001
+
+
+def format_duration(seconds):
+    """Human-readable length for messages, e.g. 5 minutes or 90 seconds"""
+    if seconds >= 60 and seconds % 60 == 0:
+        minutes = int(seconds // 60)
+        return f"{minutes} minute{'s' if minutes != 1 else ''}"
+    return f"{seconds:g} seconds"
+
+
+def load_audio(audio_bytes):
+    """Decode recorded audio to a float32 mono array and its sample rate"""
+    try:
+        import soundfile as sf
+        data, rate = sf.read(io.BytesIO(audio_bytes), dtype='float32', always_2d=True)
+        return data.mean(axis=1), rate
+    except Exception:
+        # Formats soundfile can't read (e.g. compressed browser audio) go through librosa
+        import librosa
+        y, rate = librosa.load(io.BytesIO(audio_bytes), sr=None, mono=True)
+        return y.astype(np.float32, copy=False), rate
+
+
+def resample_audio(y, orig_rate, target_rate=TARGET_SAMPLE_RATE):
+    """Polyphase resampling (soxr when installed, scipy otherwise)"""
+    if orig_rate == target_rate or y.size == 0:
+        return y
+    try:
+        import soxr
+        return soxr.resample(y, orig_rate, target_rate).astype(np.float32, copy=False)
+    except ImportError:
+        from math import gcd
+        from scipy.signal import resample_poly
+        g = gcd(int(orig_rate), int(target_rate))
+        return resample_poly(y, target_rate // g, orig_rate // g).astype(np.float32, copy=False)
+
+
+def trim_silence(y, rate):
+    """Cut leading/trailing silence using per-frame RMS energy"""
+    frame = max(int(rate * SILENCE_FRAME_MS / 1000), 1)
+    n_frames = y.size // frame
+    if n_frames == 0:
+        return y
+    frames = y[:n_frames * frame].reshape(n_frames, frame)
+    rms_db = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-12)
+    threshold = max(rms_db.max() + SILENCE_THRESHOLD_DB, SILENCE_FLOOR_DBFS)
+    voiced = np.flatnonzero(rms_db > threshold)
+    if voiced.size == 0:
+        return y[:0]
+    pad = int(rate * SILENCE_PADDING_MS / 1000)
+    start = max(voiced[0] * frame - pad, 0)
+    end = min((voiced[-1] + 1) * frame + pad, y.size)
+    return y[start:end]
+
+
+def normalize_loudness(y):
+    """Scale to the target RMS level without letting peaks exceed PEAK_LIMIT"""
+    if y.size == 0:
+        return y
+    rms = np.sqrt(np.mean(y * y))
+    peak = np.max(np.abs(y))
+    if rms <= 0 or peak <= 0:
+        return y
+    gain = min(10 ** (TARGET_RMS_DBFS / 20) / rms, PEAK_LIMIT / peak)
+    return y * np.float32(gain)
+
+
+def preprocess_audio(y, orig_rate):
+    """Resample to 16kHz, detect clipping, trim silence and normalize.
+
+    Returns the processed float32 signal and a dict of stats about the input.
+    """
+    y = np.asarray(y, dtype=np.float32)
+    stats = {
+        'input_seconds': y.size / orig_rate if orig_rate else 0.0,
+        'clipped_ratio': float(np.mean(np.abs(y) >= CLIP_LEVEL)) if y.size else 0.0,
+    }
+    y = resample_audio(y, orig_rate)
+    y = trim_silence(y, TARGET_SAMPLE_RATE)
+    y = normalize_loudness(y)
+    stats['output_seconds'] = y.size / TARGET_SAMPLE_RATE
+    return y, stats
+
+
+def encode_flac(y, rate=TARGET_SAMPLE_RATE):
+    """Losslessly compress a float signal to 16-bit FLAC bytes"""
+    import soundfile as sf
+    buffer = io.BytesIO()
+    sf.write(buffer, y, rate, format='FLAC', subtype='PCM_16')
+    return buffer.getvalue()
+
+
+def to_pcm16(y):
+    """Float signal in [-1, 1] to 16-bit little-endian PCM bytes"""
+    return (np.clip(y, -1.0, 1.0) * 32767).astype('<i2').tobytes()
+
+
+def _split_sentences(text):
+    """Split question text into sentences for incremental synthesis"""
+    return [s.strip() for s in re.split(r'(?<=[.!?])\s+', text.strip()) if s.strip()]
+
+
+def _mp3_duration(audio_bytes):
+    """Approximate playback length (seconds) of constant-bitrate Edge-TTS audio"""
+    return len(audio_bytes) * 8 / TTS_BITRATE
+
+
+def _sentences_as_completed(deltas, sentence_queue, accept=lambda text: True):
+    """Pass text deltas through, queueing each sentence once it is complete.
+
+    A sentence counts as complete when whitespace follows its end punctuation;
+    the remainder is queued when the deltas run out, then None. Nothing is
+    queued until accept(completed sentences) agrees, once the first sentence
+    is complete; the full text is checked again before its last sentence is
+    queued. If accept says no, the stream stops there.
+    """
+    buffer = ""
+    text = ""
+    accepted = False
+    try:
+        for delta in deltas:
+            yield delta
+            buffer += delta
+            text += delta
+            sentences = _split_sentences(buffer)
+            if len(sentences) > 1:
+                if not accepted:
+                    if not accept(" ".join(sentences[:-1])):
+                        return
+                    accepted = True
+                for sentence in sentences[:-1]:
+                    sentence_queue.put(sentence)
+                buffer = buffer[buffer.rfind(sentences[-1]):]  # keep its trailing space
+        if buffer.strip() and accept(text.strip()):
+            sentence_queue.put(buffer.strip())
+    finally:
+        sentence_queue.put(None)
+
+
+def _iter_queue(q):
+    """Items from q until None"""
+    while True:
+        item = q.get()
+        if item is None:
+            return
+        yield item
+
+
+class _Playback:
+    """Question audio in one st.empty() slot, fed with chunk_queue items as they arrive.
+
+    The first sentence plays as soon as it is synthesized. Audio that arrives
+    while a track is playing is queued and played as the next track once that
+    one has ended, so nothing is replayed or skipped (st.audio's start_time
+    only takes whole seconds).
+    """
+
+    def __init__(self, player):
+        self.player = player
+        self.queued = b""
+        self.ends_at = None  # when the current track has finished playing
+        self.played = False
+        self.finished = False  # no more audio will arrive
+        self.error = None
+
+    def take(self, item):
+        """Handle one chunk_queue item: (index, mp3 bytes), an exception, or None at the end"""
+        if item is None:
+            self.finished = True
+        elif isinstance(item, Exception):
+            self.error, self.finished = item, True
+        else:
+            self.queued += item[1]
+        self.poll()
+
+    def poll(self):
+        """Start the queued audio unless a track is still playing"""
+        if not self.queued or (self.ends_at is not None and time.monotonic() < self.ends_at):
+            return
+        with self.player.container():
+            st.success("🔊 Playing question audio:")
+            st.audio(self.queued, format="audio/mp3", autoplay=True)
+        self.ends_at = time.monotonic() + _mp3_duration(self.queued)
+        self.queued = b""
+        self.played = True
+
+    def drain(self, chunk_queue):
+        """Take whatever has arrived without waiting"""
+        while not self.finished:
+            try:
+                self.take(chunk_queue.get_nowait())
+            except queue.Empty:
+                break
+        self.poll()
+
+    def finish(self):
+        """Play what is still queued once the current track has ended"""
+        while self.queued:
+            time.sleep(max(self.ends_at - time.monotonic(), 0))
+            self.poll()
+
+
+def _stream_segments(segments, chunk_queue):
+    """Stream each sentence from Edge-TTS and queue (index, mp3_bytes) as it completes.
+
+    `segments` may be a list or any iterable that yields sentences as they arrive.
+    """
+    import edge_tts
+    
+    async def stream_all():
+        for index, segment in enumerate(segments):
+            communicate = edge_tts.Communicate(segment, TTS_VOICE)
+            audio = bytearray()
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    audio.extend(chunk["data"])
+            chunk_queue.put((index, bytes(audio)))
+    
+    # Own event loop so we never clash with Streamlit's
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(stream_all())
+    except Exception as e:
+        chunk_queue.put(e)
+    finally:
+        loop.close()
+        chunk_queue.put(None)
+
 
 class CloudSpeechIO:
     def __init__(self):
+        self.audio_ends_at = None  # time.monotonic() when the last question audio stops, if known
         self.recognizer = sr.Recognizer()
         # Optimize recognizer settings for better performance
         self.recognizer.energy_threshold = 300
         self.recognizer.pause_threshold = 0.8
         self.recognizer.phrase_threshold = 0.3
     
-    def speak(self, text):
+    def speak(self, text, progressive=True):
         """Text-to-speech functionality using Edge-TTS for cloud compatibility"""
+        # Always show visual question for accessibility - before the audio, so it can be read right away
+        st.markdown(
+            f"""
+            <div style="
+                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                color: white;
+                padding: 20px;
+                border-radius: 10px;
+                border-left: 5px solid #ffd700;
+                margin: 15px 0;
+                box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+            ">
+                <h3 style="margin: 0 0 10px 0; color: #ffd700;">
+                    🎤 Interview Question
+                </h3>
+                <p style="margin: 0; font-size: 18px; line-height: 1.4; font-weight: 500;">
+                    {text}
+                </p>
+            </div>
+            """, 
+            unsafe_allow_html=True
+        )
+        
+        with span("tts", backend=TTS_BACKEND, chars=len(text)) as tts_span:
+            if TTS_BACKEND == "offline":
+                audio_played = self._speak_offline(text)
+            elif progressive:
+                audio_played = self._speak_progressive(text)
+            else:
+                audio_played = self._speak_buffered(text)
+            tts_span.set(audio_played=audio_played)
+        
+        if not audio_played:
+            st.info("💡 **Tip:** You can read the question above if audio doesn't work on your device.")
+    
+    def _speak_buffered(self, text):
+        """Synthesize the whole question to a temp MP3, then play it"""
         import tempfile
         import os
         import asyncio
@@ -32,9 +331,7 @@ class CloudSpeechIO:
             
             # Use Edge-TTS to generate speech
             async def generate_speech():
-                # Use a high-quality English voice
-                voice = "en-US-JennyNeural"  # Natural-sounding female voice
-                communicate = edge_tts.Communicate(text, voice)
+                communicate = edge_tts.Communicate(text, TTS_VOICE)
                 await communicate.save(audio_file_path)
             
             # Run the async function
@@ -62,6 +359,7 @@ class CloudSpeechIO:
                 st.success("🔊 Playing question audio:")
                 st.audio(audio_bytes, format="audio/mp3")
                 audio_played = True
+                self.audio_ends_at = time.monotonic() + _mp3_duration(audio_bytes)
                 
             else:
                 st.warning("🔇 Audio generation failed")
@@ -79,34 +377,150 @@ class CloudSpeechIO:
                 except:
                     pass  # Ignore cleanup errors
         
-        # Always show visual question for accessibility
-        st.markdown(
-            f"""
-            <div style="
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 20px;
-                border-radius: 10px;
-                border-left: 5px solid #ffd700;
-                margin: 15px 0;
-                box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-            ">
-                <h3 style="margin: 0 0 10px 0; color: #ffd700;">
-                    🎤 Interview Question
-                </h3>
-                <p style="margin: 0; font-size: 18px; line-height: 1.4; font-weight: 500;">
-                    {text}
-                </p>
-            </div>
-            """, 
-            unsafe_allow_html=True
-        )
+        return audio_played
+    
+    def _speak_offline(self, text):
+        """Render the question to WAV with the shared local pyttsx3 engine"""
+        try:
+            from backend.speech_io import get_offline_tts
+            audio_bytes = get_offline_tts().synthesize(text)
+        except ImportError:
+            st.warning("🔇 Offline TTS (pyttsx3) not available")
+            return False
+        except Exception as e:
+            st.warning(f"🔇 Audio generation error: {str(e)}")
+            return False
         
-        if not audio_played:
-            st.info("💡 **Tip:** You can read the question above if audio doesn't work on your device.")
+        if not audio_bytes:
+            st.warning("🔇 Audio generation failed")
+            return False
+        
+        st.success("🔊 Playing question audio:")
+        st.audio(audio_bytes, format="audio/wav", autoplay=True)
+        return True
     
-    def listen_for_answer(self, timeout=30):
-        """Record audio and convert to text with user confirmation"""
+    def _speak_progressive(self, text):
+        """Play the first sentence as soon as it is synthesized, then the rest.
+        
+        Sentences are streamed from Edge-TTS in a background thread, so the
+        time to first sound only depends on the length of the first sentence.
+        """
+        try:
+            import edge_tts  # noqa: F401
+        except ImportError:
+            st.warning("🔇 Edge-TTS library not available")
+            return False
+        
+        segments = _split_sentences(text)
+        if not segments:
+            return False
+        
+        chunk_queue = queue.Queue()
+        thread = threading.Thread(target=_stream_segments, args=(segments, chunk_queue), daemon=True)
+        thread.start()
+        return self._play_chunks(chunk_queue)
+    
+    def speak_stream(self, deltas, accept=None):
+        """Show LLM text as it streams in and speak it sentence by sentence.
+        
+        Synthesis of the first sentence starts as soon as it is complete,
+        while the rest of the text is still being generated, and playback
+        starts as soon as that audio arrives. Nothing is spoken until
+        accept(text) agrees (e.g. the question isn't a repeat); if it
+        doesn't, the text and audio are cleared and None is returned.
+        Otherwise returns the full text.
+        """
+        st.markdown("#### 🎤 Interview Question")
+        text_slot = st.empty()
+        rejected = []
+        
+        def check(text):
+            if accept is None or accept(text):
+                return True
+            rejected.append(text)
+            return False
+        
+        def reject():
+            text_slot.empty()
+            return None
+        
+        if TTS_BACKEND == "offline":
+            with text_slot:
+                text = st.write_stream(deltas)
+            if not check(text.strip()):
+                return reject()
+            self._speak_offline(text)
+            return text
+        
+        try:
+            import edge_tts  # noqa: F401
+        except ImportError:
+            with text_slot:
+                text = st.write_stream(deltas)
+            return text if check(text.strip()) else reject()
+        
+        sentence_queue = queue.Queue()
+        chunk_queue = queue.Queue()
+        thread = threading.Thread(target=_stream_segments, args=(_iter_queue(sentence_queue), chunk_queue),
+                                  daemon=True)
+        thread.start()
+        playback = _Playback(st.empty())
+        
+        def stream_and_play():
+            for delta in _sentences_as_completed(deltas, sentence_queue, check):
+                yield delta
+                playback.drain(chunk_queue)
+        
+        with text_slot:
+            text = st.write_stream(stream_and_play())
+        if rejected:
+            playback.player.empty()
+            return reject()
+        # The text stream is timed by the caller; this stage is the speech that's left
+        with span("tts", backend=TTS_BACKEND, streamed=True, chars=len(text)) as tts_span:
+            tts_span.set(audio_played=self._play_chunks(chunk_queue, playback))
+        return text
+    
+    def _play_chunks(self, chunk_queue, playback=None):
+        """Play synthesized sentences as they arrive, each after the one before.
+
+        Each sentence gets TTS_TIMEOUT seconds to arrive; the question text is
+        on screen, so a sentence that doesn't just ends the audio early.
+        """
+        playback = playback or _Playback(st.empty())
+        deadline = time.monotonic() + TTS_TIMEOUT
+        
+        while not playback.finished:
+            try:
+                playback.take(chunk_queue.get(timeout=0.1))
+                deadline = time.monotonic() + TTS_TIMEOUT
+            except queue.Empty:
+                if time.monotonic() > deadline:
+                    if not playback.played:
+                        st.warning("🔇 Audio generation timed out")
+                        return False
+                    count("tts_timeouts", stage="later_sentence")
+                    st.caption("🔇 The rest of the question couldn't be spoken - please read it on screen.")
+                    break
+                playback.poll()
+        
+        if not playback.played:
+            if playback.error:
+                st.warning(f"🔇 Audio generation error: {str(playback.error)}")
+            else:
+                st.warning("🔇 Audio generation failed")
+            return False
+        
+        playback.finish()
+        self.audio_ends_at = playback.ends_at
+        return True
+    
+    def listen_for_answer(self, timeout=30, max_seconds=MAX_ANSWER_SECONDS):
+        """Record audio and convert to text with user confirmation.
+        
+        `timeout` is how long to wait for the microphone; answers are kept up
+        to `max_seconds` long.
+        """
         try:
             from audio_recorder_streamlit import audio_recorder
             
@@ -123,11 +537,25 @@ class CloudSpeechIO:
             if audio_bytes:
                 st.success("✅ Audio recorded!")
                 
+                # Keep one compact 16kHz mono copy; the raw WAV isn't held on to
+                recording = self._store_recording(audio_bytes, max_seconds=max_seconds)
+                del audio_bytes
+                
+                if recording['truncated']:
+                    st.warning(f"✂️ Your answer was longer than {format_duration(max_seconds)}, "
+                               "so only the first part was kept. Record a shorter answer to include everything.")
+                
                 # Show audio playback
-                st.audio(audio_bytes, format="audio/wav")
+                st.audio(recording['audio'], format=recording['format'])
                 
-                # Convert to text but don't auto-submit
-                text_result = self._convert_audio_to_text(audio_bytes)
+                # Convert to text once per recording (reruns reuse the transcript)
+                if recording['text'] is None:
+                    with span("stt"):
+                        text = self._recognize(recording['audio'], recording.pop('signal', None))
+                    if text is None:
+                        self._show_recognition_tips()
+                    recording['text'] = text or ""
+                text_result = recording['text']
                 
                 if text_result:
                     # Show the converted text and ask for confirmation
@@ -141,12 +569,13 @@ class CloudSpeechIO:
                             return text_result
                     with col2:
                         if st.button("🔄 Record Again", key="record_again"):
+                            st.session_state.pop('answer_recording', None)
                             st.rerun()
                     
                     st.info("👆 Please confirm your answer or record again")
                     return None
                 else:
-                    return None
+                    return self._text_input()
             
             return None
             
@@ -157,41 +586,83 @@ class CloudSpeechIO:
             st.warning(f"⚠️ Recording failed: {str(e)}. Please type your answer:")
             return self._text_input()
     
-    def _convert_audio_to_text(self, audio_bytes):
-        """Convert audio bytes to text using multiple methods"""
+    def _store_recording(self, audio_bytes, max_seconds=MAX_ANSWER_SECONDS):
+        """Decode a recording once into a bounded, compact session copy.
+        
+        The audio is cut to max_seconds, downmixed/resampled to 16kHz mono and
+        kept as FLAC. The decoded signal is only kept until it's transcribed.
+        """
+        digest = hashlib.sha1(audio_bytes).hexdigest()
+        cached = st.session_state.get('answer_recording')
+        if cached and cached['digest'] == digest:
+            count("cache_requests", cache="recording", result="hit")
+            return cached
+        count("cache_requests", cache="recording", result="miss")
+        
+        recording = {'digest': digest, 'text': None, 'truncated': False}
+        try:
+            y, orig_rate = load_audio(audio_bytes)
+            max_samples = int(max_seconds * orig_rate)
+            if y.size > max_samples:
+                y = y[:max_samples]
+                recording['truncated'] = True
+            y = resample_audio(y, orig_rate)
+            recording.update(audio=encode_flac(y), format="audio/flac", signal=y)
+        except Exception:
+            # Can't decode here - fall back to keeping the original bytes
+            recording.update(audio=audio_bytes, format="audio/wav")
+        
+        # Replacing the previous recording releases its buffers
+        st.session_state.answer_recording = recording
+        return recording
+    
+    def _recognize_google(self, audio_data, language):
+        """One Google STT request (counted, since _recognize may try several)"""
+        count("stt_attempts", language=language)
+        return self.recognizer.recognize_google(audio_data, language=language)
+    
+    def _recognize(self, audio_bytes, signal=None):
+        """Convert audio to text using multiple methods.
+        
+        `signal` is the already-decoded 16kHz mono audio, if available.
+        Returns the text, "" if the recording is silent, or None if every
+        method failed.
+        """
         try:
             st.info("🔄 Converting speech to text...")
             
-            # Method 1: Try with librosa for better audio processing (if available)
+            # Method 1: Decode, resample to 16kHz mono, trim silence and normalize
             try:
-                import librosa
-                import soundfile as sf
+                if signal is not None:
+                    y, orig_rate = signal, TARGET_SAMPLE_RATE
+                else:
+                    y, orig_rate = load_audio(audio_bytes)
+                y, stats = preprocess_audio(y, orig_rate)
                 
-                # Load audio using librosa (more robust)
-                audio_io = io.BytesIO(audio_bytes)
+                if stats['clipped_ratio'] > CLIP_WARN_RATIO:
+                    st.info("📢 Your recording sounds clipped - try moving a little further from the microphone.")
                 
-                # Try to read as different audio formats
-                try:
-                    # Try reading as WAV first
-                    y, sr_rate = librosa.load(audio_io, sr=16000, mono=True)
-                    
-                    # Convert to the format speech_recognition expects
-                    # Ensure the audio is in the right format (16-bit PCM)
-                    audio_int16 = (y * 32767).astype(np.int16)
-                    audio_data = sr.AudioData(audio_int16.tobytes(), 16000, 2)
-                    
-                    text = self.recognizer.recognize_google(audio_data, language='en-US')
-                    
-                    if text.strip():
-                        st.success(f"🎯 **Your Answer:** {text}")
-                        st.info("✅ Processed with advanced audio processing")
-                        return text.strip()
-                        
-                except Exception as e:
-                    st.info(f"Advanced method failed: {e}. Trying basic methods...")
+                if y.size == 0:
+                    # Nothing but silence - no point hammering the speech service
+                    st.warning("⚠️ No speech detected in the recording. Please try again or type your answer:")
+                    return ""
+                
+                audio_data = sr.AudioData(to_pcm16(y), TARGET_SAMPLE_RATE, 2)
+                text = self._recognize_google(audio_data, 'en-US')
+                
+                if text.strip():
+                    st.success(f"🎯 **Your Answer:** {text}")
+                    st.info("✅ Processed with advanced audio processing")
+                    return text.strip()
                     
             except ImportError:
-                st.info("📢 Using basic audio processing (librosa not available)")
+                st.info("📢 Using basic audio processing (soundfile/librosa not available)")
+            except Exception as e:
+                st.info(f"Advanced method failed: {e}. Trying basic methods...")
+            
+            if signal is not None:
+                # The raw-byte guesses below only make sense for audio we couldn't decode
+                return None
             
             # Method 2: Basic approach with multiple sample rates (works without librosa)
             sample_rates = [16000, 44100, 22050, 8000]
@@ -201,7 +672,7 @@ class CloudSpeechIO:
                 for width in sample_widths:
                     try:
                         audio_data = sr.AudioData(audio_bytes, sr_rate, width)
-                        text = self.recognizer.recognize_google(audio_data, language='en-US')
+                        text = self._recognize_google(audio_data, 'en-US')
                         
                         if text.strip():
                             st.success(f"🎯 **Your Answer:** {text}")
@@ -220,7 +691,7 @@ class CloudSpeechIO:
                 languages = ['en-US', 'en-GB', 'en-IN', 'en']
                 for lang in languages:
                     try:
-                        text = self.recognizer.recognize_google(audio_data, language=lang)
+                        text = self._recognize_google(audio_data, lang)
                         if text.strip():
                             st.success(f"🎯 **Your Answer:** {text}")
                             st.info(f"✅ Success with language: {lang}")
@@ -242,7 +713,7 @@ class CloudSpeechIO:
                 self.recognizer.pause_threshold = 0.5   # Shorter pause
                 
                 audio_data = sr.AudioData(audio_bytes, 22050, 2)
-                text = self.recognizer.recognize_google(audio_data, language='en-US')
+                text = self._recognize_google(audio_data, 'en-US')
                 
                 # Restore original settings
                 self.recognizer.energy_threshold = original_energy
@@ -259,26 +730,23 @@ class CloudSpeechIO:
                 self.recognizer.pause_threshold = 0.8
             
             # If all methods fail
-            st.warning("⚠️ Could not understand the audio. This might be due to:")
-            st.warning("• Background noise or unclear speech")
-            st.warning("• Microphone volume too low/high") 
-            st.warning("• Audio format compatibility issues")
-            st.info("💡 **Try these solutions:**")
-            st.info("• Speak louder and more clearly")
-            st.info("• Move closer to your microphone")
-            st.info("• Reduce background noise")
-            st.info("• Use the text input below as backup")
-            return self._text_input()
+            return None
                 
-        except sr.UnknownValueError:
-            st.warning("⚠️ Speech not recognized. Please speak more clearly:")
-            return self._text_input()
-        except sr.RequestError as e:
-            st.warning(f"⚠️ Speech service error: {e}. Please type your answer:")
-            return self._text_input()
         except Exception as e:
-            st.warning(f"⚠️ Audio processing failed: {e}. Please type your answer:")
-            return self._text_input()
+            st.warning(f"⚠️ Audio processing failed: {e}")
+            return None
+    
+    def _show_recognition_tips(self):
+        """Explain why recognition may have failed"""
+        st.warning("⚠️ Could not understand the audio. This might be due to:")
+        st.warning("• Background noise or unclear speech")
+        st.warning("• Microphone volume too low/high") 
+        st.warning("• Audio format compatibility issues")
+        st.info("💡 **Try these solutions:**")
+        st.info("• Speak louder and more clearly")
+        st.info("• Move closer to your microphone")
+        st.info("• Reduce background noise")
+        st.info("• Use the text input below as backup")
     
     def _text_input(self):
         """Simple text input fallback"""
@@ -305,8 +773,15 @@ class SpeechIO:
     def __init__(self):
         self.handler = CloudSpeechIO()
     
-    def speak(self, text):
-        return self.handler.speak(text)
+    def speak(self, text, progressive=True):
+        return self.handler.speak(text, progressive)
+    
+    def speak_stream(self, deltas, accept=None):
+        return self.handler.speak_stream(deltas, accept)
+    
+    def listen_for_answer(self, timeout=30, max_seconds=MAX_ANSWER_SECONDS):
+        return self.handler.listen_for_answer(timeout, max_seconds)
     
-    def listen_for_answer(self, timeout=30):
-        return self.handler.listen_for_answer(timeout)
\ No newline at end of file
+    @property
+    def audio_ends_at(self):
+        return self.handler.audio_ends_at
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+Scoring answers off the candidate's critical path
+
+SCORING_MODE picks when answers are scored:
+    inline      (default) each answer is scored before the next question
+    background  each answer is queued on a shared thread pool as soon as it
+                is given; the candidate moves straight to the next question
+    batch       nothing is scored during the interview; all answers are
+                scored together, in parallel, when the summary opens
+
+Batch mode has no scores until the end, which would leave the adaptive
+interview mode (backend.adaptive_interview) nothing to adapt to or stop on,
+so with INTERVIEW_MODE=adaptive batch falls back to background (with a
+warning at startup).
+
+Pending answers stay in interview_data['answers'] with score None and
+'pending': True until their score is in and on_scored (e.g. the database
+write) has succeeded. The futures live in this module (session state can't
+be touched from worker threads), keyed by interview and question; they are
+dropped once applied, by forget() when an interview is abandoned, and after
+SCORING_RESULT_TTL seconds otherwise. An answer whose future was lost, e.g.
+after a restart, is simply queued again.
+"""
+import os
+import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from backend.answer_analyzer import analyze_answer_with_ai, FAILED_ANALYSIS
+from backend.telemetry import span, count
+from backend.adaptive_interview import INTERVIEW_MODE
+
+SCORING_MODE = os.getenv("SCORING_MODE", "inline").lower()  # inline / background / batch
+if SCORING_MODE == "batch" and INTERVIEW_MODE == "adaptive":
+    print("SCORING_MODE=batch can't be combined with INTERVIEW_MODE=adaptive (no scores to adapt to "
+          "until the end); using SCORING_MODE=background instead.", file=sys.stderr)
+    SCORING_MODE = "background"
+SCORING_WORKERS = int(os.getenv("SCORING_WORKERS", "4"))
+SCORING_TIMEOUT = float(os.getenv("SCORING_TIMEOUT", "60"))
+SCORING_RESULT_TTL = float(os.getenv("SCORING_RESULT_TTL", "3600"))
+
+DEFERRED = SCORING_MODE in ("background", "batch")
+
+_lock = threading.Lock()
+_executor = None
+_client = None
+_futures = {}  # (interview_id, question key) -> (Future of (score, justification, category), queued at)
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=SCORING_WORKERS, thread_name_prefix="scoring")
+        return _executor
+
+
+def _groq_client():
+    global _client
+    if _client is None:
+        from backend.question_generator import QuestionGenerator
+        _client = QuestionGenerator().client
+    return _client
+
+
+def _score(answer, question, category):
+    with span("scoring", category=category, deferred=True):
+        return analyze_answer_with_ai(answer, question, _groq_client(), category=category)
+
+
+def pending_answers(interview_data):
+    """{question key: answer record} for answers still waiting for a score"""
+    return {q_key: a for q_key, a in interview_data.get('answers', {}).items() if a.get('pending')}
+
+
+def _prune(now):
+    """Drop futures of interviews nobody came back for (call with _lock held)"""
+    for key, (future, queued_at) in list(_futures.items()):
+        if now - queued_at > SCORING_RESULT_TTL:
+            future.cancel()
+            del _futures[key]
+            count("deferred_scoring_evicted")
+
+
+def submit(interview_id, q_key, record):
+    """Queue one answer record for scoring (no-op if it is already queued)"""
+    key = (interview_id, q_key)
+    with _lock:
+        _prune(time.monotonic())
+        if key in _futures:
+            return
+    future = _get_executor().submit(_score, record['answer'], record['question'], record.get('category'))
+    with _lock:
+        _futures.setdefault(key, (future, time.monotonic()))
+    count("deferred_scoring_jobs", mode=SCORING_MODE)
+
+
+def forget(interview_id):
+    """Drop every queued score of an interview that is being abandoned or reset"""
+    with _lock:
+        for key in [key for key in _futures if key[0] == interview_id]:
+            _futures.pop(key)[0].cancel()
+
+
+def collect(interview_id, pending, wait=True, timeout=SCORING_TIMEOUT):
+    """Scores for pending answers as {question key: (score, justification, category)}.
+
+    With wait=True every pending answer is queued (if it isn't already) and
+    waited for, up to `timeout` seconds in total; a failed or timed-out
+    answer maps to FAILED_ANALYSIS. With wait=False only the scores that are
+    already done are returned. Finished futures stay queued until
+    apply_scores() has stored their answer, so a failed write is retried
+    without scoring the answer again.
+    """
+    if wait:
+        for q_key, record in pending.items():
+            submit(interview_id, q_key, record)
+    deadline = time.monotonic() + timeout
+    results = {}
+    for q_key in pending:
+        key = (interview_id, q_key)
+        with _lock:
+            future, _ = _futures.get(key, (None, None))
+        if future is None or not (wait or future.done()):
+            continue
+        try:
+            results[q_key] = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeout:
+            results[q_key] = FAILED_ANALYSIS  # keep the future; a later collect can still use it
+        except Exception:
+            results[q_key] = FAILED_ANALYSIS
+            with _lock:
+                _futures.pop(key, None)  # queue it again next time
+    return results
+
+
+def apply_scores(interview_data, results, on_scored=None):
+    """Write collected scores into the session's answers; returns how many were applied.
+
+    on_scored(q_key, scored_record) is called for each newly scored answer,
+    e.g. to persist it, and must return True once it has succeeded. Answers
+    that failed to score, or whose on_scored failed, stay pending.
+    """
+    applied = 0
+    for q_key, (score, justification, category) in results.items():
+        if score is None:
+            continue
+        record = interview_data['answers'][q_key]
+        scored = dict(record, score=score, justification=justification,
+                      category=record.get('category') or category)
+        scored.pop('pending', None)
+        if on_scored and not on_scored(q_key, scored):
+            count("deferred_scoring_unsaved")
+            continue
+        interview_data['answers'][q_key] = scored
+        interview_data['total_score'] = interview_data.get('total_score', 0) + score
+        applied += 1
+        with _lock:
+            _futures.pop((interview_data.get('interview_id'), q_key), None)
+    return applied
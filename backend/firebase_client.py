@@ -0,0 +1,92 @@
+"""
+Firebase connection helpers shared by the app and both dashboards
+"""
+import os
+import json
+import dotenv
+import streamlit as st
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIREBASE_POOL_SIZE = int(os.getenv("FIREBASE_POOL_SIZE", "32"))
+
+
+def load_firebase_config():
+    """Load the Firebase config from Streamlit secrets, env or secrets.toml.
+    
+    Shows an error and returns None if no configuration can be found.
+    """
+    # Try to get Firebase config from Streamlit secrets first (for cloud deployment)
+    if hasattr(st, 'secrets') and 'FIREBASE_CONFIG' in st.secrets:
+        return dict(st.secrets["FIREBASE_CONFIG"])
+    
+    # Fallback to environment variables (for local development)
+    dotenv.load_dotenv()
+    firebase_config = os.getenv("FIREBASE_CONFIG")
+    if firebase_config:
+        return json.loads(firebase_config)
+    
+    # Try to read from secrets.toml directly for local development
+    try:
+        import toml
+    except ImportError:
+        st.error("❌ Missing toml package. Install with: pip install toml")
+        return None
+    
+    secrets_path = os.path.join(ROOT_DIR, ".streamlit", "secrets.toml")
+    if not os.path.exists(secrets_path):
+        st.error("❌ System configuration error. Please contact support.")
+        return None
+    
+    secrets = toml.load(secrets_path)
+    if 'FIREBASE_CONFIG' not in secrets:
+        st.error("❌ Firebase configuration not found in secrets.toml")
+        return None
+    return secrets['FIREBASE_CONFIG']
+
+
+def create_firebase_app(firebase_config, pool_size=FIREBASE_POOL_SIZE):
+    """Initialize a pyrebase app with one keep-alive pool sized for concurrent sessions"""
+    import pyrebase
+    from requests.adapters import HTTPAdapter
+    firebase = pyrebase.initialize_app(firebase_config)
+    
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=3)
+    firebase.requests.mount("https://", adapter)
+    firebase.requests.mount("http://", adapter)
+    return firebase
+
+
+@st.cache_resource
+def get_firebase_app():
+    """Process-wide Firebase app shared by every browser session.
+    
+    Per-user credentials are not stored here: callers pass the signed-in
+    user's idToken with each request.
+    """
+    firebase_config = load_firebase_config()
+    if not firebase_config:
+        # Raise rather than return None so the failure isn't cached
+        raise RuntimeError("Firebase configuration not found")
+    return create_firebase_app(firebase_config)
+
+
+def get_firebase_db():
+    """Get a database handle on the shared Firebase app.
+    
+    pyrebase handles keep the current query path as state, so each caller
+    gets its own (cheap) handle; all of them share the app's HTTP pool.
+    """
+    try:
+        return get_firebase_app().database()
+    except Exception:
+        st.error("❌ Unable to connect to database. Please try again later.")
+        return None
+
+
+def get_firebase_auth():
+    """Get an auth handle on the shared Firebase app"""
+    try:
+        return get_firebase_app().auth()
+    except Exception:
+        st.error("❌ Failed to connect to authentication service.")
+        return None
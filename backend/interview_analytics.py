@@ -0,0 +1,136 @@
+"""
+Columnar views of interview data for the HR dashboard
+
+The nested {uid: {interview_id: record}} tree is flattened once per data load
+into an interview-level and a question-level DataFrame; all metrics, buckets
+and category averages are computed from those with vectorized operations.
+"""
+import threading
+from backend.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+
+INTERVIEW_COLUMNS = ["uid", "interview_id", "candidate_email", "total_score", "average_score",
+                     "total_questions", "status", "interview_date", "archived"]
+QUESTION_COLUMNS = ["uid", "interview_id", "question_key", "category", "question", "answer",
+                    "score", "justification"]
+
+# Performance buckets shown on the dashboard, for [<5, 5-7, 7-9, 9+) score ranges
+BUCKET_LABELS = ['Poor (<5)', 'Average (5-6.9)', 'Good (7-8.9)', 'Excellent (9-10)']
+
+
+def build_frames(interviews_data):
+    """Flatten the interviews tree into (interviews_df, questions_df)"""
+    interview_rows = []
+    question_rows = []
+    for uid, user_interviews in (interviews_data or {}).items():
+        for interview_id, interview_data in (user_interviews or {}).items():
+            interview_rows.append((
+                uid, interview_id,
+                interview_data.get('user_email', 'Unknown'),
+                interview_data.get('total_score', 0),
+                interview_data.get('average_score', 0),
+                interview_data.get('total_questions', 0),
+                interview_data.get('status', 'Unknown'),
+                interview_data.get('interview_date', 0),
+                interview_data.get('archived'),
+            ))
+            for q_key, q_data in (interview_data.get('questions') or {}).items():
+                question_rows.append((
+                    uid, interview_id, q_key,
+                    q_data.get('category', 'unknown'),
+                    q_data.get('question', 'N/A'),
+                    q_data.get('answer', 'N/A'),
+                    q_data.get('score', 0),
+                    q_data.get('justification', 'N/A'),
+                ))
+
+    interviews_df = pd.DataFrame.from_records(interview_rows, columns=INTERVIEW_COLUMNS)
+    interviews_df['average_score'] = pd.to_numeric(interviews_df['average_score'], errors='coerce').fillna(0.0)
+    interviews_df['status'] = interviews_df['status'].astype(str)
+    # "" for interviews that aren't archived (missing values would be a truthy NaN)
+    interviews_df['archived'] = interviews_df['archived'].fillna('').astype(str)
+
+    questions_df = pd.DataFrame.from_records(question_rows, columns=QUESTION_COLUMNS)
+    questions_df['score'] = pd.to_numeric(questions_df['score'], errors='coerce').fillna(0)
+    questions_df['category_title'] = questions_df['category'].astype(str).str.replace('_', ' ').str.title()
+    return interviews_df, questions_df
+
+
+_frames_lock = threading.Lock()
+_frames_memo = (None, None)
+
+
+def get_frames(interviews_data):
+    """build_frames, memoized on the identity of the (cached, read-only) data object"""
+    global _frames_memo
+    with _frames_lock:
+        data, frames = _frames_memo
+        if data is interviews_data:
+            return frames
+    frames = build_frames(interviews_data)
+    with _frames_lock:
+        # Keep a reference to the data so its id can't be reused by a new object
+        _frames_memo = (interviews_data, frames)
+    return frames
+
+
+_groups_lock = threading.Lock()
+_groups_memo = (None, None)
+
+
+def get_interview_groups(questions_df):
+    """({(uid, interview_id): questions}, {(uid, interview_id): category averages}) for the
+    per-interview expanders, memoized like get_frames on the frame object"""
+    global _groups_memo
+    with _groups_lock:
+        frame, groups = _groups_memo
+        if frame is questions_df:
+            return groups
+    keys = ['uid', 'interview_id']
+    groups = (dict(tuple(questions_df.groupby(keys, sort=False))),
+              dict(tuple(category_averages(questions_df).groupby(keys, sort=False))))
+    with _groups_lock:
+        _groups_memo = (questions_df, groups)
+    return groups
+
+
+def overview_metrics(interviews_df):
+    """Headline metrics for the analytics overview"""
+    scores = interviews_df['average_score'].to_numpy(dtype=float)
+    total = scores.size
+    return {
+        'total_interviews': total,
+        'average_score': float(scores.mean()) if total else 0.0,
+        'completed': int((interviews_df['status'].str.lower() == 'completed').sum()),
+        'pass_rate': float((scores >= 6).mean() * 100) if total else 0.0,
+    }
+
+
+def score_histogram(interviews_df, bins=10):
+    """Counts of average scores in equal-width bins over 0-10"""
+    counts, edges = np.histogram(interviews_df['average_score'].to_numpy(dtype=float), bins=bins, range=(0, 10))
+    return pd.DataFrame({'Score': (edges[:-1] + edges[1:]) / 2, 'Number of Candidates': counts})
+
+
+def performance_buckets(interviews_df):
+    """Excellent / Good / Average / Poor counts and percentages"""
+    scores = interviews_df['average_score'].to_numpy(dtype=float)
+    counts = np.bincount(np.searchsorted([5, 7, 9], scores, side='right'), minlength=4)
+    total = max(scores.size, 1)
+    # Highest bucket first, like the dashboard table
+    counts = counts[::-1]
+    return pd.DataFrame({
+        'Category': BUCKET_LABELS[::-1],
+        'Count': counts,
+        'Percentage': [f"{c / total * 100:.1f}%" for c in counts],
+    })
+
+
+def category_averages(questions_df):
+    """Average score per (uid, interview_id, category), in first-seen order"""
+    return (questions_df
+            .groupby(['uid', 'interview_id', 'category_title'], sort=False)['score']
+            .mean()
+            .reset_index())
@@ -0,0 +1,140 @@
+"""
+Incremental export of interview data to CSV or Parquet
+
+Pages of candidates are read from the repository and written out one at a
+time (CSV rows / Parquet row groups) into a spooled temporary file, so the
+working set stays at one page no matter how large the dataset is. Streamlit's
+download button holds the finished file in memory, so exports stop after the
+page that takes them past EXPORT_MAX_MB.
+"""
+import io
+import os
+import csv
+import tempfile
+from datetime import datetime
+
+EXPORT_PAGE_SIZE = 200           # candidates per page
+SPOOL_MAX_BYTES = 8 * 1024 * 1024  # spill the export to disk beyond this size
+EXPORT_MAX_MB = int(os.getenv("EXPORT_MAX_MB", "50"))
+
+INTERVIEW_HEADER = ['Candidate Email', 'Total Score', 'Average Score', 'Total Questions', 'Status', 'Interview Date']
+QUESTION_HEADER = ['Candidate Email', 'Interview Date', 'Question', 'Category', 'Question Text', 'Answer',
+                   'Score', 'Feedback']
+
+
+def _format_date(timestamp):
+    if not timestamp:
+        return 'N/A'
+    return datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d %H:%M')
+
+
+def interview_rows(page):
+    """One row per interview"""
+    for user_interviews in page.values():
+        for interview_data in (user_interviews or {}).values():
+            yield [
+                interview_data.get('user_email', 'Unknown'),
+                interview_data.get('total_score', 0),
+                interview_data.get('average_score', 0),
+                interview_data.get('total_questions', 0),
+                interview_data.get('status', 'Unknown'),
+                _format_date(interview_data.get('interview_date')),
+            ]
+
+
+def question_rows(page):
+    """One row per answered question"""
+    for user_interviews in page.values():
+        for interview_data in (user_interviews or {}).values():
+            email = interview_data.get('user_email', 'Unknown')
+            date = _format_date(interview_data.get('interview_date'))
+            for q_key, q_data in (interview_data.get('questions') or {}).items():
+                yield [
+                    email, date, q_key.upper(),
+                    q_data.get('category', 'unknown').replace('_', ' ').title(),
+                    q_data.get('question', 'N/A'),
+                    q_data.get('answer', 'N/A'),
+                    q_data.get('score', 0),
+                    q_data.get('justification', 'N/A'),
+                ]
+
+
+# Parquet column types (pyarrow type names); everything else is stored as string
+NUMERIC_COLUMNS = {
+    'Total Score': 'float64',
+    'Average Score': 'float64',
+    'Total Questions': 'int64',
+    'Score': 'float64',
+}
+
+
+GRANULARITIES = {
+    'interview': (INTERVIEW_HEADER, interview_rows),
+    'question': (QUESTION_HEADER, question_rows),
+}
+
+
+def _write_csv(pages, header, rows_for, out, max_bytes):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    out.write(buffer.getvalue().encode('utf-8'))
+    for page in pages:
+        if out.tell() >= max_bytes:
+            return False
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows_for(page))
+        out.write(buffer.getvalue().encode('utf-8'))
+    return True
+
+
+def _parquet_schema(header):
+    import pyarrow as pa
+    return pa.schema([(name, getattr(pa, NUMERIC_COLUMNS.get(name, 'string'))()) for name in header])
+
+
+def _write_parquet(pages, header, rows_for, out, max_bytes):
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema(header)
+    with pq.ParquetWriter(out, schema) as writer:
+        for page in pages:
+            if out.tell() >= max_bytes:
+                return False
+            columns = list(zip(*rows_for(page)))
+            if not columns:
+                continue
+            # One row group per page
+            writer.write_batch(_record_batch(schema, columns))
+    return True
+
+
+def _record_batch(schema, columns):
+    import pyarrow as pa
+    arrays = []
+    for field, values in zip(schema, columns):
+        if pa.types.is_string(field.type):
+            values = [None if v is None else str(v) for v in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def export_interviews(pages, granularity='interview', fmt='csv', max_mb=EXPORT_MAX_MB):
+    """Write pages of interviews to a rewound SpooledTemporaryFile.
+
+    `pages` is an iterable of {uid: {interview_id: record}} dicts, e.g.
+    InterviewRepository.iter_pages(). No page is started once the file holds
+    `max_mb` MB. Returns (file, complete); the caller owns (and closes) the
+    file.
+    """
+    header, rows_for = GRANULARITIES[granularity]
+    out = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode='w+b')
+    try:
+        write = _write_parquet if fmt == 'parquet' else _write_csv
+        complete = write(pages, header, rows_for, out, max_mb * 1024 * 1024)
+    except Exception:
+        out.close()
+        raise
+    out.seek(0)
+    return out, complete
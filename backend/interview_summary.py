@@ -6,18 +6,105 @@ Provides summary functionality using the same data structure as HR dashboard
 import streamlit as st
 from datetime import datetime
 from backend.speech_io import SpeechIO
+from backend.repository import get_repositories
+from backend.adaptive_interview import interview_finished, MAX_QUESTIONS
+from backend.deferred_scoring import SCORING_MODE, pending_answers, collect, apply_scores, forget
+from backend.telemetry import span
 import uuid
 
 
-def get_firebase_db():
-    """Get Firebase database from session state"""
-    if 'firebase_db' not in st.session_state:
+def new_interview_data():
+    """Session state for a fresh 10-question interview"""
+    return {
+        'question_count': 0,
+        'interview_id': str(uuid.uuid4()),
+        'current_question': None,
+        'categories_used': {
+            'technical_skills': 0,
+            'communication': 0,
+            'problem_solving': 0,
+            'leadership': 0,
+            'experience': 0
+        },
+        'total_score': 0,
+        'answers': {},
+        'voice_welcome': False
+    }
+
+
+def to_interview_summary(interview_data):
+    """Map a stored interview record to the structure HR sees"""
+    return {
+        'candidate_email': interview_data.get('user_email', 'Unknown'),
+        'total_score': interview_data.get('total_score', 0),
+        'average_score': interview_data.get('average_score', 0),
+        'total_questions': interview_data.get('total_questions', 0),
+        'status': interview_data.get('status', 'Unknown'),
+        'interview_date': interview_data.get('interview_date', 0),
+        'questions': interview_data.get('questions', {})
+    }
+
+
+def build_interview_from_session(interview_data, candidate_email):
+    """Build the summary from answers kept in session state (no database read).
+    
+    Returns None if the session doesn't hold every answered question, e.g.
+    after a reconnect.
+    """
+    answers = interview_data.get('answers', {})
+    question_count = interview_data.get('question_count', 0)
+    if not answers or len(answers) < question_count:
         return None
-    return st.session_state.firebase_db
+    
+    total_score = sum(a['score'] for a in answers.values())
+    total_questions = len(answers)
+    return {
+        'candidate_email': candidate_email,
+        'total_score': total_score,
+        'average_score': round(total_score / total_questions, 1),
+        'total_questions': total_questions,
+        'status': "completed" if interview_finished(interview_data) else "in_progress",
+        'interview_date': max(a.get('timestamp', 0) for a in answers.values()),
+        'questions': {
+            q_key: {k: v for k, v in a.items() if k != 'timestamp'}
+            for q_key, a in answers.items()
+        }
+    }
+
+
+def wait_for_pending_scores(on_scored=None):
+    """Collect scores still outstanding in deferred scoring mode.
+    
+    Returns False (after offering a retry) if some answers couldn't be scored.
+    """
+    interview_data = st.session_state.interview_data
+    pending = pending_answers(interview_data)
+    if not pending:
+        return True
+    
+    with st.spinner(f"⏳ Scoring your answers ({len(pending)} remaining)..."):
+        with span("scoring_wait", pending=len(pending), mode=SCORING_MODE):
+            results = collect(interview_data['interview_id'], pending)
+        apply_scores(interview_data, results, on_scored)
+    
+    remaining = len(pending_answers(interview_data))
+    if remaining:
+        st.warning(f"⚠️ {remaining} answer(s) could not be scored or saved yet.")
+        if st.button("🔄 Retry Scoring", type="primary"):
+            st.rerun()
+        return False
+    return True
 
 
-def show_interview_summary():
-    """Show final interview results - uses same data HR sees"""
+def show_interview_summary(on_scored=None):
+    """Show final interview results - uses same data HR sees.
+    
+    In deferred scoring mode this first waits for the scores still
+    outstanding; on_scored(q_key, record) is called for each of them.
+    """
+    if 'interview_data' in st.session_state and not wait_for_pending_scores(on_scored):
+        return
+    
     st.subheader("🎉 Interview Completed!")
     st.balloons()
     
@@ -28,43 +115,32 @@ def show_interview_summary():
     except:
         pass
     
-    # Get interview data using SAME logic as HR dashboard
+    # Build results from the answers collected this session; only fall back to
+    # fetching this one interview if the session doesn't have them all
     try:
-        db = get_firebase_db()
-        if not db or 'user' not in st.session_state:
+        if 'user' not in st.session_state or 'interview_data' not in st.session_state:
             st.error("❌ Unable to load results.")
             return
         
         candidate_uid = st.session_state.user['localId']
+        current_interview_id = st.session_state.interview_data['interview_id']
         
-        # Get interviews data using same HR logic
-        interviews_data = db.child("interviews").get().val()
+        user_interview = build_interview_from_session(
+            st.session_state.interview_data, st.session_state.user.get('email', 'Unknown')
+        )
         
-        if not interviews_data:
-            st.info("📋 No interview data available yet.")
-            return
-        
-        # Process interview data using EXACT same logic as HR
-        user_interview = None
-        
-        # Find current user's interview data
-        if candidate_uid in interviews_data:
-            user_interviews = interviews_data[candidate_uid]
-            current_interview_id = st.session_state.interview_data['interview_id']
+        if not user_interview:
+            interviews, _ = get_repositories()
+            if not interviews:
+                st.error("❌ Unable to load results.")
+                return
             
-            if current_interview_id in user_interviews:
-                interview_data = user_interviews[current_interview_id]
-                
-                # Use EXACT same data structure as HR sees
-                user_interview = {
-                    'candidate_email': interview_data.get('user_email', 'Unknown'),
-                    'total_score': interview_data.get('total_score', 0),
-                    'average_score': interview_data.get('average_score', 0),
-                    'total_questions': interview_data.get('total_questions', 0),
-                    'status': interview_data.get('status', 'Unknown'),
-                    'interview_date': interview_data.get('interview_date', 0),
-                    'questions': interview_data.get('questions', {})
-                }
+            # Fetch only this interview, not the whole interviews tree
+            interview_data = interviews.get_interview(
+                candidate_uid, current_interview_id, st.session_state.user.get('idToken')
+            )
+            if interview_data:
+                user_interview = to_interview_summary(interview_data)
         
         if not user_interview:
             st.error("❌ No interview data found.")
@@ -92,7 +168,7 @@ def display_performance_summary(user_interview):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Score", f"{user_interview['total_score']}/100")
+        st.metric("Total Score", f"{user_interview['total_score']}/{user_interview['total_questions'] * 10}")
     
     with col2:
         st.metric("Average Score", f"{user_interview['average_score']:.1f}/10")
@@ -219,20 +295,8 @@ def display_action_buttons():
     with col2:
         if st.button("🔄 Take New Interview"):
             # Reset for new interview
-            st.session_state.interview_data = {
-                'question_count': 0,
-                'interview_id': str(uuid.uuid4()),
-                'current_question': None,
-                'categories_used': {
-                    'technical_skills': 0,
-                    'communication': 0,
-                    'problem_solving': 0,
-                    'leadership': 0,
-                    'experience': 0
-                },
-                'total_score': 0,
-                'voice_welcome': False
-            }
+            forget(st.session_state.interview_data.get('interview_id'))
+            st.session_state.interview_data = new_interview_data()
             st.rerun()
 
 
@@ -265,6 +329,7 @@ def show_question_feedback(score, justification, category):
         # Progress update
         if 'interview_data' in st.session_state:
             questions_completed = st.session_state.interview_data['question_count']
-            st.progress(questions_completed / 10, text=f"Progress: {questions_completed}/10 questions completed")
+            st.progress(min(questions_completed / MAX_QUESTIONS, 1.0),
+                        text=f"Progress: {questions_completed}/{MAX_QUESTIONS} questions completed")
         
         st.markdown("---")
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Lazy module loading for heavy dependencies
+
+`np = lazy_import("numpy")` binds a placeholder module; the real import happens
+on first attribute access, so Streamlit workers (and HR-only sessions) don't
+pay for audio/ML libraries they never touch.
+"""
+import importlib
+import sys
+import threading
+import types
+
+_import_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """Module placeholder that imports the real module on first use"""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            with _import_lock:
+                module = self.__dict__['_lazy_module']
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__['_lazy_module'] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name):
+    """Return a LazyModule for `name` (or the module itself if already imported)"""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
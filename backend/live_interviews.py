@@ -0,0 +1,195 @@
+"""
+Live interview data fed by a Firebase streaming (server-sent events) listener
+
+One listener per process keeps an in-memory copy of `interviews/` up to date
+from put/patch deltas, so HR dashboards render from memory and only the
+changes travel over the network. Once the listener stops (stop(), or Firebase
+cancels the stream) the copy is no longer `ready` until a new listener has
+received a fresh snapshot, and dashboards read through the cache meanwhile.
+
+Sessions that want live data subscribe() and renew that subscription on
+every live check. The stream is closed, and the copy dropped, once no
+subscription has been renewed for LIVE_LEASE_SECONDS (the toggle was turned
+off or the tab closed) or when the ID token it was opened with expires.
+"""
+import os
+import json
+import time
+import base64
+import threading
+
+# Seconds a live subscription lasts unless renewed (dashboards renew every few seconds)
+LIVE_LEASE_SECONDS = float(os.getenv("LIVE_LEASE_SECONDS", "30"))
+
+
+def _set_in(node, parts, value):
+    """Return a copy of node with value set at parts (None deletes).
+
+    Only the dicts along the path are copied, so snapshots handed out
+    earlier are never mutated.
+    """
+    if not parts:
+        return value
+    node = dict(node) if isinstance(node, dict) else {}
+    child = _set_in(node.get(parts[0]), parts[1:], value)
+    if child is None or child == {}:
+        node.pop(parts[0], None)
+    else:
+        node[parts[0]] = child
+    return node
+
+
+def _split_path(path):
+    return [part for part in (path or "/").strip("/").split("/") if part]
+
+
+def token_expiry(token):
+    """Unix time a Firebase ID token (a JWT) expires at, or None if it can't be read"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class InterviewAggregate:
+    """In-memory interviews tree built from Firebase stream events"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+        self.version = 0
+        self.ready = False  # True once the initial snapshot arrived
+
+    def apply(self, event, path, data):
+        parts = _split_path(path)
+        with self._lock:
+            if event == "put":
+                self._data = _set_in(self._data, parts, data) or {}
+                if not parts:
+                    self.ready = True
+            elif event == "patch":
+                for key, value in (data or {}).items():
+                    self._data = _set_in(self._data, parts + _split_path(key), value) or {}
+            else:
+                return
+            self.version += 1
+
+    def reset(self):
+        """Drop the copy; it is ready again after the next full snapshot"""
+        with self._lock:
+            self._data = {}
+            if self.ready:
+                self.ready = False
+                self.version += 1
+
+    def snapshot(self):
+        """Current interviews as {uid: {interview_id: record}} (treat as read-only)"""
+        with self._lock:
+            return self._data
+
+
+class LiveInterviewFeed:
+    """Owns the stream listener and the aggregate it feeds"""
+
+    def __init__(self, path="interviews", lease_seconds=LIVE_LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.aggregate = InterviewAggregate()
+        self._stream = None
+        self._expires_at = None   # when the stream's token expires (unix time)
+        self._subscribers = {}    # subscriber -> monotonic time its lease ends
+        self._watchdog = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._stream is not None
+
+    @property
+    def subscribers(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def _handle(self, message):
+        event = message.get("event")
+        if event in ("put", "patch"):
+            self.aggregate.apply(event, message.get("path"), message.get("data"))
+        elif event in ("cancel", "auth_revoked"):
+            # Token expired or access removed - restart on the next ensure_started().
+            # Closing joins the stream thread, so don't do it from inside that thread
+            self.aggregate.reset()
+            threading.Thread(target=self.stop, daemon=True).start()
+
+    def subscribe(self, subscriber, db, token=None):
+        """Keep the stream open for subscriber for another lease, starting it if needed"""
+        with self._lock:
+            self._subscribers[subscriber] = time.monotonic() + self.lease_seconds
+        self.ensure_started(db, token)
+
+    def unsubscribe(self, subscriber):
+        """Release subscriber's lease; the stream closes when it was the last one"""
+        with self._lock:
+            if self._subscribers.pop(subscriber, None) is None or self._subscribers:
+                return
+        self.stop()
+
+    def ensure_started(self, db, token=None):
+        """Start streaming with this db handle and token unless already running.
+
+        An expired token isn't used (Firebase would only cancel the stream).
+        """
+        expires_at = token_expiry(token)
+        if expires_at is not None and expires_at <= time.time():
+            return
+        with self._lock:
+            if self._stream is None:
+                self._stream = db.child(self.path).stream(self._handle, token)
+                self._expires_at = expires_at
+                if self._watchdog is None:
+                    self._watchdog = threading.Thread(target=self._watch, name="live-feed-watchdog", daemon=True)
+                    self._watchdog.start()
+
+    def _watch(self):
+        """Close the stream once no lease is left or its token has expired"""
+        while True:
+            with self._lock:
+                wait = min(self.lease_seconds, 5)
+                if self._expires_at is not None:
+                    wait = min(wait, max(self._expires_at - time.time(), 0) + 0.01)
+            time.sleep(wait)
+            now = time.monotonic()
+            with self._lock:
+                if self._stream is None:
+                    self._watchdog = None
+                    return
+                self._subscribers = {s: until for s, until in self._subscribers.items() if until > now}
+                expired = self._expires_at is not None and self._expires_at <= time.time()
+                idle = not self._subscribers
+            if idle or expired:
+                self.stop()
+
+    def stop(self):
+        with self._lock:
+            stream, self._stream = self._stream, None
+            self._expires_at = None
+        self.aggregate.reset()
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+
+_live_feed = None
+_live_feed_lock = threading.Lock()
+
+
+def get_live_feed():
+    """Process-wide live feed shared by all HR sessions"""
+    global _live_feed
+    with _live_feed_lock:
+        if _live_feed is None:
+            _live_feed = LiveInterviewFeed()
+        return _live_feed
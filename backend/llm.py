@@ -0,0 +1,74 @@
+"""
+Thin layer over the Groq chat-completions API
+
+Question generation and answer scoring go through chat() for a whole
+completion, or stream_chat() to receive the text token by token as it is
+generated.
+
+Pass route="<task>/<tier>" (see backend.model_router) to time the call as
+llm_call[<route>] and charge its tokens and estimated cost to that route.
+"""
+import os
+import time
+from backend.telemetry import span, count
+
+# USD per million (prompt, completion) tokens; LLM_PRICES="model=in/out,..." overrides
+MODEL_PRICES = {
+    "llama-3.1-8b-instant": (0.05, 0.08),
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+}
+for _entry in filter(None, os.getenv("LLM_PRICES", "").split(",")):
+    _model, _prices = _entry.split("=", 1)
+    MODEL_PRICES[_model.strip()] = tuple(float(p) for p in _prices.split("/", 1))
+
+
+def _messages(prompt, system=None):
+    messages = [{"role": "system", "content": system}] if system else []
+    return messages + [{"role": "user", "content": prompt}]
+
+
+def _span_name(route):
+    return f"llm_call[{route}]" if route else "llm_call"
+
+
+def _record_usage(model, route, usage):
+    """Token and estimated cost counters from a response's usage block"""
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    route = route or "unrouted"
+    count("llm_tokens", prompt_tokens, model=model, route=route, kind="prompt")
+    count("llm_tokens", completion_tokens, model=model, route=route, kind="completion")
+    prices = MODEL_PRICES.get(model)
+    if prices:
+        cost = (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1_000_000
+        count("llm_cost_usd", cost, model=model, route=route)
+
+
+def chat(client, prompt, model, route=None, system=None, **params):
+    """Return the full completion text for a prompt (and optional system message)"""
+    with span(_span_name(route), model=model):
+        response = client.chat.completions.create(model=model, messages=_messages(prompt, system), **params)
+    _record_usage(model, route, getattr(response, "usage", None))
+    return response.choices[0].message.content
+
+
+def stream_chat(client, prompt, model, route=None, system=None, **params):
+    """Yield the completion text piece by piece as tokens arrive"""
+    with span(_span_name(route), model=model, stream=True) as llm_span:
+        started = time.perf_counter()
+        first = True
+        for chunk in client.chat.completions.create(model=model, messages=_messages(prompt, system), stream=True, **params):
+            # Groq reports usage on the last chunk, under x_groq
+            usage = getattr(getattr(chunk, "x_groq", None), "usage", None)
+            if usage is not None:
+                _record_usage(model, route, usage)
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                if first:
+                    llm_span.set(first_token_ms=round((time.perf_counter() - started) * 1000, 1))
+                    first = False
+                yield delta
@@ -0,0 +1,90 @@
+"""
+Tiered model routing for question generation and scoring
+
+Cheap calls go to a small, low-latency model; the large model is used only
+where it matters:
+
+- Questions are phrased by the small model (QUESTION_TIER=large to change).
+- Short or empty answers, and answers that share no content words with the
+  question (obviously off-topic), are scored by the small model.
+- Long technical answers go straight to the large model.
+- Everything else is scored by the small model first and escalated to the
+  large model when the score is borderline (ROUTING_BORDERLINE, e.g. "5-7").
+
+MODEL_ROUTING=large or MODEL_ROUTING=small pins every call to one model.
+Each decision is counted as llm_routes{task, tier, reason}; the calls are
+timed as llm_call[<task>/<tier>] and their tokens and estimated cost are
+counted per route (see backend.llm).
+"""
+import os
+import re
+
+from backend.telemetry import count
+
+SMALL_MODEL = os.getenv("LLM_SMALL_MODEL", "llama-3.1-8b-instant")
+LARGE_MODEL = os.getenv("LLM_LARGE_MODEL", "llama-3.3-70b-versatile")
+MODEL_ROUTING = os.getenv("MODEL_ROUTING", "tiered").lower()  # tiered / large / small
+
+TECHNICAL_CATEGORIES = {"technical_skills", "problem_solving", "technical", "analytical"}
+STOPWORDS = {
+    "about", "after", "also", "been", "before", "could", "describe", "does", "from", "have", "into", "just",
+    "like", "more", "most", "tell", "that", "their", "them", "then", "there", "these", "they", "this", "time",
+    "what", "when", "where", "which", "while", "with", "would", "your", "you", "explain", "give", "example",
+}
+
+
+def _content_words(text):
+    return {word for word in re.findall(r"[a-z][a-z+#.]{3,}", (text or "").lower()) if word not in STOPWORDS}
+
+
+def _parse_band(text):
+    low, high = (float(part) for part in text.split("-", 1))
+    return low, high
+
+
+class RoutingPolicy:
+    def __init__(self, mode=MODEL_ROUTING, small_model=SMALL_MODEL, large_model=LARGE_MODEL,
+                 question_tier=os.getenv("QUESTION_TIER", "small"),
+                 short_answer_words=int(os.getenv("ROUTING_SHORT_ANSWER_WORDS", "12")),
+                 long_answer_words=int(os.getenv("ROUTING_LONG_ANSWER_WORDS", "120")),
+                 borderline=_parse_band(os.getenv("ROUTING_BORDERLINE", "5-7"))):
+        self.mode = mode
+        self.models = {"small": small_model, "large": large_model}
+        self.question_tier = question_tier
+        self.short_answer_words = short_answer_words
+        self.long_answer_words = long_answer_words
+        self.borderline = borderline
+
+    def _pick(self, task, tier, reason):
+        if self.mode in self.models:
+            tier, reason = self.mode, "pinned"
+        count("llm_routes", task=task, tier=tier, reason=reason)
+        return tier, self.models[tier]
+
+    def question_model(self, category=None):
+        """(tier, model) for phrasing a question"""
+        return self._pick("question", self.question_tier, category or "general")
+
+    def scoring_model(self, answer, question, category=None):
+        """(tier, model) for the first scoring call"""
+        words = len((answer or "").split())
+        if words < self.short_answer_words:
+            return self._pick("scoring", "small", "short_answer")
+        if not _content_words(answer) & _content_words(question):
+            return self._pick("scoring", "small", "off_topic")
+        if words >= self.long_answer_words and category in TECHNICAL_CATEGORIES:
+            return self._pick("scoring", "large", "long_technical")
+        return self._pick("scoring", "small", "default")
+
+    def escalation_model(self, tier, score):
+        """The large model if a small-model score needs a second opinion, else None"""
+        if self.mode != "tiered" or tier != "small":
+            return None
+        low, high = self.borderline
+        if score is None or low <= score <= high:
+            count("llm_routes", task="scoring", tier="large", reason="unparsed" if score is None else "borderline")
+            return self.models["large"]
+        return None
+
+
+policy = RoutingPolicy()
@@ -0,0 +1,159 @@
+"""
+Token-budgeted prompts for question generation
+
+The instructions that never change go in a system message built once per
+candidate count (cached, so every call starts with the same prefix); the
+per-call part holds the category and as much resume context as fits in
+PROMPT_TOKEN_BUDGET:
+
+- skills are deduplicated and ranked, first by the groups that suit the
+  question category, then by how often the projects mention them;
+- projects are deduplicated (near-identical lines count once), ranked by
+  the skills they mention and cut to PROJECT_MAX_CHARS.
+
+Token counts are estimated (about 4 characters per token, no tokenizer
+needed) and reported as the prompt_tokens counter; actual usage is counted
+per route by backend.llm.
+"""
+import os
+import re
+from functools import lru_cache
+
+from backend.question_similarity import question_terms, jaccard
+from backend.telemetry import count
+
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "350"))
+PROJECT_MAX_CHARS = int(os.getenv("PROJECT_MAX_CHARS", "90"))
+
+CATEGORY_PROMPTS = {
+    'technical_skills': "Focus on technical knowledge, programming languages, frameworks, or tools.",
+    'communication': "Focus on teamwork, explanation abilities, or presentation skills.",
+    'problem_solving': "Focus on analytical thinking, debugging, or approach to challenges.",
+    'leadership': "Focus on leadership experience, decision making, or guiding others.",
+    'experience': "Focus on project experience, internships, or practical applications."
+}
+
+DIFFICULTY_PROMPTS = {
+    'easy': "Keep this one introductory and encouraging.",
+    'standard': "",
+    'challenging': "Make this one a deeper follow-up that asks for reasoning or trade-offs.",
+}
+
+# Skill groups (see ResumeParser) most useful for each question category
+CATEGORY_SKILL_GROUPS = {
+    'technical_skills': ('programming_languages', 'web_development', 'database', 'machine_learning'),
+    'communication': ('soft_skills',),
+    'problem_solving': ('programming_languages', 'machine_learning', 'soft_skills'),
+    'leadership': ('soft_skills',),
+    'experience': ('tools_and_platforms', 'web_development', 'machine_learning'),
+}
+
+
+def estimate_tokens(text):
+    return (len(text) + 3) // 4
+
+
+@lru_cache(maxsize=None)
+def system_prompt(candidates=1):
+    """The static instructions; identical text for every call with the same candidate count"""
+    return (
+        "You are an HR manager conducting a technical interview. "
+        "Consider the candidate is a fresh graduate with no prior experience. "
+        "Generate a simple interview question for the category given, based on the candidate's resume. "
+        "Do not ask to implement any code or algorithms. "
+        "Keep it simple and appropriate for a fresh graduate. "
+        + ("Just ask the question, no other information needed."
+           if candidates == 1 else
+           f"Write {candidates} different questions, one per line, with no numbering or other text.")
+    )
+
+
+def _mentions(term, text):
+    return len(re.findall(rf"(?<!\w){re.escape(term)}(?!\w)", text))
+
+
+def rank_skills(skills, projects=(), category=None):
+    """Unique skills, most relevant to the category and the projects first"""
+    groups = skills.items() if isinstance(skills, dict) else [(None, skills or [])]
+    preferred = CATEGORY_SKILL_GROUPS.get(category, ())
+    project_text = " ".join(projects).lower()
+    ranked = {}
+    for group, names in groups:
+        for name in names:
+            key = name.strip().lower()
+            if not key:
+                continue
+            rank = (group in preferred, _mentions(key, project_text))
+            if key not in ranked:
+                ranked[key] = (rank, len(ranked), name.strip())
+            elif rank > ranked[key][0]:
+                ranked[key] = (rank,) + ranked[key][1:]
+    return [name for _, _, name in sorted(ranked.values(), key=lambda r: (-r[0][0], -r[0][1], r[1]))]
+
+
+def shorten(line, limit=PROJECT_MAX_CHARS):
+    """Cut a line at a word boundary to at most `limit` characters"""
+    line = " ".join(line.split())
+    if len(line) <= limit:
+        return line
+    return line[:limit - 1].rsplit(" ", 1)[0].rstrip(",;:-") + "…"
+
+
+def rank_projects(projects, skills=()):
+    """Shortened, deduplicated project lines; those mentioning the most skills first"""
+    kept = []
+    for project in projects or []:
+        terms = question_terms(project)
+        if any(jaccard(terms, other) >= 0.8 for _, other in kept):
+            continue
+        kept.append((project, terms))
+    skill_names = [s.lower() for s in skills]
+    mentions = lambda p: sum(1 for s in skill_names if _mentions(s, p.lower()))
+    ordered = sorted(enumerate(kept), key=lambda item: (-mentions(item[1][0]), item[0]))
+    return [shorten(project) for _, (project, _) in ordered]
+
+
+def _fit(items, budget, separator=", "):
+    """The leading items whose joined text fits in `budget` tokens"""
+    chosen = []
+    used = 0
+    for item in items:
+        cost = estimate_tokens(item + separator)
+        if used + cost > budget:
+            break
+        chosen.append(item)
+        used += cost
+    return chosen
+
+
+def build_question_prompt(skills, projects, category=None, candidates=1, budget=PROMPT_TOKEN_BUDGET,
+                          difficulty=None):
+    """(system, user, estimated tokens) for a question-generation call"""
+    system = system_prompt(candidates)
+    header = " ".join(filter(None, [
+        f"Category: {category.replace('_', ' ') if category else 'general'}.",
+        CATEGORY_PROMPTS.get(category, ''),
+        DIFFICULTY_PROMPTS.get(difficulty, ''),
+    ]))
+    footer = "Question:" if candidates == 1 else "Questions:"
+    remaining = budget - estimate_tokens(system) - estimate_tokens(header) - estimate_tokens(footer) - 8
+
+    ranked_skills = rank_skills(skills, projects or [], category)
+    ranked_projects = rank_projects(projects, ranked_skills)
+    # Projects carry more context per token for experience questions
+    project_share = 0.6 if category == 'experience' else 0.4
+    chosen_projects = _fit(ranked_projects, int(remaining * project_share), "\n- ")
+    chosen_skills = _fit(ranked_skills, remaining - sum(estimate_tokens(p + "\n- ") for p in chosen_projects))
+
+    lines = [header, f"Skills: {', '.join(chosen_skills) or 'not listed'}"]
+    if chosen_projects:
+        lines.append("Projects:\n- " + "\n- ".join(chosen_projects))
+    lines.append(footer)
+    user = "\n".join(lines)
+
+    tokens = estimate_tokens(system) + estimate_tokens(user)
+    count("prompt_tokens", tokens, task="question")
+    count("prompts", task="question")
+    if len(chosen_skills) < len(ranked_skills) or len(chosen_projects) < len(ranked_projects):
+        count("prompt_trimmed", task="question")
+    return system, user, tokens
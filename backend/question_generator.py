@@ -2,94 +2,104 @@ import random
 import os
 import re
 from backend.resume_parser import ResumeParser
-import groq
+from backend.lazy_imports import lazy_import
+from backend.telemetry import count
+from backend.llm import chat, stream_chat
+from backend.model_router import policy
+from backend.question_similarity import QuestionIndex, subject_terms
+from backend.prompt_builder import build_question_prompt
 from dotenv import load_dotenv
 
+groq = lazy_import("groq")
+
 load_dotenv()
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+# Candidate questions requested per call; the first one that isn't a near-duplicate is used
+QUESTION_CANDIDATES = int(os.getenv("QUESTION_CANDIDATES", "3"))
+# A reply line without a "?" must be at least this long to count as a question ("Tell me about X.")
+MIN_QUESTION_WORDS = 5
+
+# "1.", "2)", "-", "*", "•", "Question 1:", "Q2." at the start of a line
+_LIST_MARKER = re.compile(r'^\s*(?:(?:question|q)\s*\d+\s*[:.)-]|\d+[.)]|[-*\u2022])\s*', re.IGNORECASE)
+_PREAMBLE = re.compile(r'^(?:here (?:are|is)|sure\b|certainly\b|of course\b|okay\b)', re.IGNORECASE)
 
 
 class QuestionGenerator:
-    def __init__(self, groq_api_key=GROQ_API_KEY, model="llama-3.3-70b-versatile"):
+    def __init__(self, groq_api_key=GROQ_API_KEY, model=None):
         self.parser = ResumeParser()
         # Fix: Remove the incorrect assignment
         self.groq_api_key = groq_api_key
-        self.model = model
+        self.model = model  # None: the routing policy picks per call
         if groq_api_key:
             self.client = groq.Groq(api_key=groq_api_key)
         else:
             self.client = None
 
-    def _normalize_question(self, question):
-        """Normalize question for better duplicate detection."""
-        # Remove extra whitespace, convert to lowercase, remove punctuation
-        normalized = re.sub(r'[^\w\s]', '', question.lower().strip())
-        return ' '.join(normalized.split())
+    def _route(self, category):
+        """(model, route label) for a question call"""
+        if self.model:
+            return self.model, None
+        tier, model = policy.question_model(category)
+        return model, f"question/{tier}"
+
+    def _build_prompt(self, skills, projects, category=None, candidates=1, difficulty=None):
+        """(system, user) messages within the prompt token budget"""
+        system, user, _ = build_question_prompt(skills, projects, category, candidates, difficulty=difficulty)
+        return system, user
+
+    @staticmethod
+    def _split_candidates(content):
+        """Questions from a one-per-line reply, without list markers or quotes.
+        Headers and chatter around the list ("Here are three questions:") are skipped."""
+        questions = []
+        for line in content.splitlines():
+            line = _LIST_MARKER.sub('', line).strip().strip('*"').strip()
+            if not line or line.endswith(':') or _PREAMBLE.match(line):
+                continue
+            if '?' in line or len(line.split()) >= MIN_QUESTION_WORDS:
+                questions.append(line)
+        return questions
 
-    def generate_ai_question(self, skills, projects, asked_questions=None, category=None):
+    def generate_ai_question(self, skills, projects, asked_questions=None, category=None, difficulty=None):
         if not self.client:
             raise ValueError("AI service unavailable. Please try again later.")
         if asked_questions is None:
             asked_questions = set()
         
-        # Normalize existing questions for comparison
-        normalized_asked = {self._normalize_question(q) for q in asked_questions}
+        # One call for several candidates instead of a call per retry
+        # (Groq only supports n=1, so they come back one per line)
+        system, prompt = self._build_prompt(skills, projects, category, QUESTION_CANDIDATES, difficulty)
+        model, route = self._route(category)
+        content = chat(
+            self.client, prompt, model, route=route, system=system,
+            max_tokens=80 * QUESTION_CANDIDATES,
+            temperature=0.9,  # Increased temperature for more variety
+        )
         
-        max_attempts = 5  # Limit attempts to avoid infinite loop
-        
-        for attempt in range(max_attempts):
-            # Flatten skills dict for prompt
-            if isinstance(skills, dict):
-                flat_skills = []
-                for v in skills.values():
-                    flat_skills.extend(v)
-            else:
-                flat_skills = skills
-            
-            # Create category-specific prompt
-            if category:
-                category_prompts = {
-                    'technical_skills': "Focus on technical knowledge, programming languages, frameworks, or tools.",
-                    'communication': "Focus on teamwork, explanation abilities, or presentation skills.",
-                    'problem_solving': "Focus on analytical thinking, debugging, or approach to challenges.",
-                    'leadership': "Focus on leadership experience, decision making, or guiding others.",
-                    'experience': "Focus on project experience, internships, or practical applications."
-                }
-                category_instruction = category_prompts.get(category, "")
-            else:
-                category_instruction = ""
-            
-            prompt = (
-                "You are an HR manager conducting a technical interview. "
-                "Consider the candidate is a fresh graduate with no prior experience. "
-                f"Generate a simple interview question for the {category.replace('_', ' ') if category else 'general'} category. "
-                f"{category_instruction} "
-                "Do not ask to implement any code or algorithms. "
-                "Keep it simple and appropriate for a fresh graduate. "
-                "Just ask the question, no other information needed. "
-                f"Skills: {flat_skills}\nProjects: {projects}\n"
-                "Question:"
-            )
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=80,
-                temperature=0.9,  # Increased temperature for more variety
-                n=1,
-            )
-            
-            question = response.choices[0].message.content.strip()
-            normalized_question = self._normalize_question(question)
-            
+        asked_index = QuestionIndex(asked_questions, key_terms=subject_terms(skills, projects))
+        for question in self._split_candidates(content):
             # Check if this is truly a new question
-            if normalized_question not in normalized_asked:
+            if not asked_index.is_duplicate(question):
                 asked_questions.add(question)
                 return question, asked_questions
+            count("question_duplicates", source="ai")
         
         # If AI fails to generate unique question, fall back to template
+        count("question_fallbacks")
         return self.generate_random_template_question(skills, projects, asked_questions)
 
+    def stream_ai_question(self, skills, projects, category=None, difficulty=None):
+        """Yield the question text token by token as the model generates it"""
+        if not self.client:
+            raise ValueError("AI service unavailable. Please try again later.")
+        model, route = self._route(category)
+        system, prompt = self._build_prompt(skills, projects, category, difficulty=difficulty)
+        return stream_chat(
+            self.client, prompt, model, route=route, system=system,
+            max_tokens=80,
+            temperature=0.9,
+        )
+
     def generate_random_template_question(self, skills, projects, asked_questions=None):
         """
         Fallback: Generate a random question from templates if AI is not available.
@@ -118,8 +128,8 @@ class QuestionGenerator:
         if asked_questions is None:
             asked_questions = set()
         
-        # Normalize existing questions for comparison
-        normalized_asked = {self._normalize_question(q) for q in asked_questions}
+        # Templates that paraphrase an asked question count as asked
+        asked_index = QuestionIndex(asked_questions, key_terms=subject_terms(skills, projects))
         
         options = []
         
@@ -130,13 +140,13 @@ class QuestionGenerator:
                     for skill in skill_list:
                         for template in SKILL_QUESTIONS:
                             q = template.format(skill=skill)
-                            if self._normalize_question(q) not in normalized_asked:
+                            if not asked_index.is_duplicate(q):
                                 options.append(q)
             else:
                 for skill in skills:
                     for template in SKILL_QUESTIONS:
                         q = template.format(skill=skill)
-                        if self._normalize_question(q) not in normalized_asked:
+                        if not asked_index.is_duplicate(q):
                             options.append(q)
         
         # Generate project-based questions
@@ -144,7 +154,7 @@ class QuestionGenerator:
             for project in projects:
                 for template in PROJECT_QUESTIONS:
                     q = template.format(project=project)
-                    if self._normalize_question(q) not in normalized_asked:
+                    if not asked_index.is_duplicate(q):
                         options.append(q)
         
         if not options:
@@ -161,7 +171,7 @@ class QuestionGenerator:
             ]
             
             for q in generic_questions:
-                if self._normalize_question(q) not in normalized_asked:
+                if not asked_index.is_duplicate(q):
                     options.append(q)
         
         if not options:
@@ -0,0 +1,141 @@
+"""
+Near-duplicate detection for interview questions
+
+Questions are reduced to their content words ("Tell me about your Python
+experience" and "Describe your experience with Python" both become
+{experienc, python}), MinHashed, and bucketed with LSH so a lookup only
+compares against the few questions sharing a band. Candidates are then
+confirmed with the Jaccard similarity of the word sets, in which the
+candidate's skills and projects (key_terms) weigh KEY_TERM_WEIGHT times as
+much as other words: "What challenges have you faced using Python?" and the
+same question about Java are about different things.
+
+    index = QuestionIndex(asked_questions, key_terms=subject_terms(skills, projects))
+    if index.find_similar(question) is None:
+        index.add(question)
+
+QUESTION_SIMILARITY (default 0.6) is the similarity threshold above which
+two questions count as the same.
+"""
+import os
+import re
+import zlib
+import random
+
+QUESTION_SIMILARITY = float(os.getenv("QUESTION_SIMILARITY", "0.6"))
+
+KEY_TERM_WEIGHT = 3
+
+NUM_PERM = 48
+BANDS = 16            # 3 rows per band: pairs at the 0.6 threshold collide in ~98% of cases
+_PRIME = (1 << 61) - 1
+
+# Words that frame a question rather than say what it is about
+QUESTION_STOPWORDS = {
+    "a", "about", "an", "and", "any", "are", "as", "at", "be", "can", "could", "describe", "did", "do",
+    "does", "explain", "for", "give", "had", "has", "have", "how", "i", "if", "in", "is", "it", "its",
+    "me", "of", "on", "one", "or", "share", "so", "tell", "that", "the", "this", "to", "us", "walk",
+    "was", "we", "were", "what", "when", "where", "which", "who", "why", "with", "would", "you", "your",
+    "yours", "example", "some", "time", "through", "kind", "please", "briefly", "use", "used", "using",
+}
+
+_rng = random.Random(1729)
+_HASH_PARAMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def _stem(word):
+    """Crude suffix stripping that gives every form of a word the same term (challenge, challenges,
+    challenged and challenging are all "challeng"; applies and applied are "apply")"""
+    if word.endswith(("ies", "ied")) and len(word) > 4:
+        return word[:-3] + "y"
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix) and not word.endswith(("ss", "is", "us")) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            break
+    if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "lsz":
+        word = word[:-1]  # planned -> plan
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]  # face / faced / facing -> fac
+    return word
+
+
+def question_terms(question):
+    """The set of content words of a question, lightly stemmed"""
+    words = re.findall(r"[a-z0-9][a-z0-9+#]*", (question or "").lower())
+    terms = {_stem(w) for w in words if w not in QUESTION_STOPWORDS}
+    return frozenset(terms or words)
+
+
+def minhash(terms):
+    hashes = [zlib.crc32(term.encode("utf-8")) for term in terms]
+    if not hashes:
+        return (0,) * NUM_PERM
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _HASH_PARAMS)
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def weighted_jaccard(a, b, key_terms=frozenset()):
+    """Jaccard similarity with key_terms counting KEY_TERM_WEIGHT times"""
+    if not a and not b:
+        return 1.0
+    weight = lambda terms: sum(KEY_TERM_WEIGHT if term in key_terms else 1 for term in terms)
+    return weight(a & b) / weight(a | b)
+
+
+def subject_terms(skills=(), projects=()):
+    """The question terms of a candidate's skills (a list or {group: [skills]}) and projects"""
+    if isinstance(skills, dict):
+        skills = [skill for group in skills.values() for skill in group]
+    return frozenset(term for text in [*(skills or ()), *(projects or ())] for term in question_terms(text))
+
+
+class QuestionIndex:
+    """MinHash/LSH index of questions for sub-millisecond near-duplicate lookups"""
+
+    def __init__(self, questions=(), threshold=QUESTION_SIMILARITY, key_terms=frozenset()):
+        self.threshold = threshold
+        self.key_terms = frozenset(key_terms)
+        self._rows = NUM_PERM // BANDS
+        self._buckets = {}   # (band, band hash values) -> [question ids]
+        self._questions = []  # id -> (question, terms)
+        for question in questions:
+            self.add(question)
+
+    def __len__(self):
+        return len(self._questions)
+
+    def _bands(self, signature):
+        rows = self._rows
+        for band in range(BANDS):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def add(self, question):
+        terms = question_terms(question)
+        question_id = len(self._questions)
+        self._questions.append((question, terms))
+        for key in self._bands(minhash(terms)):
+            self._buckets.setdefault(key, []).append(question_id)
+
+    def find_similar(self, question):
+        """The indexed question most similar to `question` above the threshold, or None"""
+        terms = question_terms(question)
+        seen = set()
+        best, best_score = None, self.threshold
+        for key in self._bands(minhash(terms)):
+            for question_id in self._buckets.get(key, ()):
+                if question_id in seen:
+                    continue
+                seen.add(question_id)
+                other, other_terms = self._questions[question_id]
+                score = weighted_jaccard(terms, other_terms, self.key_terms)
+                if score >= best_score:
+                    best, best_score = other, score
+        return best
+
+    def is_duplicate(self, question):
+        return self.find_similar(question) is not None
@@ -0,0 +1,452 @@
+"""
+Data access layer for interviews and users
+
+The app talks to InterviewRepository / UserRepository instead of raw
+`db.child(...)` chains. Two backends are available:
+
+- Firebase Realtime Database (default)
+- Local SQLite file, for offline runs and load tests (DATA_BACKEND=sqlite)
+
+Records use the same shape in both backends: an interview is a dict with
+user_email, total_score, total_questions, average_score, interview_date,
+status and a `questions` dict keyed "q1", "q2", ... Interviews moved to
+cold storage by the retention job keep only the summary fields plus
+`archived` (the archive partition, e.g. "2025-01").
+"""
+import os
+import json
+import uuid
+import sqlite3
+import hashlib
+import secrets
+import threading
+from abc import ABC, abstractmethod
+
+# "firebase" (default) or "sqlite"
+DATA_BACKEND = os.getenv("DATA_BACKEND", "firebase").lower()
+SQLITE_PATH = os.getenv("SQLITE_PATH", os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "interviews.db"))
+
+SUMMARY_FIELDS = ("user_email", "total_score", "total_questions", "average_score", "interview_date", "status",
+                  "archived")
+QUESTION_FIELDS = ("category", "question", "answer", "score", "justification")
+
+
+class InterviewRepository(ABC):
+    """Interface for interview storage"""
+
+    @abstractmethod
+    def get_interview(self, uid, interview_id, token=None):
+        """Return one interview record (with questions) or None"""
+
+    @abstractmethod
+    def list_interviews(self, token=None):
+        """Return all interviews as {uid: {interview_id: record}}"""
+
+    @abstractmethod
+    def iter_pages(self, page_size=100, token=None, start_after=None):
+        """Yield {uid: {interview_id: record}} pages of up to page_size candidates,
+        ordered by uid and starting after the uid start_after"""
+
+    @abstractmethod
+    def count_candidates(self, token=None):
+        """Number of candidates with at least one interview"""
+
+    @abstractmethod
+    def list_candidates(self, token=None):
+        """Sorted uids of candidates with at least one interview (keys only, no records)"""
+
+    @abstractmethod
+    def save_question(self, uid, interview_id, question_key, question_data, token=None):
+        """Store one answered question under an interview"""
+
+    @abstractmethod
+    def update_summary(self, uid, interview_id, summary, token=None):
+        """Create or update the interview's summary fields"""
+
+    @abstractmethod
+    def replace_interview(self, uid, interview_id, record, token=None):
+        """Overwrite one interview record, questions included"""
+
+    @abstractmethod
+    def delete_interviews(self, uid, interview_ids, token=None):
+        """Delete some of one candidate's interviews"""
+
+    @abstractmethod
+    def delete_candidate(self, uid, token=None):
+        """Delete all of one candidate's interviews"""
+
+    @abstractmethod
+    def delete_all(self, token=None):
+        """Delete every interview"""
+
+
+class UserRepository(ABC):
+    """Interface for user profile storage"""
+
+    @abstractmethod
+    def get_user(self, uid, token=None):
+        """Return the user's profile dict or None"""
+
+    @abstractmethod
+    def set_user(self, uid, user_data, token=None):
+        """Create or overwrite the user's profile"""
+
+    @abstractmethod
+    def update_user(self, uid, fields, token=None):
+        """Update some fields of the user's profile"""
+
+
+# ---------------------------------------------------------------------------
+# Firebase backend
+# ---------------------------------------------------------------------------
+
+class FirebaseInterviewRepository(InterviewRepository):
+    def __init__(self, db):
+        self.db = db
+
+    def _interviews(self):
+        return self.db.child("interviews")
+
+    def get_interview(self, uid, interview_id, token=None):
+        return self._interviews().child(uid).child(interview_id).get(token).val()
+
+    def list_interviews(self, token=None):
+        return self._interviews().get(token).val() or {}
+
+    def iter_pages(self, page_size=100, token=None, start_after=None):
+        # Key-ordered range queries: one request per page of candidates
+        start = start_after
+        while True:
+            query = self._interviews().order_by_key()
+            if start is None:
+                page = query.limit_to_first(page_size).get(token).val() or {}
+            else:
+                # start_at is inclusive, so fetch one extra and drop the last key of the previous page
+                page = query.start_at(start).limit_to_first(page_size + 1).get(token).val() or {}
+                page.pop(start, None)
+            if not page:
+                return
+            yield dict(page)
+            if len(page) < page_size:
+                return
+            start = next(reversed(page))
+
+    def count_candidates(self, token=None):
+        # Shallow read returns only the candidate keys, not their data
+        return len(self._interviews().shallow().get(token).val() or {})
+
+    def list_candidates(self, token=None):
+        # Shallow reads can't be combined with ordering/limits, so sort the keys here
+        return sorted(self._interviews().shallow().get(token).val() or {})
+
+    def save_question(self, uid, interview_id, question_key, question_data, token=None):
+        self._interviews().child(uid).child(interview_id).child("questions").child(question_key).set(question_data, token)
+
+    def update_summary(self, uid, interview_id, summary, token=None):
+        self._interviews().child(uid).child(interview_id).update(summary, token)
+
+    def replace_interview(self, uid, interview_id, record, token=None):
+        self._interviews().child(uid).child(interview_id).set(record, token)
+
+    def delete_interviews(self, uid, interview_ids, token=None):
+        # Multi-path update with nulls deletes them all in one request
+        self._interviews().child(uid).update({interview_id: None for interview_id in interview_ids}, token)
+
+    def delete_candidate(self, uid, token=None):
+        self._interviews().child(uid).remove(token)
+
+    def delete_all(self, token=None):
+        self._interviews().remove(token)
+
+
+class FirebaseUserRepository(UserRepository):
+    def __init__(self, db):
+        self.db = db
+
+    def get_user(self, uid, token=None):
+        return self.db.child("users").child(uid).get(token).val()
+
+    def set_user(self, uid, user_data, token=None):
+        self.db.child("users").child(uid).set(user_data, token)
+
+    def update_user(self, uid, fields, token=None):
+        self.db.child("users").child(uid).update(fields, token)
+
+
+# ---------------------------------------------------------------------------
+# SQLite backend
+# ---------------------------------------------------------------------------
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    uid TEXT PRIMARY KEY,
+    email TEXT UNIQUE,
+    password_hash TEXT,
+    data TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS interviews (
+    uid TEXT NOT NULL,
+    interview_id TEXT NOT NULL,
+    user_email TEXT,
+    total_score REAL DEFAULT 0,
+    total_questions INTEGER DEFAULT 0,
+    average_score REAL DEFAULT 0,
+    interview_date INTEGER DEFAULT 0,
+    status TEXT,
+    archived TEXT,
+    PRIMARY KEY (uid, interview_id)
+);
+CREATE INDEX IF NOT EXISTS idx_interviews_date ON interviews (interview_date);
+CREATE INDEX IF NOT EXISTS idx_interviews_score ON interviews (average_score);
+CREATE INDEX IF NOT EXISTS idx_interviews_status ON interviews (status);
+CREATE TABLE IF NOT EXISTS questions (
+    uid TEXT NOT NULL,
+    interview_id TEXT NOT NULL,
+    question_key TEXT NOT NULL,
+    category TEXT,
+    question TEXT,
+    answer TEXT,
+    score REAL,
+    justification TEXT,
+    PRIMARY KEY (uid, interview_id, question_key)
+);
+"""
+
+
+class SQLiteStore:
+    """One shared SQLite connection (WAL mode) guarded by a lock"""
+
+    def __init__(self, path=SQLITE_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(SCHEMA)
+            # Databases created before the retention job existed
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(interviews)")}
+            if "archived" not in columns:
+                self.conn.execute("ALTER TABLE interviews ADD COLUMN archived TEXT")
+
+    def query(self, sql, params=()):
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def execute(self, sql, params=()):
+        with self.lock, self.conn:
+            self.conn.execute(sql, params)
+
+
+def _clean(value):
+    """Store whole-number scores as ints, like Firebase returns them"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+class SQLiteInterviewRepository(InterviewRepository):
+    def __init__(self, store):
+        self.store = store
+
+    def _questions(self, where="", params=()):
+        rows = self.store.query(f"SELECT * FROM questions {where}", params)
+        grouped = {}
+        for row in rows:
+            grouped.setdefault((row['uid'], row['interview_id']), {})[row['question_key']] = {
+                field: _clean(row[field]) for field in QUESTION_FIELDS
+            }
+        return grouped
+
+    @staticmethod
+    def _record(row, questions):
+        record = {field: _clean(row[field]) for field in SUMMARY_FIELDS if row[field] is not None}
+        if questions:
+            record['questions'] = questions
+        return record
+
+    def get_interview(self, uid, interview_id, token=None):
+        rows = self.store.query("SELECT * FROM interviews WHERE uid = ? AND interview_id = ?", (uid, interview_id))
+        questions = self._questions("WHERE uid = ? AND interview_id = ?", (uid, interview_id))
+        if not rows:
+            # Questions can be saved before the first summary update
+            q = questions.get((uid, interview_id))
+            return {'questions': q} if q else None
+        return self._record(rows[0], questions.get((uid, interview_id)))
+
+    def list_interviews(self, token=None):
+        questions = self._questions()
+        interviews = {}
+        for row in self.store.query("SELECT * FROM interviews ORDER BY interview_date"):
+            key = (row['uid'], row['interview_id'])
+            interviews.setdefault(row['uid'], {})[row['interview_id']] = self._record(row, questions.get(key))
+        return interviews
+
+    def iter_pages(self, page_size=100, token=None, start_after=None):
+        last_uid = start_after or ""
+        while True:
+            uids = [row['uid'] for row in self.store.query(
+                "SELECT DISTINCT uid FROM interviews WHERE uid > ? ORDER BY uid LIMIT ?", (last_uid, page_size))]
+            if not uids:
+                return
+            marks = ", ".join("?" * len(uids))
+            questions = self._questions(f"WHERE uid IN ({marks})", uids)
+            page = {}
+            for row in self.store.query(f"SELECT * FROM interviews WHERE uid IN ({marks}) ORDER BY uid, interview_date", uids):
+                key = (row['uid'], row['interview_id'])
+                page.setdefault(row['uid'], {})[row['interview_id']] = self._record(row, questions.get(key))
+            yield page
+            last_uid = uids[-1]
+
+    def count_candidates(self, token=None):
+        return self.store.query("SELECT COUNT(DISTINCT uid) AS n FROM interviews")[0]['n']
+
+    def list_candidates(self, token=None):
+        return [row['uid'] for row in self.store.query("SELECT DISTINCT uid FROM interviews ORDER BY uid")]
+
+    def save_question(self, uid, interview_id, question_key, question_data, token=None):
+        self.store.execute(
+            "INSERT OR REPLACE INTO questions (uid, interview_id, question_key, category, question, answer, score, justification) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (uid, interview_id, question_key, *(question_data.get(field) for field in QUESTION_FIELDS))
+        )
+
+    def update_summary(self, uid, interview_id, summary, token=None):
+        fields = [field for field in SUMMARY_FIELDS if field in summary]
+        columns = ", ".join(["uid", "interview_id"] + fields)
+        placeholders = ", ".join("?" * (len(fields) + 2))
+        updates = ", ".join(f"{field} = excluded.{field}" for field in fields) or "uid = uid"
+        self.store.execute(
+            f"INSERT INTO interviews ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT (uid, interview_id) DO UPDATE SET {updates}",
+            (uid, interview_id, *(summary[field] for field in fields))
+        )
+
+    def replace_interview(self, uid, interview_id, record, token=None):
+        with self.store.lock, self.store.conn:
+            self.store.conn.execute("DELETE FROM questions WHERE uid = ? AND interview_id = ?", (uid, interview_id))
+            self.store.conn.execute("DELETE FROM interviews WHERE uid = ? AND interview_id = ?", (uid, interview_id))
+            self.store.conn.execute(
+                f"INSERT INTO interviews (uid, interview_id, {', '.join(SUMMARY_FIELDS)}) "
+                f"VALUES (?, ?, {', '.join('?' * len(SUMMARY_FIELDS))})",
+                (uid, interview_id, *(record.get(field) for field in SUMMARY_FIELDS))
+            )
+            self.store.conn.executemany(
+                "INSERT INTO questions (uid, interview_id, question_key, category, question, answer, score, justification) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(uid, interview_id, q_key, *(q.get(field) for field in QUESTION_FIELDS))
+                 for q_key, q in (record.get('questions') or {}).items()]
+            )
+
+    def delete_interviews(self, uid, interview_ids, token=None):
+        with self.store.lock, self.store.conn:
+            for table in ("questions", "interviews"):
+                self.store.conn.executemany(
+                    f"DELETE FROM {table} WHERE uid = ? AND interview_id = ?",
+                    [(uid, interview_id) for interview_id in interview_ids]
+                )
+
+    def delete_candidate(self, uid, token=None):
+        with self.store.lock, self.store.conn:
+            self.store.conn.execute("DELETE FROM questions WHERE uid = ?", (uid,))
+            self.store.conn.execute("DELETE FROM interviews WHERE uid = ?", (uid,))
+
+    def delete_all(self, token=None):
+        with self.store.lock, self.store.conn:
+            self.store.conn.execute("DELETE FROM questions")
+            self.store.conn.execute("DELETE FROM interviews")
+
+
+class SQLiteUserRepository(UserRepository):
+    def __init__(self, store):
+        self.store = store
+
+    def get_user(self, uid, token=None):
+        rows = self.store.query("SELECT data FROM users WHERE uid = ?", (uid,))
+        return json.loads(rows[0]['data']) if rows else None
+
+    def set_user(self, uid, user_data, token=None):
+        self.store.execute(
+            "INSERT INTO users (uid, email, data) VALUES (?, ?, ?) "
+            "ON CONFLICT (uid) DO UPDATE SET data = excluded.data",
+            (uid, user_data.get('email'), json.dumps(user_data))
+        )
+
+    def update_user(self, uid, fields, token=None):
+        user_data = self.get_user(uid) or {}
+        user_data.update(fields)
+        self.set_user(uid, user_data)
+
+
+class SQLiteAuth:
+    """Minimal email/password auth with the same methods the app uses from pyrebase"""
+
+    def __init__(self, store):
+        self.store = store
+
+    @staticmethod
+    def _hash(password, salt):
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), 100_000).hex()
+
+    def _session(self, uid, email):
+        return {'localId': uid, 'email': email, 'idToken': secrets.token_hex(16)}
+
+    def create_user_with_email_and_password(self, email, password):
+        if self.store.query("SELECT 1 FROM users WHERE email = ?", (email,)):
+            raise ValueError("EMAIL_EXISTS")
+        uid = uuid.uuid4().hex
+        salt = secrets.token_hex(16)
+        self.store.execute(
+            "INSERT INTO users (uid, email, password_hash, data) VALUES (?, ?, ?, ?)",
+            (uid, email, f"{salt}${self._hash(password, salt)}", json.dumps({'email': email}))
+        )
+        return self._session(uid, email)
+
+    def sign_in_with_email_and_password(self, email, password):
+        rows = self.store.query("SELECT uid, password_hash FROM users WHERE email = ?", (email,))
+        if not rows or not rows[0]['password_hash']:
+            raise ValueError("INVALID_LOGIN_CREDENTIALS")
+        salt, expected = rows[0]['password_hash'].split("$", 1)
+        if not secrets.compare_digest(self._hash(password, salt), expected):
+            raise ValueError("INVALID_LOGIN_CREDENTIALS")
+        return self._session(rows[0]['uid'], email)
+
+
+_sqlite_store = None
+_sqlite_lock = threading.Lock()
+
+
+def get_sqlite_store(path=SQLITE_PATH):
+    """Process-wide SQLite store (created on first use)"""
+    global _sqlite_store
+    with _sqlite_lock:
+        if _sqlite_store is None:
+            _sqlite_store = SQLiteStore(path)
+        return _sqlite_store
+
+
+def get_auth():
+    """Auth client for the configured backend (None if unavailable)"""
+    if DATA_BACKEND == "sqlite":
+        return SQLiteAuth(get_sqlite_store())
+    from backend.firebase_client import get_firebase_auth
+    return get_firebase_auth()
+
+
+def get_repositories():
+    """Return (InterviewRepository, UserRepository) for the configured backend.
+
+    Returns (None, None) if the database can't be reached.
+    """
+    if DATA_BACKEND == "sqlite":
+        store = get_sqlite_store()
+        return SQLiteInterviewRepository(store), SQLiteUserRepository(store)
+
+    from backend.firebase_client import get_firebase_db
+    db = get_firebase_db()
+    if not db:
+        return None, None
+    return FirebaseInterviewRepository(db), FirebaseUserRepository(db)
@@ -1,6 +1,8 @@
 import os
 import re
-import fitz  # PyMuPDF
+from backend.lazy_imports import lazy_import
+
+fitz = lazy_import("fitz")  # PyMuPDF, loaded on first PDF
 
 class ResumeParser:
     def __init__(self):
@@ -0,0 +1,180 @@
+"""
+Retention job: move old interviews to compressed monthly archives
+
+Interviews older than RETENTION_DAYS are appended (full record, questions
+included) to <ARCHIVE_DIR>/<YYYY-MM>.jsonl.gz, then replaced in the hot store
+by their summary fields plus `archived: "<YYYY-MM>"`. The archive is written
+and synced to disk before the hot record is trimmed, so an interrupted run
+never loses data; a record archived twice is harmless because restores take
+the last copy.
+
+With the Firebase backend the app host's disk may be wiped on restart (e.g.
+Streamlit Cloud), so archiving refuses to run unless ARCHIVE_DIR is set
+explicitly to durable storage (a mounted volume, a synced folder...).
+
+Run from the command line:  python -m backend.retention [days]
+"""
+import os
+import gzip
+import errno
+import json
+import time
+import threading
+from datetime import datetime
+
+from backend.cache import interview_cache
+from backend.repository import SUMMARY_FIELDS, DATA_BACKEND
+
+RETENTION_DAYS = int(os.getenv("RETENTION_DAYS", "180"))
+RETENTION_PAGE_SIZE = 50  # candidates per page
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "archive")
+
+_archive_lock = threading.Lock()
+
+
+def archive_is_durable():
+    """Whether trimming hot records is safe: the archive outlives the app host.
+
+    SQLite data lives on the same disk as the default archive directory, so
+    the archive is as durable as the data itself; Firebase data needs an
+    explicitly configured ARCHIVE_DIR.
+    """
+    return DATA_BACKEND == "sqlite" or bool(os.getenv("ARCHIVE_DIR"))
+
+
+def archive_partition(interview_date):
+    """Month partition ("YYYY-MM") for an interview timestamp in ms"""
+    return datetime.fromtimestamp((interview_date or 0) / 1000).strftime('%Y-%m')
+
+
+def _partition_path(partition):
+    return os.path.join(ARCHIVE_DIR, f"{partition}.jsonl.gz")
+
+
+def _append_to_archive(partition, entries):
+    """Append (uid, interview_id, record) entries to one month's archive.
+
+    Each call adds a gzip member; gzip readers read concatenated members
+    as one stream.
+    """
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    path = _partition_path(partition)
+    lines = "".join(json.dumps({'uid': uid, 'interview_id': interview_id, 'record': record}) + "\n"
+                    for uid, interview_id, record in entries)
+    with _archive_lock:
+        created = not os.path.exists(path)
+        with open(path, "ab") as raw:
+            # Close the gzip member first so its trailer is part of what gets synced
+            with gzip.GzipFile(fileobj=raw, mode="ab") as f:
+                f.write(lines.encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+        if created:
+            _fsync_dir(ARCHIVE_DIR)
+
+
+def _fsync_dir(path):
+    """Make a new file's directory entry durable (not supported everywhere)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        if e.errno not in (errno.EINVAL, errno.EBADF, errno.EACCES):
+            raise
+    finally:
+        os.close(fd)
+
+
+def summary_record(record, partition):
+    """What stays hot for an archived interview"""
+    summary = {field: record[field] for field in SUMMARY_FIELDS if record.get(field) is not None}
+    summary['archived'] = partition
+    return summary
+
+
+def archive_old_interviews(interviews, token=None, older_than_days=None, progress=None):
+    """Archive every interview older than the cutoff; returns the count.
+
+    `progress(candidates_done, interviews_archived)` is called after each page.
+    Raises RuntimeError without touching any data if the archive location
+    isn't durable (see archive_is_durable).
+    """
+    if not archive_is_durable():
+        raise RuntimeError("Set ARCHIVE_DIR to durable storage before archiving Firebase interviews; "
+                           "the default data/archive folder does not survive a restart of the app host.")
+    days = RETENTION_DAYS if older_than_days is None else older_than_days
+    cutoff = int((time.time() - days * 86400) * 1000)
+    candidates_done = archived = 0
+
+    for page in interviews.iter_pages(RETENTION_PAGE_SIZE, token):
+        by_partition = {}
+        for uid, user_interviews in page.items():
+            for interview_id, record in (user_interviews or {}).items():
+                record = record or {}
+                if record.get('archived') or record.get('interview_date', 0) >= cutoff:
+                    continue
+                partition = archive_partition(record.get('interview_date'))
+                by_partition.setdefault(partition, []).append((uid, interview_id, record))
+
+        for partition, entries in by_partition.items():
+            _append_to_archive(partition, entries)  # raises before anything is trimmed if the write fails
+            for uid, interview_id, record in entries:
+                interviews.replace_interview(uid, interview_id, summary_record(record, partition), token)
+            archived += len(entries)
+
+        candidates_done += len(page)
+        if progress:
+            progress(candidates_done, archived)
+
+    if archived:
+        interview_cache.invalidate(("interviews",))
+    return archived
+
+
+def load_archived_interview(partition, uid, interview_id):
+    """Full archived record, or None if it isn't in that partition"""
+    path = _partition_path(partition)
+    if not os.path.exists(path):
+        return None
+    found = None
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            entry = json.loads(line)
+            if entry['uid'] == uid and entry['interview_id'] == interview_id:
+                found = entry['record']  # keep going: the last copy wins
+    return found
+
+
+def restore_interview(interviews, uid, interview_id, partition, token=None):
+    """Put an archived interview back in the hot store; True if it was found.
+
+    The archive copy is kept, so the interview is simply archived again by a
+    later run once it's still past the cutoff.
+    """
+    record = load_archived_interview(partition, uid, interview_id)
+    if record is None:
+        return False
+    record = {key: value for key, value in record.items() if key != 'archived'}
+    interviews.replace_interview(uid, interview_id, record, token)
+    interview_cache.invalidate(("interviews",))
+    return True
+
+
+if __name__ == "__main__":
+    import sys
+    from backend.repository import get_repositories
+
+    interview_repo, _ = get_repositories()
+    if interview_repo is None:
+        sys.exit("No data backend configured")
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    if not archive_is_durable():
+        sys.exit("ARCHIVE_DIR must point to durable storage when DATA_BACKEND is firebase")
+    count = archive_old_interviews(
+        interview_repo, older_than_days=days,
+        progress=lambda done, n: print(f"{done} candidates scanned, {n} interviews archived"))
+    print(f"Archived {count} interviews")
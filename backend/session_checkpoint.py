@@ -0,0 +1,77 @@
+"""
+Compact checkpoints of a candidate's interview session
+
+Everything needed to continue an interview (interview_data with the current
+question and answers so far, plus the skills/projects parsed from the resume)
+is serialized into one small blob - JSON, zlib-compressed, base64 - and kept
+on the candidate's user record. A candidate who reconnects after a dropped
+websocket or a server restart resumes at the exact question: no re-upload,
+no re-parse and no new LLM calls.
+"""
+import json
+import zlib
+import time
+import base64
+
+from backend.adaptive_interview import interview_finished
+
+CHECKPOINT_FIELD = "interview_checkpoint"
+CHECKPOINT_VERSION = 1
+CHECKPOINT_KEYS = ('interview_data', 'extracted_skills', 'extracted_projects')
+
+
+def encode_checkpoint(session_state):
+    """Serialize the resumable part of a session into a compact string"""
+    state = {key: session_state.get(key) for key in CHECKPOINT_KEYS}
+    state['version'] = CHECKPOINT_VERSION
+    state['saved_at'] = int(time.time() * 1000)
+    raw = json.dumps(state, separators=(',', ':')).encode('utf-8')
+    return base64.b64encode(zlib.compress(raw, 9)).decode('ascii')
+
+
+def decode_checkpoint(blob):
+    """The checkpoint dict, or None if the blob is missing or unreadable"""
+    if not blob:
+        return None
+    try:
+        state = json.loads(zlib.decompress(base64.b64decode(blob)))
+    except Exception:
+        return None
+    if state.get('version') != CHECKPOINT_VERSION or not state.get('interview_data'):
+        return None
+    return state
+
+
+def save_checkpoint(users, uid, session_state, token=None):
+    """Persist the session; never lets a checkpoint failure break the interview"""
+    try:
+        users.update_user(uid, {CHECKPOINT_FIELD: encode_checkpoint(session_state)}, token)
+        return True
+    except Exception:
+        return False
+
+
+def load_checkpoint(users, uid, token=None):
+    """The candidate's unfinished interview, or None"""
+    try:
+        user_data = users.get_user(uid, token) or {}
+    except Exception:
+        return None
+    state = decode_checkpoint(user_data.get(CHECKPOINT_FIELD))
+    if state is None or interview_finished(state['interview_data']):
+        return None
+    return state
+
+
+def clear_checkpoint(users, uid, token=None):
+    try:
+        users.update_user(uid, {CHECKPOINT_FIELD: None}, token)
+    except Exception:
+        pass
+
+
+def restore_checkpoint(session_state, state):
+    """Load a checkpoint back into st.session_state"""
+    for key in CHECKPOINT_KEYS:
+        session_state[key] = state.get(key)
+    session_state['interview_data']['voice_welcome'] = True
@@ -1,15 +1,99 @@
-import pyttsx3
-import speech_recognition as sr
 import tempfile
 import os
+import queue
+import threading
+from concurrent.futures import Future
+from backend.lazy_imports import lazy_import
+
+pyttsx3 = lazy_import("pyttsx3")
+sr = lazy_import("speech_recognition")
+
+
+class OfflineTTSEngine:
+    """Single pyttsx3 engine owned by one worker thread.
+
+    pyttsx3 drivers are not thread-safe and are slow to start, so the engine is
+    created once and every request (from any Streamlit session) is queued to it.
+    """
+
+    def __init__(self, rate=None, voice_id=None):
+        self.rate = rate
+        self.voice_id = voice_id
+        self._jobs = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="offline-tts", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        engine = None
+        while True:
+            kind, text, future = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if engine is None:
+                    engine = pyttsx3.init()
+                    if self.rate:
+                        engine.setProperty('rate', self.rate)
+                    if self.voice_id:
+                        engine.setProperty('voice', self.voice_id)
+                if kind == "say":
+                    engine.say(text)
+                    engine.runAndWait()
+                    future.set_result(None)
+                else:
+                    future.set_result(self._render(engine, text))
+            except Exception as e:
+                # Drop the engine so the next job starts from a fresh driver
+                engine = None
+                future.set_exception(e)
+
+    @staticmethod
+    def _render(engine, text):
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+            wav_path = temp_file.name
+        try:
+            engine.save_to_file(text, wav_path)
+            engine.runAndWait()
+            with open(wav_path, 'rb') as wav_file:
+                return wav_file.read()
+        finally:
+            try:
+                os.unlink(wav_path)
+            except OSError:
+                pass
+
+    def _submit(self, kind, text):
+        future = Future()
+        self._jobs.put((kind, text, future))
+        return future
+
+    def synthesize(self, text, timeout=30):
+        """Render text to WAV bytes on the engine thread"""
+        return self._submit("render", text).result(timeout=timeout)
+
+    def say(self, text, timeout=60):
+        """Speak text through the local audio device on the engine thread"""
+        return self._submit("say", text).result(timeout=timeout)
+
+
+_offline_engine = None
+_offline_engine_lock = threading.Lock()
+
+
+def get_offline_tts():
+    """Process-wide offline TTS engine (created on first use)"""
+    global _offline_engine
+    with _offline_engine_lock:
+        if _offline_engine is None:
+            _offline_engine = OfflineTTSEngine()
+        return _offline_engine
+
 
 class SpeechIO:
     
     def speak(self,text):
-        # Initialize the text-to-speech engine
-        engine = pyttsx3.init()
-        engine.say(text)
-        engine.runAndWait()
+        # Reuse the shared text-to-speech engine instead of initializing one per call
+        get_offline_tts().say(text)
 
     def listen_for_answer(self, timeout=15):
         # listen for an answer using the microphone
@@ -29,5 +113,3 @@ class SpeechIO:
         except sr.RequestError:
             # Speech service error - return empty string silently
             return ""
-
-
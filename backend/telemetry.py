@@ -0,0 +1,219 @@
+"""
+Lightweight tracing and metrics for the interview pipeline
+
+    with span("question_generation", category=category):
+        ...
+    count("llm_retries")
+
+Spans nest through a context variable, so a span started inside another one
+records it as its parent. Every finished span feeds a per-stage latency
+histogram; counters track retries, STT attempts and cache hits.
+
+Set TELEMETRY to enable it:
+    TELEMETRY=prometheus  serve metrics as Prometheus text on TELEMETRY_PORT
+    TELEMETRY=jsonl       append one JSON line per span to TELEMETRY_PATH
+Unset (the default), span() returns a shared no-op context manager and
+count() returns immediately.
+"""
+import os
+import json
+import time
+import uuid
+import threading
+import contextvars
+
+TELEMETRY = os.getenv("TELEMETRY", "").lower()
+TELEMETRY_PORT = int(os.getenv("TELEMETRY_PORT", "9464"))
+TELEMETRY_PATH = os.getenv(
+    "TELEMETRY_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "telemetry.jsonl"),
+)
+ENABLED = TELEMETRY in ("prometheus", "jsonl")
+
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram, Prometheus style"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        i = 0
+        while i < len(self.buckets) and value > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Registry:
+    """Process-wide histograms (per stage) and counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}  # (stage, status) -> Histogram
+        self.counters = {}    # (name, labels tuple) -> value
+
+    def observe(self, stage, seconds, status="ok"):
+        with self._lock:
+            histogram = self.histograms.get((stage, status))
+            if histogram is None:
+                histogram = self.histograms[(stage, status)] = Histogram()
+            histogram.observe(seconds)
+
+    def inc(self, name, value=1, labels=()):
+        with self._lock:
+            self.counters[(name, labels)] = self.counters.get((name, labels), 0) + value
+
+    def render_prometheus(self):
+        """All metrics in the Prometheus text exposition format"""
+        lines = ["# TYPE interview_stage_seconds histogram"]
+        with self._lock:
+            for (stage, status), h in sorted(self.histograms.items()):
+                labels = f'stage="{stage}",status="{status}"'
+                cumulative = 0
+                for bound, n in zip(h.buckets + ("+Inf",), h.counts):
+                    cumulative += n
+                    lines.append(f'interview_stage_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"interview_stage_seconds_sum{{{labels}}} {h.sum:.6f}")
+                lines.append(f"interview_stage_seconds_count{{{labels}}} {h.count}")
+            for name in sorted({name for name, _ in self.counters}):
+                lines.append(f"# TYPE interview_{name}_total counter")
+                for (counter, labels), value in sorted(self.counters.items()):
+                    if counter == name:
+                        label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+                        lines.append(f"interview_{name}_total{{{label_text}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+class Span:
+    """One timed operation; use through span()"""
+
+    __slots__ = ("name", "attrs", "trace_id", "span_id", "parent_id", "start", "_token")
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+        self.span_id = uuid.uuid4().hex[:16]
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.parent_id = parent.span_id if parent else None
+        self._token = _current_span.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        _current_span.reset(self._token)
+        status = "error" if exc_type else "ok"
+        registry.observe(self.name, duration, status)
+        if TELEMETRY == "jsonl":
+            _write_jsonl({
+                'trace_id': self.trace_id, 'span_id': self.span_id, 'parent_id': self.parent_id,
+                'name': self.name, 'start': time.time() - duration, 'duration_ms': round(duration * 1000, 3),
+                'status': status, 'error': repr(exc) if exc else None, 'attrs': self.attrs,
+            })
+        return False
+
+
+class _NoopSpan:
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name, **attrs):
+    """Time a block as a pipeline stage"""
+    if not ENABLED:
+        return _NOOP_SPAN
+    _ensure_exporter()
+    return Span(name, attrs)
+
+
+def count(name, value=1, **labels):
+    """Add to a counter, e.g. count("stt_attempts", language="en-US")"""
+    if ENABLED:
+        registry.inc(name, value, tuple(sorted(labels.items())))
+
+
+def current_trace_id():
+    current = _current_span.get()
+    return current.trace_id if current else None
+
+
+# ---------------------------------------------------------------------------
+# Exporters
+# ---------------------------------------------------------------------------
+
+_jsonl_lock = threading.Lock()
+_exporter_started = False
+_exporter_lock = threading.Lock()
+
+
+def _write_jsonl(record):
+    line = json.dumps(record, default=str) + "\n"
+    with _jsonl_lock:
+        with open(TELEMETRY_PATH, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def _ensure_exporter():
+    global _exporter_started
+    if _exporter_started:
+        return
+    with _exporter_lock:
+        if _exporter_started:
+            return
+        _exporter_started = True
+        if TELEMETRY == "jsonl":
+            os.makedirs(os.path.dirname(TELEMETRY_PATH), exist_ok=True)
+        elif TELEMETRY == "prometheus":
+            start_prometheus_server(TELEMETRY_PORT)
+
+
+def start_prometheus_server(port=TELEMETRY_PORT):
+    """Serve registry.render_prometheus() on http://localhost:<port>/metrics"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = registry.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    try:
+        server = ThreadingHTTPServer(("127.0.0.1", port), MetricsHandler)
+    except OSError:
+        return None  # another process (e.g. a second Streamlit worker) has the port
+    threading.Thread(target=server.serve_forever, name="telemetry-prometheus", daemon=True).start()
+    return server
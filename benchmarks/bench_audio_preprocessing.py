@@ -0,0 +1,63 @@
+"""
+Audio preprocessing benchmark on a 30-second recording
+
+Usage: python -m benchmarks.bench_audio_preprocessing [--repeat N]
+"""
+import argparse
+import timeit
+import numpy as np
+
+from backend.cloud_speech_io import (
+    preprocess_audio, resample_audio, trim_silence, normalize_loudness, to_pcm16,
+    TARGET_SAMPLE_RATE,
+)
+
+CLIP_SECONDS = 30
+INPUT_RATE = 44100
+
+
+def make_clip(seconds=CLIP_SECONDS, rate=INPUT_RATE, seed=0):
+    """Synthetic answer: 3s silence, speech-like noise bursts, 5s silence, some clipping"""
+    rng = np.random.default_rng(seed)
+    n = seconds * rate
+    y = rng.normal(0, 0.001, n).astype(np.float32)
+    speech = slice(3 * rate, (seconds - 5) * rate)
+    t = np.arange(speech.stop - speech.start) / rate
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 3 * t))
+    y[speech] += (0.3 * envelope * np.sin(2 * np.pi * 220 * t)
+                  + rng.normal(0, 0.05, t.size)).astype(np.float32)
+    return np.clip(y * 2.5, -1.0, 1.0)
+
+
+def bench(label, fn, repeat):
+    times = timeit.repeat(fn, number=1, repeat=repeat)
+    print(f"{label:<28} best {min(times) * 1000:8.2f} ms   median {sorted(times)[len(times) // 2] * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    clip = make_clip()
+    resampled = resample_audio(clip, INPUT_RATE)
+    processed, stats = preprocess_audio(clip, INPUT_RATE)
+    print(f"{CLIP_SECONDS}s clip @ {INPUT_RATE}Hz -> {stats['output_seconds']:.1f}s @ {TARGET_SAMPLE_RATE}Hz "
+          f"(clipped {stats['clipped_ratio'] * 100:.2f}%)")
+
+    bench("resample", lambda: resample_audio(clip, INPUT_RATE), args.repeat)
+    bench("trim_silence", lambda: trim_silence(resampled, TARGET_SAMPLE_RATE), args.repeat)
+    bench("normalize_loudness", lambda: normalize_loudness(resampled), args.repeat)
+    bench("to_pcm16", lambda: to_pcm16(processed), args.repeat)
+    bench("preprocess_audio (total)", lambda: preprocess_audio(clip, INPUT_RATE), args.repeat)
+
+    try:
+        import librosa
+        bench("librosa.resample (baseline)",
+              lambda: librosa.resample(clip, orig_sr=INPUT_RATE, target_sr=TARGET_SAMPLE_RATE), args.repeat)
+    except ImportError:
+        print("librosa not installed - skipping baseline")
+
+
+if __name__ == "__main__":
+    main()
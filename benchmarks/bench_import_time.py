@@ -0,0 +1,84 @@
+"""
+Cold-start import-time check for the app modules
+
+Runs `python -X importtime` in fresh interpreters, once importing only
+streamlit (baseline) and once importing the dashboards on top of it. Fails
+(exit code 1) if the app's own import cost exceeds the budget or if any heavy
+dependency is imported eagerly.
+
+Usage: python -m benchmarks.bench_import_time [--budget-ms 300] [--runs 3]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASELINE = "import streamlit"
+APP = "import streamlit, frontend.hr_dashboard, frontend.user_dashboard, backend.interview_summary"
+
+# Modules that must only load on first use
+HEAVY_MODULES = [
+    "librosa", "soundfile", "numpy", "scipy", "plotly", "pandas",
+    "fitz", "groq", "speech_recognition", "edge_tts", "pyttsx3",
+]
+
+
+def import_profile(statement):
+    """Return (total cumulative microseconds, set of imported top-level names)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import failed:\n{result.stderr[-2000:]}")
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|", 2)
+        name = name[1:]  # keep the nesting indentation, drop the separator space
+        modules.add(name.strip().split(".")[0])
+        # Top-level entries (least indented) add up to the total import cost
+        if not name.startswith("   "):
+            total_us += int(cumulative_us.strip())
+    return total_us, modules
+
+
+def best_of(statement, runs):
+    profiles = [import_profile(statement) for _ in range(runs)]
+    return min(p[0] for p in profiles), profiles[0][1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=300.0,
+                        help="max import time of the app modules on top of streamlit")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    baseline_us, baseline_modules = best_of(BASELINE, args.runs)
+    app_us, app_modules = best_of(APP, args.runs)
+    app_ms = (app_us - baseline_us) / 1000
+
+    print(f"streamlit baseline: {baseline_us / 1000:8.1f} ms")
+    print(f"app modules:        {app_ms:8.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    eager = sorted(m for m in HEAVY_MODULES if m in app_modules and m not in baseline_modules)
+    failed = False
+    if eager:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(eager)}")
+        failed = True
+    if app_ms > args.budget_ms:
+        print("FAIL: cold start import time over budget")
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Offline interview-pipeline benchmark: throughput and p50/p95/p99 per stage
+
+Groq, pyrebase, edge-tts and Google STT are replaced by the stand-ins in
+benchmarks/fakes (with optional injected latency), so this runs without
+network access or API keys.
+
+Stages run once:            resume_parsing, question_generation, scoring, tts, stt
+Stages run per dataset size: persistence[firebase], persistence[sqlite],
+                             hr_pages[firebase], hr_list[sqlite], hr_aggregation
+
+Usage: python -m benchmarks.bench_pipeline [--sizes 100,10000,100000] [--repeat 50]
+           [--latency-ms 0] [--jitter-ms 0] [--json results.json]
+"""
+import argparse
+import itertools
+import json
+import math
+import queue
+import time
+
+from benchmarks.fakes import groq_fake, speech_fakes
+from benchmarks.fakes.latency import Latency
+from benchmarks.fakes.pyrebase_fake import FakeFirebaseDatabase
+from benchmarks.fakes.interview_data import SAMPLE_RESUME, CATEGORIES, make_interviews
+
+HEAVY_OPS_BUDGET = 1_000_000  # repeat heavy stages about this many interviews' worth
+
+
+def percentile(sorted_times, q):
+    """Nearest-rank percentile of an already sorted list"""
+    index = min(len(sorted_times) - 1, max(0, math.ceil(q / 100 * len(sorted_times)) - 1))
+    return sorted_times[index]
+
+
+def measure(fn, repeat):
+    """Per-call wall times (seconds) of `repeat` calls to fn(i)"""
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(i)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(results, size, stage, times):
+    times = sorted(times)
+    row = {
+        "size": size,
+        "stage": stage,
+        "runs": len(times),
+        "p50_ms": percentile(times, 50) * 1000,
+        "p95_ms": percentile(times, 95) * 1000,
+        "p99_ms": percentile(times, 99) * 1000,
+        "ops_per_s": len(times) / sum(times) if sum(times) else float("inf"),
+    }
+    results.append(row)
+    print(f"{size or '-':>7} {stage:<24} {row['runs']:>5} runs   p50 {row['p50_ms']:9.2f} ms   "
+          f"p95 {row['p95_ms']:9.2f} ms   p99 {row['p99_ms']:9.2f} ms   {row['ops_per_s']:10.1f} ops/s")
+
+
+# ---------------------------------------------------------------------------
+# Size-independent stages
+# ---------------------------------------------------------------------------
+
+def bench_single_stages(results, repeat, latency):
+    from backend.resume_parser import ResumeParser
+    parser = ResumeParser()
+    report(results, None, "resume_parsing", measure(
+        lambda i: (parser.extract_skills(SAMPLE_RESUME, grouped=True), parser.extract_projects(SAMPLE_RESUME)),
+        repeat))
+    skills = parser.extract_skills(SAMPLE_RESUME, grouped=True)
+    projects = parser.extract_projects(SAMPLE_RESUME)
+
+    groq_fake.install(latency)
+    from backend.question_generator import QuestionGenerator
+    from backend.answer_analyzer import analyze_answer_with_ai
+    generator = QuestionGenerator(groq_api_key="benchmark")
+    report(results, None, "question_generation", measure(
+        lambda i: generator.generate_ai_question(skills, projects, set(), CATEGORIES[i % len(CATEGORIES)]),
+        repeat))
+
+    question = groq_fake.QUESTIONS[0]
+    report(results, None, "scoring", measure(
+        lambda i: analyze_answer_with_ai(f"Answer number {i} " + speech_fakes.TRANSCRIPTS[0], question,
+                                         generator.client),
+        repeat))
+
+    speech_fakes.install_edge_tts(latency)
+    from backend.cloud_speech_io import _split_sentences, _stream_segments, preprocess_audio, to_pcm16
+    segments = _split_sentences(question + " Take your time. Please answer in a few sentences.")
+    report(results, None, "tts", measure(lambda i: _stream_segments(segments, queue.Queue()), repeat))
+
+    from benchmarks.bench_audio_preprocessing import make_clip, INPUT_RATE
+    clip = make_clip()
+    recognizer = speech_fakes.FakeRecognizer(latency)
+
+    def recognize(i):
+        y, _ = preprocess_audio(clip, INPUT_RATE)
+        return recognizer.recognize_google(to_pcm16(y), language="en-US")
+
+    report(results, None, "stt", measure(recognize, max(repeat // 5, 3)))
+
+
+# ---------------------------------------------------------------------------
+# Stages that depend on the dataset size
+# ---------------------------------------------------------------------------
+
+def load_sqlite(data):
+    """In-memory SQLite store holding the same interviews as `data`"""
+    from backend.repository import SQLiteStore
+    store = SQLiteStore(":memory:")
+    interview_rows = []
+    question_rows = []
+    for uid, user_interviews in data.items():
+        for interview_id, record in user_interviews.items():
+            interview_rows.append((uid, interview_id, record["user_email"], record["total_score"],
+                                   record["total_questions"], record["average_score"],
+                                   record["interview_date"], record["status"]))
+            for q_key, q in record["questions"].items():
+                question_rows.append((uid, interview_id, q_key, q["category"], q["question"], q["answer"],
+                                      q["score"], q["justification"]))
+    with store.conn:
+        store.conn.executemany(
+            "INSERT INTO interviews (uid, interview_id, user_email, total_score, total_questions, average_score, "
+            "interview_date, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", interview_rows)
+        store.conn.executemany(
+            "INSERT INTO questions (uid, interview_id, question_key, category, question, answer, score, "
+            "justification) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", question_rows)
+    return store
+
+
+def persist_answer(interviews, users, uid, interview_id, number):
+    """The same requests store_answer_to_firebase makes for one answer"""
+    interviews.save_question(uid, interview_id, f"q{number}", {
+        "category": CATEGORIES[number % len(CATEGORIES)], "question": groq_fake.QUESTIONS[0],
+        "answer": speech_fakes.TRANSCRIPTS[0], "score": 7, "justification": "Benchmark answer.",
+    })
+    current = interviews.get_interview(uid, interview_id) or {}
+    total = current.get("total_score", 0) + 7
+    count = current.get("total_questions", 0) + 1
+    interviews.update_summary(uid, interview_id, {
+        "user_email": "bench@example.com", "total_score": total, "total_questions": count,
+        "average_score": round(total / count, 1), "interview_date": int(time.time() * 1000),
+        "status": "completed" if count >= 10 else "in_progress",
+    })
+    users.update_user(uid, {"email": "bench@example.com", "total_interviews": 1,
+                            "last_interview": int(time.time() * 1000)})
+
+
+def bench_dataset(results, size, repeat, latency):
+    from backend.repository import (
+        FirebaseInterviewRepository, FirebaseUserRepository, SQLiteInterviewRepository, SQLiteUserRepository,
+    )
+    from backend.interview_export import EXPORT_PAGE_SIZE
+    from backend.interview_analytics import (
+        build_frames, overview_metrics, score_histogram, performance_buckets, category_averages,
+    )
+
+    data = make_interviews(size)
+    heavy_repeat = max(3, min(repeat, HEAVY_OPS_BUDGET // size))
+
+    # Shallow copy: the benchmark's writes go to a candidate that isn't in `data`
+    db = FakeFirebaseDatabase({"interviews": dict(data)}, latency=latency)
+    interviews, users = FirebaseInterviewRepository(db), FirebaseUserRepository(db)
+    report(results, size, "persistence[firebase]", measure(
+        lambda i: persist_answer(interviews, users, "bench-uid", f"bench-{i // 10}", i % 10 + 1), repeat))
+    report(results, size, "hr_pages[firebase]", measure(
+        lambda i: sum(1 for _ in interviews.iter_pages(EXPORT_PAGE_SIZE)), heavy_repeat))
+
+    store = load_sqlite(data)
+    interviews, users = SQLiteInterviewRepository(store), SQLiteUserRepository(store)
+    report(results, size, "persistence[sqlite]", measure(
+        lambda i: persist_answer(interviews, users, "bench-uid", f"bench-{i // 10}", i % 10 + 1), repeat))
+    report(results, size, "hr_list[sqlite]", measure(lambda i: interviews.list_interviews(), heavy_repeat))
+    store.conn.close()
+
+    def aggregate(i):
+        interviews_df, questions_df = build_frames(data)
+        overview_metrics(interviews_df)
+        score_histogram(interviews_df)
+        performance_buckets(interviews_df)
+        category_averages(questions_df)
+
+    report(results, size, "hr_aggregation", measure(aggregate, heavy_repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,10000,100000",
+                        help="comma-separated numbers of interviews in the dataset")
+    parser.add_argument("--repeat", type=int, default=50, help="runs per stage")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="injected latency per fake service call")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    latency = Latency(args.latency_ms, args.jitter_ms)
+    seeds = itertools.count()
+    results = []
+    print(f"{'size':>7} {'stage':<24} (fake latency {args.latency_ms:g} +/- {args.jitter_ms:g} ms)")
+    bench_single_stages(results, args.repeat, latency)
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        bench_dataset(results, size, args.repeat, Latency(args.latency_ms, args.jitter_ms, seed=next(seeds)))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Local stand-in for the Firebase Realtime Database streaming (SSE) endpoint
+
+Serves `GET /<path>.json` as text/event-stream in Firebase's format: an
+initial `put` of the whole subtree, then every put/patch pushed through the
+server, and `auth_revoked` on revoke(). Point pyrebase at `server.url` as its
+databaseURL.
+
+    server = FakeFirebaseSSEServer({"u1": {"i1": {...}}}).start()
+    firebase = pyrebase.initialize_app({"databaseURL": server.url, "apiKey": "x",
+                                        "authDomain": "x", "storageBucket": "x"})
+    stream = firebase.database().child("interviews").stream(handler)
+    server.put("/u2/i9", {...})
+"""
+import json
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.live_interviews import _set_in, _split_path
+
+
+class FakeFirebaseSSEServer:
+    def __init__(self, initial_data=None, path="interviews", host="127.0.0.1", port=0):
+        self.path = path
+        self.data = initial_data or {}
+        self._clients = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        with self._lock:
+            for client in self._clients:
+                client.put(None)
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _broadcast(self, event, path, data):
+        with self._lock:
+            for client in self._clients:
+                client.put((event, {"path": path, "data": data}))
+
+    def put(self, path, data):
+        """Set data at path (relative to the streamed path) and notify listeners"""
+        with self._lock:
+            self.data = _set_in(self.data, _split_path(path), data) or {}
+        self._broadcast("put", path, data)
+
+    def patch(self, path, data):
+        """Merge the dict data at path and notify listeners"""
+        with self._lock:
+            for key, value in data.items():
+                self.data = _set_in(self.data, _split_path(path) + _split_path(key), value) or {}
+        self._broadcast("patch", path, data)
+
+    def revoke(self):
+        """Tell listeners their auth token is no longer valid, as Firebase does on expiry"""
+        self._broadcast("auth_revoked", None, None)
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                requested = self.path.split("?", 1)[0].strip("/")
+                if requested != f"{fake.path}.json":
+                    self.send_error(404)
+                    return
+
+                client = queue.Queue()
+                with fake._lock:
+                    client.put(("put", {"path": "/", "data": fake.data}))
+                    fake._clients.append(client)
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                try:
+                    while True:
+                        try:
+                            item = client.get(timeout=15)
+                        except queue.Empty:
+                            item = ("keep-alive", None)
+                        if item is None:
+                            break
+                        event, payload = item
+                        self.wfile.write(f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode())
+                        self.wfile.flush()
+                        if event == "auth_revoked":
+                            break
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    with fake._lock:
+                        fake._clients.remove(client)
+
+        return Handler
@@ -0,0 +1,146 @@
+"""
+Deterministic stand-in for the `groq` client
+
+Returns canned interview questions (one per line when the prompt asks for
+several) for question prompts and valid scoring JSON for answer-analysis
+prompts, after an injected delay. Only the parts of the API the app uses are
+implemented: `Groq(api_key=...).chat.completions.create(...)`, including `stream=True` (word-sized deltas, `token_ms` apart).
+
+    from benchmarks.fakes import groq_fake
+    groq_fake.install(Latency(400, 100))   # `import groq` now returns the fake
+"""
+import re
+import sys
+import json
+import time
+import types
+import hashlib
+
+from benchmarks.fakes.latency import NO_LATENCY
+
+QUESTIONS = [
+    "Can you describe a project where you used Python to solve a real problem?",
+    "How do you explain a technical idea to someone without a technical background?",
+    "Tell me about a time you had to debug a difficult issue. How did you approach it?",
+    "Describe a situation where you took the lead in a team project.",
+    "What did you learn from your most recent internship or project?",
+    "How would you prioritize tasks when several deadlines overlap?",
+    "Which tools do you use to keep your code maintainable, and why?",
+    "How do you handle feedback on your work from teammates?",
+]
+
+JUSTIFICATIONS = [
+    "Clear structure and a concrete example, but little detail on the outcome.",
+    "Shows good understanding; could mention trade-offs.",
+    "Answer is vague and does not address the question directly.",
+    "Strong, specific answer with measurable results.",
+]
+
+
+def _stable_index(text, modulo):
+    return int(hashlib.md5(text.encode("utf-8")).hexdigest(), 16) % modulo
+
+
+def canned_reply(prompt):
+    """The fake model's answer to a prompt (same prompt -> same reply)"""
+    if "Respond in JSON" in prompt:
+        index = _stable_index(prompt, 1000)
+        return json.dumps({
+            "score": 3 + index % 8,
+            "justification": JUSTIFICATIONS[index % len(JUSTIFICATIONS)],
+            "category": "technical",
+        })
+    start = _stable_index(prompt, len(QUESTIONS))
+    wanted = re.search(r"Write (\d+) different questions", prompt)
+    n = int(wanted.group(1)) if wanted else 1
+    return "\n".join(QUESTIONS[(start + i) % len(QUESTIONS)] for i in range(n))
+
+
+class _Message:
+    def __init__(self, content):
+        self.role = "assistant"
+        self.content = content
+
+
+class _Choice:
+    def __init__(self, content):
+        self.index = 0
+        self.message = _Message(content)
+        self.finish_reason = "stop"
+
+
+class _Usage:
+    def __init__(self, prompt, completion):
+        self.prompt_tokens = len(prompt.split())
+        self.completion_tokens = len(completion.split())
+        self.total_tokens = self.prompt_tokens + self.completion_tokens
+
+
+class _Completion:
+    def __init__(self, model, prompt, content):
+        self.model = model
+        self.choices = [_Choice(content)]
+        self.usage = _Usage(prompt, content)
+
+
+class _Delta:
+    def __init__(self, content):
+        self.role = "assistant"
+        self.content = content
+
+
+class _ChunkChoice:
+    def __init__(self, content, finish_reason=None):
+        self.index = 0
+        self.delta = _Delta(content)
+        self.finish_reason = finish_reason
+
+
+class _Chunk:
+    def __init__(self, model, content, finish_reason=None):
+        self.model = model
+        self.choices = [_ChunkChoice(content, finish_reason)]
+
+
+def _stream(model, content, token_seconds):
+    # Roughly one chunk per word, like token deltas
+    for token in re.findall(r"\S+\s*|\s+", content):
+        if token_seconds:
+            time.sleep(token_seconds)
+        yield _Chunk(model, token)
+    yield _Chunk(model, None, "stop")
+
+
+class _Completions:
+    def __init__(self, client):
+        self._client = client
+
+    def create(self, model=None, messages=None, stream=False, **kwargs):
+        # The injected latency is the time to the first token
+        self._client.latency.sleep()
+        self._client.calls += 1
+        prompt = "\n".join(m.get("content", "") for m in messages or [])
+        content = self._client.reply(prompt)
+        if stream:
+            return _stream(model, content, self._client.token_ms / 1000)
+        return _Completion(model, prompt, content)
+
+
+class FakeGroq:
+    """Drop-in for groq.Groq; `reply(prompt) -> str` can be overridden"""
+
+    def __init__(self, api_key=None, latency=None, reply=None, token_ms=0.0, **kwargs):
+        self.api_key = api_key
+        self.latency = latency or NO_LATENCY
+        self.token_ms = token_ms  # delay between streamed chunks
+        self.reply = reply or canned_reply
+        self.calls = 0
+        self.chat = types.SimpleNamespace(completions=_Completions(self))
+
+
+def install(latency=None):
+    """Register a fake `groq` module so `groq.Groq(...)` builds FakeGroq clients"""
+    module = types.ModuleType("groq")
+    module.Groq = lambda api_key=None, **kwargs: FakeGroq(api_key, latency=latency, **kwargs)
+    sys.modules["groq"] = module
+    return module
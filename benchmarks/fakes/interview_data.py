@@ -0,0 +1,61 @@
+"""
+Deterministic interview datasets and a sample resume
+
+make_interviews(n) builds an {uid: {interview_id: record}} tree shaped like
+`interviews/` in Firebase. Question dicts come from a small shared pool, so a
+100k-interview tree stays cheap to hold in memory while every interview
+still has a full set of questions to aggregate.
+"""
+import random
+
+CATEGORIES = ["technical_skills", "communication", "problem_solving", "leadership", "experience"]
+STATUSES = ["completed", "completed", "completed", "in_progress"]
+START_MS = 1_700_000_000_000
+DAY_MS = 86_400_000
+
+SAMPLE_RESUME = """
+Jane Doe - Computer Science graduate
+Skills: Python, Java, JavaScript, React, Flask, Django, SQL, PostgreSQL, MongoDB, Docker, Git, AWS,
+machine learning, pandas, NumPy, TensorFlow, communication, teamwork, leadership, problem solving
+Projects:
+Project: Campus Events Portal - React front end with a Flask API and PostgreSQL
+Project: Resume Screener - NLP pipeline in Python using scikit-learn
+Project: Smart Parking - IoT sensors streaming to AWS with a Django dashboard
+Experience: Software intern at Acme Corp, built internal tools in Python and SQL.
+Led a team of four in the university hackathon; presented our work to faculty.
+"""
+
+
+def question_pool(size=64, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "question": f"Sample question {i} about {CATEGORIES[i % len(CATEGORIES)].replace('_', ' ')}?",
+            "answer": f"Sample answer {i} " + "with some detail " * rng.randint(5, 30),
+            "score": rng.randint(1, 10),
+            "justification": f"Sample justification {i}.",
+        }
+        for i in range(size)
+    ]
+
+
+def make_interviews(n, questions_per_interview=10, interviews_per_candidate=2, seed=0):
+    """n interview records over n / interviews_per_candidate candidates"""
+    rng = random.Random(seed)
+    pool = question_pool(seed=seed)
+    data = {}
+    for i in range(n):
+        uid = f"uid{i // interviews_per_candidate:07d}"
+        questions = {f"q{q + 1}": pool[rng.randrange(len(pool))] for q in range(questions_per_interview)}
+        total = sum(q["score"] for q in questions.values())
+        data.setdefault(uid, {})[f"interview{i:07d}"] = {
+            "user_email": f"candidate{i // interviews_per_candidate}@example.com",
+            "total_score": total,
+            "total_questions": questions_per_interview,
+            "average_score": round(total / max(questions_per_interview, 1), 1),
+            "interview_date": START_MS + rng.randrange(365) * DAY_MS,
+            "status": STATUSES[i % len(STATUSES)],
+            "questions": questions,
+        }
+    return data
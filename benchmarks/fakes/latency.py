@@ -0,0 +1,29 @@
+"""
+Injected latency for the fake services
+"""
+import random
+import time
+
+
+class Latency:
+    """Sleep `mean_ms` +/- `jitter_ms` (uniform) per call; 0 disables it"""
+
+    def __init__(self, mean_ms=0.0, jitter_ms=0.0, seed=0):
+        self.mean_ms = mean_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+
+    def delay(self):
+        """Seconds to wait for the next call"""
+        if not self.mean_ms and not self.jitter_ms:
+            return 0.0
+        jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(self.mean_ms + jitter, 0.0) / 1000
+
+    def sleep(self):
+        seconds = self.delay()
+        if seconds:
+            time.sleep(seconds)
+
+
+NO_LATENCY = Latency()
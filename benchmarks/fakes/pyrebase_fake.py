@@ -0,0 +1,142 @@
+"""
+In-memory stand-in for a pyrebase Realtime Database handle
+
+Supports the calls the repositories make: child(), get().val(), set(),
+update() (multi-path, None deletes), remove(), order_by_key(), start_at(),
+limit_to_first() and shallow(). Each request sleeps for the injected
+latency, and reads are JSON round-tripped (like a real HTTP response) unless
+serialize=False; `bytes_read` adds up the size of those response bodies.
+
+    db = FakeFirebaseDatabase({"interviews": make_interviews(10000)}, latency=Latency(40, 10))
+    interviews = FirebaseInterviewRepository(db)
+"""
+import json
+import threading
+from collections import OrderedDict
+
+from benchmarks.fakes.latency import NO_LATENCY
+
+
+def _split(path):
+    return [part for part in path.strip("/").split("/") if part]
+
+
+class FakeResponse:
+    def __init__(self, value):
+        self._value = value
+
+    def val(self):
+        return self._value
+
+
+class FakeQuery:
+    """An immutable path + query; every call returns a new one"""
+
+    def __init__(self, db, parts, params=None):
+        self._db = db
+        self._parts = parts
+        self._params = params or {}
+
+    def child(self, *args):
+        parts = list(self._parts)
+        for arg in args:
+            parts.extend(_split(str(arg)))
+        return FakeQuery(self._db, parts, self._params)
+
+    def _with(self, **params):
+        return FakeQuery(self._db, self._parts, {**self._params, **params})
+
+    def order_by_key(self):
+        return self._with(order_by="$key")
+
+    def start_at(self, value):
+        return self._with(start_at=value)
+
+    def limit_to_first(self, count):
+        return self._with(limit_to_first=count)
+
+    def shallow(self):
+        return self._with(shallow=True)
+
+    def get(self, token=None):
+        return FakeResponse(self._db._read(self._parts, self._params))
+
+    def set(self, data, token=None):
+        self._db._write(self._parts, {"": data})
+
+    def update(self, data, token=None):
+        self._db._write(self._parts, data)
+
+    def remove(self, token=None):
+        self._db._write(self._parts, {"": None})
+
+
+class FakeFirebaseDatabase:
+    def __init__(self, data=None, latency=None, serialize=True):
+        self.data = data if data is not None else {}
+        self.latency = latency or NO_LATENCY
+        self.serialize = serialize
+        self.requests = 0
+        self.bytes_read = 0
+        self._lock = threading.Lock()
+
+    def child(self, *args):
+        return FakeQuery(self, []).child(*args)
+
+    def _request(self):
+        self.latency.sleep()
+        with self._lock:
+            self.requests += 1
+
+    def _read(self, parts, params):
+        self._request()
+        with self._lock:
+            node = self.data
+            for part in parts:
+                node = node.get(part) if isinstance(node, dict) else None
+            if isinstance(node, dict):
+                if params.get("shallow"):
+                    node = {key: True for key in node}
+                elif params.get("order_by") == "$key":
+                    keys = sorted(node)
+                    if params.get("start_at") is not None:
+                        keys = [key for key in keys if key >= params["start_at"]]
+                    if params.get("limit_to_first") is not None:
+                        keys = keys[:params["limit_to_first"]]
+                    node = OrderedDict((key, node[key]) for key in keys)
+            payload = json.dumps(node) if self.serialize else node
+            if self.serialize:
+                self.bytes_read += len(payload)
+        if not self.serialize:
+            return node
+        return json.loads(payload, object_pairs_hook=OrderedDict if params.get("order_by") else None)
+
+    def _write(self, parts, changes):
+        self._request()
+        if self.serialize:
+            changes = json.loads(json.dumps(changes))
+        with self._lock:
+            for key, value in changes.items():
+                self._set(parts + _split(key), value)
+
+    def _set(self, parts, value):
+        if not parts:
+            self.data = value if isinstance(value, dict) else {}
+            return
+        # Walk down, creating dicts on the way (only needed for non-deletes)
+        path = [self.data]
+        for part in parts[:-1]:
+            child = path[-1].get(part)
+            if not isinstance(child, dict):
+                if value is None:
+                    return
+                child = path[-1][part] = {}
+            path.append(child)
+        if value is None:
+            path[-1].pop(parts[-1], None)
+            # Firebase drops parents left empty
+            for node, part in zip(reversed(path[:-1]), reversed(parts[:-1])):
+                if node.get(part) == {}:
+                    del node[part]
+        else:
+            path[-1][parts[-1]] = value
@@ -0,0 +1,97 @@
+"""
+Stand-ins for edge-tts synthesis and Google speech recognition
+
+FakeCommunicate streams silent "MP3" bytes sized like Edge-TTS output
+(48 kbit/s, ~14 characters per second of speech) in a few chunks.
+FakeRecognizer.recognize_google returns a canned transcript.
+
+    from benchmarks.fakes import speech_fakes
+    speech_fakes.install_edge_tts(Latency(150, 50))   # `import edge_tts` gets the fake
+    recognizer = speech_fakes.FakeRecognizer(Latency(800, 200))
+    speech_fakes.install_speech_recognition(Latency(800, 200))  # or the whole module
+"""
+import sys
+import types
+import asyncio
+
+from benchmarks.fakes.latency import NO_LATENCY
+
+TTS_BYTES_PER_SECOND = 48000 // 8
+CHARS_PER_SECOND = 14
+CHUNK_COUNT = 4
+
+TRANSCRIPTS = [
+    "I built a small web app in Python with Flask and deployed it for my college club",
+    "I usually start by reproducing the bug and then narrowing it down with logging",
+    "In my final year project I coordinated a team of four and planned our sprints",
+]
+
+
+class FakeCommunicate:
+    """Drop-in for edge_tts.Communicate(text, voice)"""
+
+    latency = NO_LATENCY
+
+    def __init__(self, text, voice=None, **kwargs):
+        self.text = text
+        self.voice = voice
+
+    async def stream(self):
+        seconds = max(len(self.text) / CHARS_PER_SECOND, 0.5)
+        audio = bytes(int(seconds * TTS_BYTES_PER_SECOND))
+        chunk = -(-len(audio) // CHUNK_COUNT)
+        # Time to first byte, then the rest of the audio
+        await asyncio.sleep(self.latency.delay())
+        for start in range(0, len(audio), chunk):
+            yield {"type": "audio", "data": audio[start:start + chunk]}
+        yield {"type": "WordBoundary", "offset": 0, "duration": 0, "text": self.text}
+
+    async def save(self, path):
+        with open(path, "wb") as f:
+            async for chunk in self.stream():
+                if chunk["type"] == "audio":
+                    f.write(chunk["data"])
+
+
+def install_edge_tts(latency=None):
+    """Register a fake `edge_tts` module whose Communicate uses `latency`"""
+    communicate = type("Communicate", (FakeCommunicate,), {"latency": latency or NO_LATENCY})
+    module = types.ModuleType("edge_tts")
+    module.Communicate = communicate
+    sys.modules["edge_tts"] = module
+    return module
+
+
+class FakeRecognizer:
+    """Drop-in for speech_recognition.Recognizer (recognize_google only)"""
+
+    def __init__(self, latency=None):
+        self.latency = latency or NO_LATENCY
+        self.energy_threshold = 300
+        self.pause_threshold = 0.8
+        self.phrase_threshold = 0.3
+        self.calls = 0
+
+    def recognize_google(self, audio_data, language="en-US", **kwargs):
+        self.latency.sleep()
+        self.calls += 1
+        raw = getattr(audio_data, "frame_data", audio_data) or b""
+        return TRANSCRIPTS[len(raw) % len(TRANSCRIPTS)]
+
+
+class FakeAudioData:
+    def __init__(self, frame_data, sample_rate, sample_width):
+        self.frame_data = frame_data
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+
+
+def install_speech_recognition(latency=None):
+    """Register a fake `speech_recognition` module (Recognizer, AudioData, errors)"""
+    module = types.ModuleType("speech_recognition")
+    module.Recognizer = lambda: FakeRecognizer(latency)
+    module.AudioData = FakeAudioData
+    module.UnknownValueError = type("UnknownValueError", (Exception,), {})
+    module.RequestError = type("RequestError", (Exception,), {})
+    sys.modules["speech_recognition"] = module
+    return module
@@ -0,0 +1,284 @@
+"""
+Headless load test: N candidates and M HR users driving app.py in one process
+
+Every simulated user is a Streamlit AppTest session running in its own
+thread, against local stand-ins for all external services: SQLite instead of
+Firebase, and the fakes in benchmarks/fakes for Groq, edge-tts and speech
+recognition (with optional injected latency).
+
+Candidates log in, "upload" the sample resume (AppTest can't drive
+st.file_uploader, so the resume is parsed like start_interview does and put in
+the session), answer 10 questions through the text-answer form and open the
+summary. HR users log in and keep refreshing the dashboard until every
+candidate is done.
+
+Reports script-run latency per role, per-session memory, and thread/CPU
+saturation. Run it with increasing --candidates to find the knee.
+
+Usage: python -m benchmarks.load_test [--candidates 10] [--hr 2] [--latency-ms 300]
+           [--playback-wait 0] [--ramp 5] [--scoring-mode inline|background|batch]
+"""
+import argparse
+import os
+import pickle
+import random
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+PASSWORD = "load-test-password"
+SESSION_KEYS = ("user", "user_data", "interview_data", "extracted_skills", "extracted_projects",
+                "answer_recording", "pending_checkpoint")
+
+
+def configure_environment(args):
+    """Point the app at SQLite and the fakes; must run before any backend import"""
+    os.environ["DATA_BACKEND"] = "sqlite"
+    os.environ["SQLITE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="load-test-"), "interviews.db")
+    os.environ["GROQ_API_KEY"] = "load-test"
+    os.environ["QUESTION_PLAYBACK_WAIT"] = str(args.playback_wait)
+    os.environ["SCORING_MODE"] = args.scoring_mode
+
+    from benchmarks.fakes import groq_fake, speech_fakes
+    from benchmarks.fakes.latency import Latency
+    groq_fake.install(Latency(args.latency_ms, args.jitter_ms, seed=1))
+    speech_fakes.install_edge_tts(Latency(args.latency_ms / 2, args.jitter_ms / 2, seed=2))
+    speech_fakes.install_speech_recognition(Latency(args.latency_ms, args.jitter_ms, seed=3))
+
+
+def create_accounts(candidates, hr_users):
+    from backend.repository import get_auth, get_repositories
+    auth = get_auth()
+    _, users = get_repositories()
+    for role, count in (("candidate", candidates), ("hr", hr_users)):
+        for i in range(count):
+            email = f"{role}{i}@load.test"
+            uid = auth.create_user_with_email_and_password(email, PASSWORD)['localId']
+            users.set_user(uid, {"email": email, "role": role, "created_at": int(time.time() * 1000)})
+
+
+class SessionStats:
+    def __init__(self, role):
+        self.role = role
+        self.run_seconds = []
+        self.errors = []
+        self.state_bytes = 0
+        self.total_seconds = 0.0
+        self.finished = False
+
+
+def _run(at, stats):
+    start = time.perf_counter()
+    at.run()
+    stats.run_seconds.append(time.perf_counter() - start)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def _button(at, label):
+    for button in at.button:
+        if button.label == label:
+            return button
+    raise LookupError(f"no button {label!r}")
+
+
+def _login(at, stats, email, role):
+    _run(at, stats)
+    at.radio(key="role_selector").set_value(role)
+    _run(at, stats)
+    at.text_input[0].input(email)
+    at.text_input[1].input(PASSWORD)
+    _button(at, "Login").click()
+    _run(at, stats)
+    if "user" not in at.session_state:
+        raise RuntimeError(f"login failed for {email}")
+
+
+def candidate_session(index, args, stats):
+    from streamlit.testing.v1 import AppTest
+    from backend.resume_parser import ResumeParser
+    from backend.interview_summary import new_interview_data
+    from benchmarks.fakes.interview_data import SAMPLE_RESUME
+    from benchmarks.fakes.speech_fakes import TRANSCRIPTS
+
+    started = time.perf_counter()
+    try:
+        at = AppTest.from_file(APP_PATH, default_timeout=args.timeout)
+        _login(at, stats, f"candidate{index}@load.test", "Candidate")
+
+        # Upload: same parsing start_interview does for an uploaded resume
+        parser = ResumeParser()
+        at.session_state["extracted_skills"] = parser.extract_skills(SAMPLE_RESUME, grouped=True)
+        at.session_state["extracted_projects"] = parser.extract_projects(SAMPLE_RESUME)
+        at.session_state["interview_data"] = new_interview_data()
+        _run(at, stats)
+
+        rng = random.Random(index)
+        for number in range(1, 11):
+            _button(at, "🚀 Start Interview" if number == 1 else "➡️ Next Question").click()
+            _run(at, stats)
+            time.sleep(rng.uniform(0, args.think_time))
+            at.text_area(key="text_answer_input").input(f"{TRANSCRIPTS[number % len(TRANSCRIPTS)]} ({number})")
+            at.button(key="submit_text").click()
+            _run(at, stats)
+            if at.session_state["interview_data"]["question_count"] != number:
+                raise RuntimeError(f"answer {number} was not recorded")
+
+        # Summary
+        _run(at, stats)
+        state = {key: at.session_state[key] for key in SESSION_KEYS if key in at.session_state}
+        stats.state_bytes = len(pickle.dumps(state))
+        stats.finished = True
+        return at
+    except Exception as e:
+        stats.errors.append(f"{type(e).__name__}: {e}")
+    finally:
+        stats.total_seconds = time.perf_counter() - started
+
+
+def hr_session(index, args, stats, stop):
+    from streamlit.testing.v1 import AppTest
+
+    started = time.perf_counter()
+    try:
+        at = AppTest.from_file(APP_PATH, default_timeout=args.timeout)
+        _login(at, stats, f"hr{index}@load.test", "HR")
+        while not stop.is_set():
+            _button(at, "🔄 Refresh Data").click()
+            _run(at, stats)
+            stop.wait(args.hr_interval)
+        stats.finished = True
+    except Exception as e:
+        stats.errors.append(f"{type(e).__name__}: {e}")
+    finally:
+        stats.total_seconds = time.perf_counter() - started
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def rss_bytes():
+    """Current resident set size (Linux), else peak RSS"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class SaturationMonitor(threading.Thread):
+    """Samples live threads and CPU use while the test runs"""
+
+    def __init__(self, interval=0.5):
+        super().__init__(name="load-test-monitor", daemon=True)
+        self.interval = interval
+        self.threads = []
+        self.cpu_cores = []
+        self._stop_event = threading.Event()
+
+    def run(self):
+        last_wall, last_cpu = time.perf_counter(), time.process_time()
+        while not self._stop_event.wait(self.interval):
+            wall, cpu = time.perf_counter(), time.process_time()
+            self.threads.append(threading.active_count())
+            self.cpu_cores.append((cpu - last_cpu) / (wall - last_wall))
+            last_wall, last_cpu = wall, cpu
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def percentiles(values):
+    values = sorted(values)
+    if not values:
+        return "n/a"
+    pick = lambda q: values[min(len(values) - 1, int(q / 100 * len(values)))]
+    return f"p50 {pick(50) * 1000:8.1f} ms   p95 {pick(95) * 1000:8.1f} ms   p99 {pick(99) * 1000:8.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=10)
+    parser.add_argument("--hr", type=int, default=2, help="HR users refreshing the dashboard")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="fake Groq / STT latency (TTS gets half)")
+    parser.add_argument("--jitter-ms", type=float, default=100.0)
+    parser.add_argument("--playback-wait", type=float, default=0.0,
+                        help="seconds each question's audio is allowed to play (the app default is 20)")
+    parser.add_argument("--think-time", type=float, default=1.0, help="max seconds a candidate takes to answer")
+    parser.add_argument("--hr-interval", type=float, default=2.0, help="seconds between HR refreshes")
+    parser.add_argument("--scoring-mode", default="inline", choices=("inline", "background", "batch"),
+                        help="when answers are scored (see backend/deferred_scoring.py)")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which candidates start")
+    parser.add_argument("--timeout", type=float, default=120.0, help="per script run")
+    args = parser.parse_args()
+
+    configure_environment(args)
+    create_accounts(args.candidates, args.hr)
+
+    baseline_rss = rss_bytes()
+    baseline_threads = threading.active_count()
+    monitor = SaturationMonitor()
+    monitor.start()
+    started = time.perf_counter()
+
+    stop_hr = threading.Event()
+    hr_stats = [SessionStats("hr") for _ in range(args.hr)]
+    hr_threads = [threading.Thread(target=hr_session, args=(i, args, s, stop_hr), daemon=True)
+                  for i, s in enumerate(hr_stats)]
+    for thread in hr_threads:
+        thread.start()
+
+    candidate_stats = [SessionStats("candidate") for _ in range(args.candidates)]
+    sessions = [None] * args.candidates  # keep finished AppTests alive for the memory reading
+
+    def run_candidate(i):
+        sessions[i] = candidate_session(i, args, candidate_stats[i])
+
+    candidate_threads = []
+    for i in range(args.candidates):
+        thread = threading.Thread(target=run_candidate, args=(i,), daemon=True)
+        thread.start()
+        candidate_threads.append(thread)
+        time.sleep(args.ramp / max(args.candidates, 1))
+    for thread in candidate_threads:
+        thread.join()
+
+    session_rss = rss_bytes() - baseline_rss
+    stop_hr.set()
+    for thread in hr_threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    monitor.stop()
+
+    finished = [s for s in candidate_stats if s.finished]
+    all_sessions = candidate_stats + hr_stats
+    print(f"{args.candidates} candidates + {args.hr} HR users, fake latency {args.latency_ms:g} ms, "
+          f"{args.scoring_mode} scoring, {elapsed:.1f} s wall")
+    print(f"Completed interviews    {len(finished)}/{args.candidates} "
+          f"({len(finished) / elapsed * 60:.1f} per minute)")
+    print(f"Candidate script runs   {percentiles([t for s in candidate_stats for t in s.run_seconds])}")
+    print(f"HR script runs          {percentiles([t for s in hr_stats for t in s.run_seconds])}")
+    print(f"Interview duration      {percentiles([s.total_seconds for s in finished])}")
+    print(f"Memory                  +{session_rss / 2**20:.1f} MiB RSS, "
+          f"~{session_rss / max(len(all_sessions), 1) / 2**20:.2f} MiB per session; candidate session_state "
+          f"~{sum(s.state_bytes for s in finished) / max(len(finished), 1) / 1024:.1f} KiB")
+    if monitor.threads:
+        print(f"Threads                 baseline {baseline_threads}, peak {max(monitor.threads)}, "
+              f"mean {sum(monitor.threads) / len(monitor.threads):.0f}")
+        print(f"CPU                     mean {sum(monitor.cpu_cores) / len(monitor.cpu_cores):.2f} cores, "
+              f"peak {max(monitor.cpu_cores):.2f} cores (the GIL caps Python work near 1.0)")
+
+    errors = [(s.role, e) for s in all_sessions for e in s.errors]
+    for role, error in errors[:10]:
+        print(f"  {role} error: {error}")
+    if len(errors) > 10:
+        print(f"  ... {len(errors) - 10} more errors")
+
+
+if __name__ == "__main__":
+    main()
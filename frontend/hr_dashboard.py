@@ -1,56 +1,78 @@
 import streamlit as st
 import os
 import sys
-import json
-import dotenv
+import time
+import uuid
+import sqlite3
+import importlib.util
 from datetime import datetime
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from backend.repository import DATA_BACKEND, get_repositories
+from backend.cache import interview_cache
+from backend.firebase_client import get_firebase_db
+from backend.live_interviews import get_live_feed, token_expiry
+from backend.bulk_delete import get_current_job, start_delete_job
+from backend.retention import RETENTION_DAYS, archive_old_interviews, restore_interview, archive_is_durable
+from backend.interview_export import EXPORT_PAGE_SIZE, EXPORT_MAX_MB, export_interviews
+from backend.interview_analytics import (
+    get_frames, get_interview_groups, overview_metrics, score_histogram, performance_buckets
+)
 
-# Firebase configuration - get from session state
-def get_firebase_db():
-    """Get Firebase database from session state"""
-    if 'firebase_db' not in st.session_state:
-        # Try to get Firebase config from Streamlit secrets first
-        try:
-            if hasattr(st, 'secrets') and 'FIREBASE_CONFIG' in st.secrets:
-                firebaseConfig = dict(st.secrets["FIREBASE_CONFIG"])
-            else:
-                # Fallback to environment variables and secrets.toml
-                dotenv.load_dotenv()
-                firebaseConfig = os.getenv("FIREBASE_CONFIG")
-                
-                if not firebaseConfig:
-                    # Try to read from secrets.toml directly
-                    try:
-                        import toml
-                        secrets_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".streamlit", "secrets.toml")
-                        if os.path.exists(secrets_path):
-                            secrets = toml.load(secrets_path)
-                            if 'FIREBASE_CONFIG' in secrets:
-                                firebaseConfig = secrets['FIREBASE_CONFIG']
-                            else:
-                                st.error("❌ Firebase configuration not found in secrets.toml")
-                                return None
-                        else:
-                            st.error("❌ System configuration error. Please contact support.")
-                            return None
-                    except ImportError:
-                        st.error("❌ Missing toml package")
-                        return None
-                else:
-                    firebaseConfig = json.loads(firebaseConfig)
+LIVE_CHECK_SECONDS = 3
+DELETE_PROGRESS_SECONDS = 3
 
-            import pyrebase
-            firebase = pyrebase.initialize_app(firebaseConfig)
-            st.session_state.firebase_db = firebase.database()
-            st.session_state.firebase_auth = firebase.auth()
-        except Exception as e:
-            st.error("❌ Unable to connect to database. Please try again later.")
-            return None
+def load_interviews():
+    """Get all interviews via the HR cache shared by every session in this process"""
+    if st.session_state.get('hr_live_updates'):
+        # Render from the streamed in-memory copy once it has its first snapshot
+        aggregate = get_live_feed().aggregate
+        if aggregate.ready:
+            st.session_state.hr_live_version = aggregate.version
+            return aggregate.snapshot()
+    
+    interviews, _ = get_repositories()
+    if not interviews:
+        return None
+    return interview_cache.get(("interviews",), interviews.list_interviews)
+
+def display_live_updates():
+    """Toggle streaming updates from Firebase instead of reloading everything"""
+    if DATA_BACKEND != "firebase":
+        return
     
-    return st.session_state.firebase_db
+    if not st.toggle("📡 Live updates", key="hr_live_updates",
+                     help="Stream new results as they arrive instead of reloading all data"):
+        if 'hr_live_subscriber' in st.session_state:
+            get_live_feed().unsubscribe(st.session_state.pop('hr_live_subscriber'))
+        return
+    
+    start_live_feed()
+    watch_live_updates()
+
+def start_live_feed():
+    """Subscribe this session to the live feed (renewed on every live check)"""
+    db = get_firebase_db()
+    if db:
+        subscriber = st.session_state.setdefault('hr_live_subscriber', uuid.uuid4().hex)
+        get_live_feed().subscribe(subscriber, db, st.session_state.user.get('idToken'))
+
+@st.fragment(run_every=LIVE_CHECK_SECONDS)
+def watch_live_updates():
+    """Rerun the dashboard when the live feed has received new changes"""
+    feed = get_live_feed()
+    # Renew this session's lease; if the stream was cancelled (e.g. token revoked)
+    # this reconnects, and the cache serves until the new copy is ready
+    start_live_feed()
+    version = feed.aggregate.version
+    if version != st.session_state.get('hr_live_version'):
+        st.session_state.hr_live_version = version
+        st.rerun()
+    expires_at = token_expiry(st.session_state.user.get('idToken'))
+    if feed.aggregate.ready:
+        st.caption(f"📡 Live - {version} updates received")
+    elif not feed.running and expires_at is not None and expires_at <= time.time():
+        st.caption("📡 Session expired - log in again to resume live updates")
+    else:
+        st.caption("📡 Connecting - showing cached data")
 
 def display_data_management():
     """Display data management options for HR"""
@@ -60,33 +82,57 @@ def display_data_management():
     
     with col1:
         st.info("📊 **View Current Data**\nBelow you can see all interview results and analytics.")
+        
+        # Move old interviews to the monthly archives, keeping only their summaries
+        days = st.number_input("Archive interviews older than (days)", min_value=1, value=RETENTION_DAYS,
+                               key="archive_days")
+        durable = archive_is_durable()
+        if st.button("📦 Archive Old Interviews", disabled=not durable):
+            archive_interview_data(int(days))
+        if not durable:
+            st.caption("📦 Archiving needs `ARCHIVE_DIR` set to durable storage; this host's disk "
+                       "is not kept across restarts.")
     
     with col2:
-        st.warning("⚠️ **Delete All Data**\nPermanently remove all interview data from the system.")
+        st.warning("⚠️ **Delete Interview Data**\nPermanently remove interview data from the system.")
+        
+        # Optional scope - leave everything empty to delete all interviews
+        date_range = st.date_input("Interview dates (optional)", value=[], key="delete_date_range")
+        status = st.selectbox("Status", ["Any", "completed", "in_progress"], key="delete_status")
+        candidate = st.text_input("Candidate email or ID (optional)", key="delete_candidate").strip()
         
-        if st.button("🗑️ Delete All Interview Data", type="secondary"):
+        if st.button("🗑️ Delete Interview Data", type="secondary"):
+            st.session_state.delete_scope = build_delete_scope(date_range, status, candidate)
             st.session_state.show_delete_confirmation = True
     
     # Show confirmation dialog if delete was clicked
     if st.session_state.get('show_delete_confirmation', False):
+        scope = st.session_state.get('delete_scope', {})
         st.error("⚠️ **DANGER ZONE** ⚠️")
-        st.markdown("""
-        **You are about to delete ALL interview data for ALL candidates!**
-        
-        This action will:
-        - ❌ Remove all candidate interview results
-        - ❌ Delete all questions and answers  
-        - ❌ Clear all scores and feedback
-        - ❌ Remove all analytics data
-        
-        **This action CANNOT be undone!**
-        """)
+        if scope:
+            st.markdown(f"""
+            **You are about to delete interview data matching:** {describe_delete_scope(scope)}
+            
+            **This action CANNOT be undone!**
+            """)
+        else:
+            st.markdown("""
+            **You are about to delete ALL interview data for ALL candidates!**
+            
+            This action will:
+            - ❌ Remove all candidate interview results
+            - ❌ Delete all questions and answers  
+            - ❌ Clear all scores and feedback
+            - ❌ Remove all analytics data
+            
+            **This action CANNOT be undone!**
+            """)
         
         col1, col2, col3 = st.columns([1, 1, 1])
         
         with col1:
-            if st.button("✅ Yes, Delete Everything", type="primary"):
-                delete_all_interview_data()
+            if st.button("✅ Yes, Delete", type="primary"):
+                delete_all_interview_data(scope)
                 
         with col2:
             if st.button("❌ Cancel", type="secondary"):
@@ -95,12 +141,69 @@ def display_data_management():
         
         with col3:
             st.write("")  # Spacer
+    
+    display_delete_progress()
 
-def delete_all_interview_data():
-    """Delete all interview data from Firebase"""
+def archive_interview_data(days):
+    """Archive interviews older than `days`, with a progress bar"""
     try:
-        db = get_firebase_db()
-        if not db:
+        interviews, _ = get_repositories()
+        if not interviews:
+            st.error("❌ Unable to connect to database.")
+            return
+        
+        token = st.session_state.user.get('idToken')
+        bar = st.progress(0.0, text="📦 Archiving...")
+        total = max(interviews.count_candidates(token), 1)
+        count = archive_old_interviews(
+            interviews, token, days,
+            progress=lambda done, n: bar.progress(min(done / total, 1.0),
+                                                  text=f"📦 Archiving... {done}/{total} candidates, {n} archived"))
+        bar.empty()
+        st.success(f"✅ Archived {count} interviews older than {days} days.")
+    except Exception as e:
+        st.error(f"❌ Error archiving data: {str(e)}")
+
+def restore_archived_interview(uid, interview_id, partition):
+    """Bring one archived interview back into the hot data"""
+    interviews, _ = get_repositories()
+    if not interviews:
+        return
+    if restore_interview(interviews, uid, interview_id, partition, st.session_state.user.get('idToken')):
+        st.rerun()
+    else:
+        st.error("❌ Archived interview not found.")
+
+def build_delete_scope(date_range, status, candidate):
+    """Turn the delete form inputs into a bulk delete scope"""
+    scope = {}
+    if len(date_range) == 2:
+        start, end = date_range
+        scope['start_date'] = int(datetime.combine(start, datetime.min.time()).timestamp() * 1000)
+        scope['end_date'] = int(datetime.combine(end, datetime.max.time()).timestamp() * 1000)
+    if status != "Any":
+        scope['status'] = status
+    if candidate:
+        scope['candidate'] = candidate
+    return scope
+
+def describe_delete_scope(scope):
+    parts = []
+    if 'start_date' in scope:
+        start = datetime.fromtimestamp(scope['start_date'] / 1000).strftime('%Y-%m-%d')
+        end = datetime.fromtimestamp(scope['end_date'] / 1000).strftime('%Y-%m-%d')
+        parts.append(f"dates {start} to {end}")
+    if 'status' in scope:
+        parts.append(f"status '{scope['status']}'")
+    if 'candidate' in scope:
+        parts.append(f"candidate '{scope['candidate']}'")
+    return ", ".join(parts)
+
+def delete_all_interview_data(scope=None, resume_job_id=None):
+    """Start a background job deleting interview data page by page"""
+    try:
+        interviews, _ = get_repositories()
+        if not interviews:
             st.error("❌ Unable to connect to database.")
             return
         
@@ -111,24 +214,48 @@ def delete_all_interview_data():
         
         user_token = st.session_state.user['idToken']
         
-        with st.spinner("🗑️ Deleting all interview data..."):
-            # Delete all interviews
-            db.child("interviews").remove(user_token)
-            
-            # Clear the confirmation flag
-            st.session_state.show_delete_confirmation = False
-            
-            # Show success message
-            st.success("✅ All interview data has been permanently deleted!")
-            st.balloons()
-            
-            # Force page refresh to update the display
-            st.rerun()
+        # Deletes run in the background, one candidate shard at a time
+        start_delete_job(interviews, scope, user_token, resume_job_id)
+        
+        # Clear the confirmation flag
+        st.session_state.show_delete_confirmation = False
+        st.rerun()
             
     except Exception as e:
         st.error(f"❌ Error deleting data: {str(e)}")
         st.session_state.show_delete_confirmation = False
 
+@st.fragment(run_every=DELETE_PROGRESS_SECONDS)
+def display_delete_progress():
+    """Progress of the current delete job (polls while it runs)"""
+    job = get_current_job()
+    if job is None:
+        return
+    
+    progress = job.progress()
+    total = progress['candidates_total'] or 0
+    done = progress['candidates_done']
+    
+    # Unscoped jobs remove whole candidates without reading their interviews
+    if progress.get('candidates_deleted'):
+        deleted = f"{progress['candidates_deleted']} candidates' interviews"
+    else:
+        deleted = f"{progress['interviews_deleted']} interviews"
+    
+    if progress['status'] in ('pending', 'running'):
+        fraction = min(done / total, 1.0) if total else 0.0
+        st.progress(fraction, text=f"🗑️ Deleting... {done}/{total} candidates checked, {deleted} deleted")
+    elif progress['status'] == 'completed':
+        st.success(f"✅ Deleted {deleted}.")
+        if st.session_state.get('delete_job_seen') != job.job_id:
+            # Refresh the rest of the dashboard once the job has finished
+            st.session_state.delete_job_seen = job.job_id
+            st.rerun()
+    else:
+        st.error(f"❌ Delete stopped after {done}/{total} candidates: {progress['error']}")
+        if st.button("🔁 Resume Delete", key="resume_delete"):
+            delete_all_interview_data(resume_job_id=job.job_id)
+
 def hr_dashboard():
     """Simple HR Dashboard to view and analyze interview results"""
     st.title("🏢 HR Dashboard")
@@ -138,9 +265,19 @@ def hr_dashboard():
     with st.expander("🔧 Data Management"):
         display_data_management()
     
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        if st.button("🔄 Refresh Data"):
+            interview_cache.invalidate(("interviews",))
+    with col2:
+        display_live_updates()
+    
     st.markdown("---")
     
     display_interview_results()
+    
+    st.markdown("---")
+    display_export_options()
 
 def display_interview_results():
     """Display interview results section with analytics"""
@@ -149,79 +286,71 @@ def display_interview_results():
         st.warning("⚠️ Please log in to access the HR dashboard.")
         return
     
-    # Get Firebase data
-    db = get_firebase_db()
-    if not db:
-        return
-    
     try:
-        # Get all interviews from Firebase
-        interviews_data = db.child("interviews").get().val()
+        # Get all interviews (cached, refreshed in the background when stale)
+        interviews_data = load_interviews()
         
         if not interviews_data:
             st.info("📋 No interview data available yet.")
             return
         
-        # Process interview data for analytics
-        all_interviews = []
-        
-        for user_id, user_interviews in interviews_data.items():
-            for interview_id, interview_data in user_interviews.items():
-                interview_info = {
-                    'candidate_email': interview_data.get('user_email', 'Unknown'),
-                    'total_score': interview_data.get('total_score', 0),
-                    'average_score': interview_data.get('average_score', 0),
-                    'total_questions': interview_data.get('total_questions', 0),
-                    'status': interview_data.get('status', 'Unknown'),
-                    'interview_date': interview_data.get('interview_date', 0),
-                    'questions': interview_data.get('questions', {})
-                }
-                all_interviews.append(interview_info)
+        # Flatten into interview- and question-level frames (once per data load)
+        interviews_df, questions_df = get_frames(interviews_data)
         
-        if not all_interviews:
+        if interviews_df.empty:
             st.info("📋 No completed interviews found.")
             return
         
         # Display analytics overview
-        display_analytics_overview(all_interviews)
+        display_analytics_overview(interviews_df)
         
         st.markdown("---")
         
         # Display individual interview results
         st.subheader("📝 Individual Interview Results")
         
-        for i, interview in enumerate(all_interviews, 1):
-            with st.expander(f"Interview #{i} - {interview['candidate_email']} (Score: {interview['average_score']:.1f}/10)"):
+        # Grouped once per data load, not on every rerun
+        questions_by_interview, categories_by_interview = get_interview_groups(questions_df)
+        
+        for i, interview in enumerate(interviews_df.itertuples(index=False), 1):
+            key = (interview.uid, interview.interview_id)
+            with st.expander(f"Interview #{i} - {interview.candidate_email} (Score: {interview.average_score:.1f}/10)"):
                 
                 # Basic info
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    st.metric("Total Score", f"{interview['total_score']}/100")
-                    st.metric("Average Score", f"{interview['average_score']:.1f}/10")
+                    st.metric("Total Score", f"{interview.total_score}/{interview.total_questions * 10}")
+                    st.metric("Average Score", f"{interview.average_score:.1f}/10")
                 
                 with col2:
-                    st.metric("Questions Asked", interview['total_questions'])
-                    st.metric("Status", interview['status'].title())
+                    st.metric("Questions Asked", interview.total_questions)
+                    st.metric("Status", interview.status.title())
                 
                 with col3:
-                    if interview['interview_date']:
-                        date_str = datetime.fromtimestamp(interview['interview_date']/1000).strftime('%Y-%m-%d %H:%M')
+                    if interview.interview_date:
+                        date_str = datetime.fromtimestamp(interview.interview_date/1000).strftime('%Y-%m-%d %H:%M')
                         st.write(f"**Date:** {date_str}")
-                    st.write(f"**Email:** {interview['candidate_email']}")
+                    st.write(f"**Email:** {interview.candidate_email}")
                 
                 # Show category-wise performance
-                if interview['questions']:
-                    display_category_analysis(interview['questions'])
+                if key in categories_by_interview:
+                    display_category_analysis(categories_by_interview[key])
                 
                 # Show detailed Q&A
                 st.markdown("#### 💬 Questions & Answers")
-                for q_key, q_data in interview['questions'].items():
-                    st.markdown(f"**{q_key.upper()}: {q_data.get('category', 'Unknown').replace('_', ' ').title()}**")
-                    st.write(f"**Q:** {q_data.get('question', 'N/A')}")
-                    st.write(f"**A:** {q_data.get('answer', 'N/A')}")
+                if key not in questions_by_interview:
+                    if interview.archived:
+                        st.caption(f"📦 Archived ({interview.archived}) - only the summary is kept online.")
+                        if st.button("♻️ Restore Details", key=f"restore_{interview.uid}_{interview.interview_id}"):
+                            restore_archived_interview(interview.uid, interview.interview_id, interview.archived)
+                    continue
+                for q in questions_by_interview[key].itertuples(index=False):
+                    st.markdown(f"**{q.question_key.upper()}: {q.category_title}**")
+                    st.write(f"**Q:** {q.question}")
+                    st.write(f"**A:** {q.answer}")
                     
-                    score = q_data.get('score', 0)
+                    score = q.score
                     if score >= 8:
                         st.success(f"**Score:** {score}/10 ✅")
                     elif score >= 6:
@@ -229,97 +358,70 @@ def display_interview_results():
                     else:
                         st.error(f"**Score:** {score}/10 ❌")
                     
-                    st.write(f"**Feedback:** {q_data.get('justification', 'N/A')}")
+                    st.write(f"**Feedback:** {q.justification}")
                     st.markdown("---")
             
     except Exception as e:
         st.error("❌ Error loading interview data.")
 
-def display_analytics_overview(interviews):
+def display_analytics_overview(interviews_df):
     """Display analytics overview of all interviews"""
     st.subheader("📈 Analytics Overview")
     
-    # Calculate metrics
-    total_interviews = len(interviews)
-    avg_score = sum(interview['average_score'] for interview in interviews) / total_interviews
-    completed_interviews = len([i for i in interviews if i['status'].lower() == 'completed'])
+    # Calculate metrics (vectorized over the interview frame)
+    metrics = overview_metrics(interviews_df)
     
     # Display key metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Interviews", total_interviews)
+        st.metric("Total Interviews", metrics['total_interviews'])
     with col2:
-        st.metric("Average Score", f"{avg_score:.1f}/10")
+        st.metric("Average Score", f"{metrics['average_score']:.1f}/10")
     with col3:
-        st.metric("Completed", completed_interviews)
+        st.metric("Completed", metrics['completed'])
     with col4:
-        pass_rate = len([i for i in interviews if i['average_score'] >= 6]) / total_interviews * 100
-        st.metric("Pass Rate (6+)", f"{pass_rate:.1f}%")
+        st.metric("Pass Rate (6+)", f"{metrics['pass_rate']:.1f}%")
     
     # Score distribution chart
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("##### 📊 Score Distribution")
-        scores = [interview['average_score'] for interview in interviews]
+        # Binned server-side, so the chart size doesn't grow with the number of interviews
+        histogram = score_histogram(interviews_df)
         
         try:
             import plotly.express as px
-            fig = px.histogram(
-                x=scores, 
-                nbins=10, 
-                title="Interview Score Distribution",
-                labels={'x': 'Score', 'y': 'Number of Candidates'}
+            fig = px.bar(
+                histogram,
+                x='Score',
+                y='Number of Candidates',
+                title="Interview Score Distribution"
             )
-            fig.update_layout(height=400)
+            fig.update_layout(height=400, bargap=0.05)
             st.plotly_chart(fig, use_container_width=True)
         except ImportError:
             # Fallback to simple display if plotly not available
-            st.bar_chart(pd.DataFrame({'Scores': scores}))
+            st.bar_chart(histogram, x='Score', y='Number of Candidates')
     
     with col2:
         st.markdown("##### 🎯 Performance Categories")
         
         # Categorize performance
-        excellent = len([s for s in scores if s >= 9])
-        good = len([s for s in scores if 7 <= s < 9])
-        average = len([s for s in scores if 5 <= s < 7])
-        poor = len([s for s in scores if s < 5])
-        
-        performance_data = {
-            'Category': ['Excellent (9-10)', 'Good (7-8.9)', 'Average (5-6.9)', 'Poor (<5)'],
-            'Count': [excellent, good, average, poor],
-            'Percentage': [
-                f"{excellent/total_interviews*100:.1f}%",
-                f"{good/total_interviews*100:.1f}%", 
-                f"{average/total_interviews*100:.1f}%",
-                f"{poor/total_interviews*100:.1f}%"
-            ]
-        }
-        
-        df = pd.DataFrame(performance_data)
+        df = performance_buckets(interviews_df)
         st.dataframe(df, hide_index=True, use_container_width=True)
 
-def display_category_analysis(questions):
+def display_category_analysis(category_scores):
     """Display category-wise performance for an interview"""
     st.markdown("#### 📊 Category Performance")
     
-    # Calculate category scores
-    categories = {}
-    for q_data in questions.values():
-        category = q_data.get('category', 'unknown').replace('_', ' ').title()
-        score = q_data.get('score', 0)
-        
-        if category not in categories:
-            categories[category] = []
-        categories[category].append(score)
-    
     # Display category averages
-    cols = st.columns(len(categories))
-    for i, (category, scores) in enumerate(categories.items()):
+    cols = st.columns(len(category_scores))
+    for i, row in enumerate(category_scores.itertuples(index=False)):
         with cols[i]:
-            avg_score = sum(scores) / len(scores)
+            category = row.category_title
+            avg_score = row.score
             
             if avg_score >= 8:
                 st.success(f"**{category}**\n{avg_score:.1f}/10 ✅")
@@ -328,54 +430,53 @@ def display_category_analysis(questions):
             else:
                 st.error(f"**{category}**\n{avg_score:.1f}/10 ❌")
 
-# Simple export functionality
-def export_interview_data():
-    """Export interview data as CSV"""
-    try:
-        db = get_firebase_db()
-        if not db:
-            return
-        
-        interviews_data = db.child("interviews").get().val()
-        
-        if not interviews_data:
-            st.warning("No data to export.")
-            return
-        
-        # Flatten data for CSV export
-        export_rows = []
-        
-        for user_id, user_interviews in interviews_data.items():
-            for interview_id, interview_data in user_interviews.items():
-                row = {
-                    'Candidate Email': interview_data.get('user_email', 'Unknown'),
-                    'Total Score': interview_data.get('total_score', 0),
-                    'Average Score': interview_data.get('average_score', 0),
-                    'Total Questions': interview_data.get('total_questions', 0),
-                    'Status': interview_data.get('status', 'Unknown'),
-                    'Interview Date': datetime.fromtimestamp(interview_data.get('interview_date', 0)/1000).strftime('%Y-%m-%d %H:%M') if interview_data.get('interview_date') else 'N/A'
-                }
-                export_rows.append(row)
-        
-        df = pd.DataFrame(export_rows)
-        csv = df.to_csv(index=False)
-        
-        st.download_button(
-            label="📥 Download Interview Results (CSV)",
-            data=csv,
-            file_name=f"interview_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
-        )
-        
-    except Exception as e:
-        st.error("❌ Error exporting data.")
-
-# Add export button at the bottom
-if st.session_state.get('user'):
-    st.markdown("---")
+# Export functionality
+def display_export_options():
+    """Export options: interview or question level, CSV or Parquet"""
     st.subheader("📥 Export Data")
-    if st.button("Download All Results as CSV", type="secondary"):
-        export_interview_data()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        granularity = st.radio("Rows", ["interview", "question"], horizontal=True, key="export_granularity",
+                               format_func=lambda g: "One per interview" if g == "interview" else "One per question")
+    with col2:
+        formats = ["csv", "parquet"] if importlib.util.find_spec("pyarrow") else ["csv"]
+        fmt = st.radio("Format", formats, horizontal=True, key="export_format", format_func=str.upper)
+    st.caption(f"Exports are limited to about {EXPORT_MAX_MB} MB, since the file is held in memory for the download.")
+    
+    if st.button("Prepare Export", type="secondary"):
+        export_interview_data(granularity, fmt)
+
+def export_interview_data(granularity="interview", fmt="csv"):
+    """Export interview data page by page into a spooled temp file"""
+    interviews, _ = get_repositories()
+    if not interviews:
+        return
+    
+    token = st.session_state.user.get('idToken')
+    try:
+        with st.spinner("📦 Preparing export..."):
+            export_file, complete = export_interviews(
+                interviews.iter_pages(EXPORT_PAGE_SIZE, token), granularity, fmt
+            )
+            # st.download_button only takes str/bytes/text or binary IO it knows, not spooled files
+            with export_file:
+                data = export_file.read()
+    except (OSError, ValueError, sqlite3.Error) as e:
+        # Database reads (requests errors are OSErrors), pyarrow and temp file errors
+        st.error(f"❌ Error exporting data: {e}")
+        return
+    
+    if not complete:
+        st.warning(f"⚠️ The export reached the {EXPORT_MAX_MB} MB limit, so it only has the first "
+                   f"candidates. Interview-level rows or Parquet fit more.")
+    
+    st.download_button(
+        label=f"📥 Download Interview Results ({fmt.upper()})",
+        data=data,
+        file_name=f"interview_{granularity}_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}",
+        mime="text/csv" if fmt == "csv" else "application/vnd.apache.parquet"
+    )
 
 if __name__ == "__main__":
-    hr_dashboard()
\ No newline at end of file
+    hr_dashboard()
@@ -3,69 +3,27 @@ import os
 import sys
 import uuid
 import time
-import json
-import dotenv
+from backend.repository import get_repositories
+from backend.cache import interview_cache
 from backend.question_generator import QuestionGenerator
+from backend.question_similarity import QuestionIndex, subject_terms
 from backend.resume_parser import ResumeParser, read_resume_text
-from backend.cloud_speech_io import SpeechIO
-from backend.answer_analyzer import analyze_answer_with_ai
-from backend.interview_summary import show_interview_summary, show_question_feedback
-
-# Firebase configuration - get from session state instead of reloading
-def get_firebase_db():
-    """Get Firebase database from session state"""
-    if 'firebase_db' not in st.session_state:
-        # Try to get Firebase config from Streamlit secrets first
-        try:
-            if hasattr(st, 'secrets') and 'FIREBASE_CONFIG' in st.secrets:
-                firebaseConfig = dict(st.secrets["FIREBASE_CONFIG"])
-            else:
-                # Fallback to environment variables and secrets.toml
-                dotenv.load_dotenv()
-                firebaseConfig = os.getenv("FIREBASE_CONFIG")
-                
-                if not firebaseConfig:
-                    # Try to read from secrets.toml directly
-                    try:
-                        import toml
-                        secrets_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".streamlit", "secrets.toml")
-                        if os.path.exists(secrets_path):
-                            secrets = toml.load(secrets_path)
-                            if 'FIREBASE_CONFIG' in secrets:
-                                firebaseConfig = secrets['FIREBASE_CONFIG']
-                            else:
-                                st.error("❌ Firebase configuration not found in secrets.toml")
-                                return None
-                        else:
-                            st.error("❌ System configuration error. Please contact support.")
-                            return None
-                    except ImportError:
-                        st.error("❌ Missing toml package")
-                        return None
-                else:
-                    firebaseConfig = json.loads(firebaseConfig)
-
-            import pyrebase
-            firebase = pyrebase.initialize_app(firebaseConfig)
-            st.session_state.firebase_db = firebase.database()
-            st.session_state.firebase_auth = firebase.auth()
-        except Exception as e:
-            st.error(f"❌ Unable to connect to database: {str(e)}")
-            return None
-    
-    return st.session_state.firebase_db
-
-def get_firebase_auth():
-    """Get Firebase auth from session state"""
-    if 'firebase_auth' not in st.session_state:
-        get_firebase_db()  # This will initialize both db and auth
-    return st.session_state.firebase_auth
+from backend.cloud_speech_io import SpeechIO, MAX_ANSWER_SECONDS, format_duration
+from backend.answer_analyzer import AnswerAnalysisStream
+from backend.interview_summary import show_interview_summary, show_question_feedback, new_interview_data
+from backend.telemetry import span, count
+from backend.session_checkpoint import save_checkpoint, load_checkpoint, clear_checkpoint, restore_checkpoint
+from backend.adaptive_interview import INTERVIEW_MODE, MAX_QUESTIONS, interview_finished, next_step, should_stop
+from backend.deferred_scoring import DEFERRED, SCORING_MODE, submit, pending_answers, collect, apply_scores, forget
 
 DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
 os.makedirs(DATA_DIR, exist_ok=True)
 
-def store_answer_to_firebase(db, candidate_uid, interview_id, question_data):
-    """Store answer to Firebase - simplified version"""
+# Seconds to let the question audio play before showing the answer controls
+QUESTION_PLAYBACK_WAIT = float(os.getenv("QUESTION_PLAYBACK_WAIT", "20"))
+
+def store_answer_to_firebase(interviews, users, candidate_uid, interview_id, question_data):
+    """Store answer to the database - simplified version"""
     try:
         if 'user' not in st.session_state or 'idToken' not in st.session_state.user:
             st.error("❌ Session expired. Please log in again.")
@@ -84,10 +42,10 @@ def store_answer_to_firebase(db, candidate_uid, interview_id, question_data):
         }
         
         # Store question
-        db.child("interviews").child(candidate_uid).child(interview_id).child("questions").child(question_key).set(simple_question_data, user_token)
+        interviews.save_question(candidate_uid, interview_id, question_key, simple_question_data, user_token)
         
         # Update total score and average
-        current_interview = db.child("interviews").child(candidate_uid).child(interview_id).get(user_token).val()
+        current_interview = interviews.get_interview(candidate_uid, interview_id, user_token)
         
         if current_interview:
             current_total = current_interview.get('total_score', 0)
@@ -108,10 +66,10 @@ def store_answer_to_firebase(db, candidate_uid, interview_id, question_data):
             "total_questions": new_question_count,
             "average_score": new_average,
             "interview_date": int(time.time() * 1000),
-            "status": "completed" if new_question_count >= 10 else "in_progress"
+            "status": "completed" if new_question_count >= MAX_QUESTIONS or question_data.get('final') else "in_progress"
         }
         
-        db.child("interviews").child(candidate_uid).child(interview_id).update(interview_summary, user_token)
+        interviews.update_summary(candidate_uid, interview_id, interview_summary, user_token)
         
         # Update user profile
         user_update = {
@@ -119,7 +77,10 @@ def store_answer_to_firebase(db, candidate_uid, interview_id, question_data):
             "total_interviews": 1,
             "last_interview": int(time.time() * 1000)
         }
-        db.child("users").child(candidate_uid).update(user_update, user_token)
+        users.update_user(candidate_uid, user_update, user_token)
+        
+        # HR views must not keep serving the pre-write data
+        interview_cache.invalidate(("interviews",))
         
         return True
     except Exception as e:
@@ -127,41 +88,95 @@ def store_answer_to_firebase(db, candidate_uid, interview_id, question_data):
         return False
 
 
+def checkpoint_session():
+    """Save a resumable checkpoint of the interview (cleared once it's complete)"""
+    _, users = get_repositories()
+    if not users or 'user' not in st.session_state:
+        return
+    uid = st.session_state.user['localId']
+    token = st.session_state.user.get('idToken')
+    # Keep the checkpoint while deferred scores are outstanding, so they aren't lost
+    if interview_finished(st.session_state.interview_data) and not pending_answers(st.session_state.interview_data):
+        clear_checkpoint(users, uid, token)
+    else:
+        save_checkpoint(users, uid, st.session_state, token)
+
+
+def offer_resume():
+    """Offer to continue an unfinished interview saved before a disconnect.
+
+    Returns True while the choice is pending.
+    """
+    if 'pending_checkpoint' not in st.session_state:
+        _, users = get_repositories()
+        state = None
+        if users and 'interview_data' not in st.session_state:
+            state = load_checkpoint(users, st.session_state.user['localId'], st.session_state.user.get('idToken'))
+        st.session_state.pending_checkpoint = state
+    
+    state = st.session_state.pending_checkpoint
+    if not state:
+        return False
+    
+    answered = state['interview_data'].get('question_count', 0)
+    st.info(f"⏸️ You have an unfinished interview ({answered}/{MAX_QUESTIONS} questions answered).")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("▶️ Resume Interview", type="primary"):
+            restore_checkpoint(st.session_state, state)
+            st.session_state.pending_checkpoint = None
+            st.rerun()
+    with col2:
+        if st.button("🆕 Start Over"):
+            _, users = get_repositories()
+            if users:
+                clear_checkpoint(users, st.session_state.user['localId'], st.session_state.user.get('idToken'))
+            forget(state['interview_data'].get('interview_id'))
+            st.session_state.pending_checkpoint = None
+            st.rerun()
+    return True
+
+
+def timed_question_stream(deltas, category):
+    """Pass the question tokens through, timing only the LLM stream as
+    question_generation; speaking it is timed separately as tts"""
+    with span("question_generation", category=category, streamed=True) as generation_span:
+        try:
+            yield from deltas
+        except GeneratorExit:
+            # The consumer stopped early (e.g. the question was a repeat)
+            generation_span.set(stopped_early=True)
+
+
 def timed_interview_session():
     """Simple interview function - exactly 10 questions (2 per category) - Voice Only"""
     # Initialize interview data
     if 'interview_data' not in st.session_state:
-        st.session_state.interview_data = {
-            'question_count': 0,
-            'interview_id': str(uuid.uuid4()),
-            'current_question': None,
-            'categories_used': {
-                'technical_skills': 0,
-                'communication': 0,
-                'problem_solving': 0,
-                'leadership': 0,
-                'experience': 0
-            },
-            'total_score': 0,
-            'voice_welcome': False
-        }
+        st.session_state.interview_data = new_interview_data()
 
-    st.subheader("🎤 Voice-Only AI Interview - 10 Questions Total")
+    if INTERVIEW_MODE == "adaptive":
+        st.subheader(f"🎤 Voice-Only AI Interview - Up to {MAX_QUESTIONS} Questions")
+    else:
+        st.subheader(f"🎤 Voice-Only AI Interview - {MAX_QUESTIONS} Questions Total")
     
     # Welcome message for voice interview
     if not st.session_state.interview_data.get('voice_welcome', False):
         st.info("🔊 **Voice Interview Mode**: Questions will be spoken aloud, and you'll provide answers using your microphone. Make sure your speakers and microphone are working properly.")
         st.session_state.interview_data['voice_welcome'] = True
     
+    if INTERVIEW_MODE == "adaptive":
+        st.caption("🎯 Questions adapt to your answers, and the interview may end early once your score is clear.")
+    
     # Check if interview is completed
-    if st.session_state.interview_data['question_count'] >= 10:
-        show_interview_summary()
+    if interview_finished(st.session_state.interview_data):
+        show_interview_summary(on_scored=persist_scored_answer)
         return
     
     # Progress bar - show current question number (already answered + 1)
     current_question_num = st.session_state.interview_data['question_count'] + 1
-    progress = current_question_num / 10
-    st.progress(progress, text=f"Question {current_question_num}/10")
+    progress = current_question_num / MAX_QUESTIONS
+    st.progress(progress, text=f"Question {current_question_num}/{MAX_QUESTIONS}"
+                + (" (may end early)" if INTERVIEW_MODE == "adaptive" else ""))
     
     # Current question display
     if st.session_state.interview_data.get('current_question'):
@@ -173,7 +188,7 @@ def timed_interview_session():
         
         # Simple voice answer input
         st.subheader("🎤 Record Your Answer")
-        st.info("🔊 Click the microphone button below to record up to 30 seconds. Your speech will be converted to text automatically.")
+        st.info(f"🔊 Click the microphone button below to record your answer (up to {format_duration(MAX_ANSWER_SECONDS)}). Your speech will be converted to text automatically.")
         
         # Add visual recording instructions
         with st.expander("📋 Recording Tips for Better Results", expanded=False):
@@ -246,27 +261,62 @@ def generate_and_ask_question():
         st.error("❌ Please upload your resume first before starting the interview.")
         return
     
-    # Determine which category to ask next
-    categories = ['technical_skills', 'communication', 'problem_solving', 'leadership', 'experience']
-    current_category = None
-    
-    # Find category that needs more questions (each category should have exactly 2)
-    for category in categories:
-        if st.session_state.interview_data['categories_used'][category] < 2:
-            current_category = category
-            break
+    # Pick up background scores that are already done, so the adaptive mode can use them
+    if SCORING_MODE == "background":
+        interview_data = st.session_state.interview_data
+        results = collect(interview_data['interview_id'], pending_answers(interview_data), wait=False)
+        apply_scores(interview_data, results, persist_scored_answer)
     
-    if not current_category:
+    # Determine which category to ask next (and how hard, in adaptive mode)
+    step = next_step(st.session_state.interview_data)
+    if not step:
         st.error("❌ All categories completed!")
         return
+    current_category, difficulty = step
     
     try:
         question_generator = QuestionGenerator()
         skills = st.session_state.get('extracted_skills', {})
         projects = st.session_state.get('extracted_projects', [])
         
-        # Generate question for specific category
-        question, _ = question_generator.generate_ai_question(skills, projects, set(), current_category)
+        speech_io = SpeechIO()
+        # Show which question number this will be (current count + 1)
+        next_question_num = st.session_state.interview_data['question_count'] + 1
+        st.success(f"🔊 Question {next_question_num}/{MAX_QUESTIONS} - {current_category.replace('_', ' ').title()}")
+        
+        asked_questions = {a['question'] for a in st.session_state.interview_data.get('answers', {}).values()}
+        asked_index = QuestionIndex(asked_questions, key_terms=subject_terms(skills, projects))
+        
+        # Stream the question token by token; speech starts with its first sentence,
+        # once it is clear the question isn't a repeat
+        question = None
+        asked_at = time.monotonic()
+        try:
+            question = speech_io.speak_stream(
+                timed_question_stream(
+                    question_generator.stream_ai_question(skills, projects, current_category, difficulty),
+                    current_category),
+                accept=lambda text: not asked_index.is_duplicate(text)
+            )
+            if question is None:
+                count("question_duplicates", source="stream")
+                st.info("🔁 That question was already asked - here's another one.")
+            else:
+                question = question.strip()
+        except Exception:
+            question = None
+        
+        if not question:
+            # Streaming failed or repeated a question - fall back to a complete (or template) question
+            with span("question_generation", category=current_category):
+                question, _ = question_generator.generate_ai_question(
+                    skills, projects, asked_questions, current_category, difficulty
+                )
+            if question:
+                try:
+                    speech_io.speak(question)
+                except Exception:
+                    st.warning("⚠️ Voice output failed, but question is ready.")
         
         if question:
             # Update question data and category counter, but don't increment question_count yet
@@ -274,24 +324,15 @@ def generate_and_ask_question():
             st.session_state.interview_data['categories_used'][current_category] += 1
             st.session_state.interview_data['current_question'] = question
             st.session_state.interview_data['current_category'] = current_category
+            checkpoint_session()
             
-            # Speak the question aloud
-            try:
-                speech_io = SpeechIO()
-                # Show which question number this will be (current count + 1)
-                next_question_num = st.session_state.interview_data['question_count'] + 1
-                st.success(f"🔊 Speaking Question {next_question_num}/10 - {current_category.replace('_', ' ').title()}")
-                speech_io.speak(question)
-                
-                # Add a small delay to let audio start, then refresh to show recording interface
-                import time
-                time.sleep(20)  # Give audio time to start
-                st.rerun()  # Refresh to show the recording interface
-            except Exception as e:
-                st.warning("⚠️ Voice output failed, but question is ready.")
-                st.rerun()  # Still refresh even if audio fails
-            
-            # No st.rerun() needed - let the audio play without interruption
+            # Let the audio play, then refresh to show the recording interface. Speaking already
+            # blocked until the last sentence started, so only wait out the rest
+            wait = QUESTION_PLAYBACK_WAIT - (time.monotonic() - asked_at)
+            if speech_io.audio_ends_at:
+                wait = min(wait, speech_io.audio_ends_at - time.monotonic())
+            time.sleep(max(wait, 0))
+            st.rerun()
         else:
             st.warning("⚠️ Unable to generate question. Please try again.")
             
@@ -311,12 +352,27 @@ def process_answer(answer):
         st.error("❌ No question to answer. Please generate a question first.")
         return
     
+    if DEFERRED:
+        record_deferred_answer(answer, current_question, current_category)
+        return
+    
     try:
         # Analyze answer with AI
         question_generator = QuestionGenerator()
-        score, justification, category = analyze_answer_with_ai(
-            answer, current_question, question_generator.client
-        )
+        with span("scoring", category=current_category):
+            # Show the feedback while the model is still writing it
+            st.markdown("**🤖 AI Feedback:**")
+            analysis = AnswerAnalysisStream(answer, current_question, question_generator.client,
+                                            category=current_category)
+            feedback = st.empty()
+            with feedback:
+                st.write_stream(analysis)
+            score, justification, category = analysis.result()
+            if analysis.escalated:
+                # A second, larger model re-scored the answer; show what is actually stored
+                with feedback.container():
+                    st.write(justification)
+                    st.caption("🔁 Your answer was re-evaluated for a more careful score - this is the final feedback.")
         
         if score is not None:
             # Use the category from question generation if available
@@ -330,23 +386,41 @@ def process_answer(answer):
                 "score": score,
                 "justification": justification,
                 "timestamp": int(time.time() * 1000),
-                "question_number": st.session_state.interview_data['question_count'] + 1
+                "question_number": st.session_state.interview_data['question_count'] + 1,
+                # Whether this answer ends the interview (always at 10; earlier once the score is settled)
+                "final": should_stop(st.session_state.interview_data, final_category, score)
             }
             
-            # Store to Firebase
-            db = get_firebase_db()
-            if db:
+            # Store to the database
+            interviews, users = get_repositories()
+            if interviews:
                 candidate_uid = st.session_state.user['localId']
                 interview_id = st.session_state.interview_data['interview_id']
-                store_answer_to_firebase(db, candidate_uid, interview_id, question_data)
+                with span("persistence", backend=type(interviews).__name__):
+                    store_answer_to_firebase(interviews, users, candidate_uid, interview_id, question_data)
+            
+            # Keep the answer in session so the summary doesn't need a database read
+            st.session_state.interview_data.setdefault('answers', {})[f"q{question_data['question_number']}"] = {
+                "category": final_category,
+                "question": current_question,
+                "answer": answer,
+                "score": score,
+                "justification": justification,
+                "timestamp": question_data['timestamp']
+            }
             
             # Update total score and increment question counter
             st.session_state.interview_data['total_score'] += score
             st.session_state.interview_data['question_count'] += 1
+            if question_data['final']:
+                st.session_state.interview_data['finished'] = True
+                if st.session_state.interview_data['question_count'] < MAX_QUESTIONS:
+                    count("interviews_stopped_early", questions=st.session_state.interview_data['question_count'])
             
             # Clear current question
             st.session_state.interview_data['current_question'] = None
             st.session_state.interview_data['current_category'] = None
+            checkpoint_session()
             
             # Show feedback using modular function
             show_question_feedback(score, justification, final_category)
@@ -364,7 +438,7 @@ def process_answer(answer):
                 pass  # Continue if voice feedback fails
             
             # Check if interview is complete
-            if st.session_state.interview_data['question_count'] >= 10:
+            if interview_finished(st.session_state.interview_data):
                 st.success("🎉 Interview completed! Scroll down to see your complete results.")
                 try:
                     speech_io = SpeechIO()
@@ -379,9 +453,72 @@ def process_answer(answer):
     except Exception:
         st.error("❌ Error analyzing answer. Please try again.")
 
+def record_deferred_answer(answer, current_question, current_category):
+    """Keep the answer unscored and move on; it is scored in the background or at the end"""
+    interview_data = st.session_state.interview_data
+    if INTERVIEW_MODE == "adaptive":
+        # Let the stop decision use every background score that is already in
+        results = collect(interview_data['interview_id'], pending_answers(interview_data), wait=False)
+        apply_scores(interview_data, results, persist_scored_answer)
+    q_key = f"q{interview_data['question_count'] + 1}"
+    final = should_stop(interview_data, current_category, None)
+    record = {
+        "category": current_category,
+        "question": current_question,
+        "answer": answer,
+        "score": None,
+        "justification": None,
+        "timestamp": int(time.time() * 1000),
+        "pending": True
+    }
+    interview_data.setdefault('answers', {})[q_key] = record
+    if SCORING_MODE == "background":
+        submit(interview_data['interview_id'], q_key, record)
+    
+    interview_data['question_count'] += 1
+    if final:
+        interview_data['finished'] = True
+    interview_data['current_question'] = None
+    interview_data['current_category'] = None
+    checkpoint_session()
+    
+    st.success("✅ Answer recorded! Your answers are scored while you continue.")
+    st.rerun()
+
+
+def persist_scored_answer(q_key, record):
+    """Store an answer once its deferred score has arrived; True if it was stored"""
+    interview_data = st.session_state.interview_data
+    interviews, users = get_repositories()
+    # The answer being stored still counts as pending until this returns True
+    last = interview_finished(interview_data) and not (pending_answers(interview_data).keys() - {q_key})
+    if interviews:
+        question_data = {
+            "question_text": record['question'],
+            "category": record['category'],
+            "answer": record['answer'],
+            "score": record['score'],
+            "justification": record['justification'],
+            "timestamp": record['timestamp'],
+            "question_number": int(q_key[1:]),
+            "final": last
+        }
+        with span("persistence", backend=type(interviews).__name__, deferred=True):
+            if not store_answer_to_firebase(interviews, users, st.session_state.user['localId'],
+                                            interview_data['interview_id'], question_data):
+                return False
+    if last and users:
+        clear_checkpoint(users, st.session_state.user['localId'], st.session_state.user.get('idToken'))
+    return True
+
+
 def start_interview():
     st.title("📄 AI Interviewer - Resume Upload")
 
+    # A reconnecting candidate continues from their last checkpoint
+    if 'user' in st.session_state and offer_resume():
+        return
+
     uploaded_file = st.file_uploader("Upload your resume (PDF or TXT)", type=["pdf", "txt"])
 
     if uploaded_file:
@@ -445,6 +582,9 @@ def start_interview():
             
         except Exception:
             st.error("❌ Error processing your resume. Please try uploading again or contact support.")
+    elif 'interview_data' in st.session_state and 'extracted_skills' in st.session_state:
+        # Resumed (or already parsed) - no need to upload the resume again
+        timed_interview_session()
 
 if __name__ == "__main__":
     start_interview()
\ No newline at end of file
@@ -0,0 +1,60 @@
+import json
+
+from backend.answer_analyzer import AnswerAnalysisStream, _analysis_prompt
+from benchmarks.fakes.groq_fake import FakeGroq, canned_reply
+
+REPAIRED = {"score": 7, "justification": "Relevant example, thin on results.", "category": "technical"}
+
+
+def test_streamed_justification():
+    client = FakeGroq()
+    analysis = AnswerAnalysisStream("I built a Flask API", "Describe a Python project", client, model="small")
+    shown = "".join(analysis)
+    score, justification, _ = analysis.result()
+    assert score is not None
+    assert shown == justification
+    assert client.calls == 1
+
+
+def test_free_text_reply_is_repaired_and_shown():
+    def reply(prompt):
+        if "could not be parsed" in prompt:
+            return json.dumps(REPAIRED)
+        return "Score: seven. Relevant example, thin on results."
+
+    client = FakeGroq(reply=reply)
+    analysis = AnswerAnalysisStream("I built a Flask API", "Describe a Python project", client, model="small")
+    shown = "".join(analysis)
+    assert analysis.result() == (7, REPAIRED["justification"], "technical")
+    assert shown == REPAIRED["justification"]
+    assert client.calls == 2  # the stream and one repair
+
+
+def test_broken_stream_is_scored_in_json_mode():
+    client = FakeGroq()
+
+    def broken_stream():
+        yield '{"sco'
+        raise ConnectionError("stream dropped")
+
+    analysis = AnswerAnalysisStream("I built a Flask API", "Describe a Python project", client, model="small")
+    analysis._chunks = broken_stream()
+    shown = "".join(analysis)
+    expected = json.loads(canned_reply(_analysis_prompt("I built a Flask API", "Describe a Python project")))
+    expected = expected["justification"]
+    assert analysis.result()[1] == expected
+    assert shown == expected
+
+
+
+def test_escalated_result_is_flagged():
+    replies = iter([
+        {"score": 6, "justification": "first look", "category": "technical"},  # borderline on the small model
+        {"score": 8, "justification": "second look", "category": "technical"},
+    ])
+    client = FakeGroq(reply=lambda prompt: json.dumps(next(replies)))
+    answer = "I built a Flask API for our course project and deployed it with Docker on a small server."
+    analysis = AnswerAnalysisStream(answer, "Describe a Python project you built", client)
+    assert "".join(analysis) == "first look"
+    assert analysis.result() == (8, "second look", "technical")
+    assert analysis.escalated
@@ -0,0 +1,64 @@
+import pytest
+
+from backend import bulk_delete
+from backend.bulk_delete import BulkDeleteJob, matches_scope
+from backend.repository import FirebaseInterviewRepository
+from benchmarks.fakes.interview_data import make_interviews
+from benchmarks.fakes.pyrebase_fake import FakeFirebaseDatabase
+
+
+@pytest.fixture(autouse=True)
+def _jobs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_delete, "JOBS_DIR", str(tmp_path))
+
+
+def _setup(n=400):
+    data = make_interviews(n)
+    db = FakeFirebaseDatabase({"interviews": data})
+    return data, db, FirebaseInterviewRepository(db)
+
+
+def test_unscoped_delete_reads_only_keys():
+    data, db, repo = _setup()
+    candidates = len(data)
+    repo.list_interviews()
+    full, db.bytes_read = db.bytes_read, 0
+
+    job = BulkDeleteJob({})
+    job.run(repo)
+
+    state = job.progress()
+    assert state['status'] == 'completed', state['error']
+    assert state['candidates_total'] == candidates
+    assert state['candidates_deleted'] == candidates
+    assert not db.data.get('interviews')
+    assert db.bytes_read * 50 < full
+
+
+def test_unscoped_delete_resumes_after_checkpoint():
+    data, db, repo = _setup()
+    uids = sorted(data)
+    job = BulkDeleteJob({})
+    job.state.update(last_uid=uids[9], candidates_total=len(uids), candidates_done=10)
+
+    job.run(repo)
+
+    assert sorted(db.data['interviews']) == uids[:10]
+    assert job.progress()['candidates_done'] == len(uids)
+
+
+def test_status_scope_skips_records_without_status():
+    record = {"interview_date": 0, "status": None}
+    assert not matches_scope("uid1", record, {"status": "completed"})
+    assert matches_scope("uid1", record, {})
+
+    data, db, repo = _setup(4)
+    uid = next(iter(data))
+    interview_id = next(iter(data[uid]))
+    data[uid][interview_id]['status'] = None
+
+    job = BulkDeleteJob({"status": "no-such-status"})
+    job.run(repo)
+
+    assert job.progress()['status'] == 'completed', job.progress()['error']
+    assert interview_id in db.data['interviews'][uid]
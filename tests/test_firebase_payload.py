@@ -0,0 +1,63 @@
+import json
+
+from backend.repository import FirebaseInterviewRepository
+from benchmarks.fakes.interview_data import make_interviews
+from benchmarks.fakes.pyrebase_fake import FakeFirebaseDatabase
+
+
+def _setup(n=200):
+    data = make_interviews(n)
+    db = FakeFirebaseDatabase({"interviews": data})
+    return data, db, FirebaseInterviewRepository(db)
+
+
+def _full_fetch_bytes(repo, db):
+    db.bytes_read = 0
+    repo.list_interviews()
+    return db.bytes_read
+
+
+def test_summary_reads_one_interview_not_the_tree():
+    data, db, repo = _setup()
+    full = _full_fetch_bytes(repo, db)
+    uid = next(iter(data))
+    interview_id = next(iter(data[uid]))
+
+    db.bytes_read = 0
+    assert repo.get_interview(uid, interview_id) == data[uid][interview_id]
+    assert db.bytes_read == len(json.dumps(data[uid][interview_id]))
+    assert db.bytes_read * 100 < full
+
+
+def test_shallow_count_reads_only_keys():
+    data, db, repo = _setup()
+    full = _full_fetch_bytes(repo, db)
+
+    db.bytes_read = 0
+    assert repo.count_candidates() == len(data)
+    assert db.bytes_read * 50 < full
+
+
+def test_pages_read_a_page_at_a_time():
+    data, db, repo = _setup()
+    full = _full_fetch_bytes(repo, db)
+
+    db.bytes_read = 0
+    pages = repo.iter_pages(page_size=10)
+    first = next(pages)
+    assert len(first) == 10
+    assert db.bytes_read * 5 < full  # 10 of 100 candidates
+
+    rest = list(pages)
+    assert sum(len(page) for page in rest) == len(data) - 10
+    assert db.bytes_read < full * 1.1  # every candidate is read once (plus one overlap key per page)
+
+
+def test_summary_read_does_not_grow_with_the_dataset():
+    read = []
+    for n in (20, 2000):
+        data, db, repo = _setup(n)
+        db.bytes_read = 0
+        repo.get_interview("uid0000000", "interview0000000")
+        read.append(db.bytes_read)
+    assert read[0] == read[1]
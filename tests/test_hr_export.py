@@ -0,0 +1,55 @@
+import csv
+import io
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from backend.repository import FirebaseInterviewRepository
+from benchmarks.fakes.interview_data import make_interviews
+from benchmarks.fakes.pyrebase_fake import FakeFirebaseDatabase
+
+
+def _export_script(fmt):
+    import streamlit as st
+    from frontend import hr_dashboard
+
+    st.session_state.user = {"idToken": None}
+    hr_dashboard.export_interview_data("interview", fmt)
+
+
+def _run_export(monkeypatch, fmt):
+    from frontend import hr_dashboard
+
+    db = FakeFirebaseDatabase({"interviews": make_interviews(30)})
+    monkeypatch.setattr(hr_dashboard, "get_repositories", lambda: (FirebaseInterviewRepository(db), None))
+    at = AppTest.from_function(_export_script, args=(fmt,)).run()
+    assert not at.exception
+    assert not at.error
+    buttons = at.get("download_button")
+    assert len(buttons) == 1
+    return buttons[0]
+
+
+def test_dashboard_export_offers_csv_download(monkeypatch):
+    button = _run_export(monkeypatch, "csv")
+    assert "CSV" in button.proto.label
+
+
+def test_dashboard_export_offers_parquet_download(monkeypatch):
+    pytest.importorskip("pyarrow")
+    button = _run_export(monkeypatch, "parquet")
+    assert "PARQUET" in button.proto.label
+
+
+def test_export_error_is_reported(monkeypatch):
+    from frontend import hr_dashboard
+
+    class BrokenRepository:
+        def iter_pages(self, page_size, token=None):
+            raise ConnectionError("database unreachable")
+            yield
+
+    monkeypatch.setattr(hr_dashboard, "get_repositories", lambda: (BrokenRepository(), None))
+    at = AppTest.from_function(_export_script, args=("csv",)).run()
+    assert "database unreachable" in at.error[0].value
+    assert not at.get("download_button")
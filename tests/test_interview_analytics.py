@@ -0,0 +1,20 @@
+from backend.interview_analytics import build_frames
+from benchmarks.fakes.interview_data import make_interviews
+
+
+def test_archived_column_is_empty_for_live_interviews():
+    data = make_interviews(4)
+    uid = next(iter(data))
+    interview_id = next(iter(data[uid]))
+    data[uid][interview_id] = dict(data[uid][interview_id], archived="2025-01", questions={})
+
+    interviews_df, _ = build_frames(data)
+    archived = {row.interview_id: row.archived for row in interviews_df.itertuples(index=False)}
+    assert archived.pop(interview_id) == "2025-01"
+    assert archived and all(value == "" for value in archived.values())
+    assert [bool(row.archived) for row in interviews_df.itertuples(index=False)].count(True) == 1
+
+
+def test_archived_column_without_any_archived_interviews():
+    interviews_df, _ = build_frames(make_interviews(3))
+    assert not any(interviews_df['archived'])
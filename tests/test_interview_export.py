@@ -0,0 +1,33 @@
+import csv
+import io
+
+from backend.interview_export import export_interviews
+from benchmarks.fakes.interview_data import make_interviews
+
+
+def _pages(n_interviews, page_size=50):
+    data = make_interviews(n_interviews)
+    uids = sorted(data)
+    return [{uid: data[uid] for uid in uids[i:i + page_size]} for i in range(0, len(uids), page_size)]
+
+
+def _rows(export_file):
+    with export_file:
+        return list(csv.reader(io.TextIOWrapper(export_file, encoding='utf-8')))
+
+
+def test_export_within_limit_is_complete():
+    export_file, complete = export_interviews(_pages(400), 'interview', 'csv', max_mb=1)
+    assert complete
+    assert len(_rows(export_file)) == 1 + 400
+
+
+def test_export_stops_at_whole_page_past_limit():
+    export_file, complete = export_interviews(iter(_pages(2000)), 'question', 'csv', max_mb=1)
+    assert not complete
+    assert export_file.seek(0, io.SEEK_END) >= 1024 * 1024
+    export_file.seek(0)
+    rows_per_page = 50 * 2 * 10  # candidates x interviews x questions
+    questions = len(_rows(export_file)) - 1
+    assert questions % rows_per_page == 0
+    assert questions < 2000 * 10
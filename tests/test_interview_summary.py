@@ -0,0 +1,81 @@
+import json
+
+from streamlit.testing.v1 import AppTest
+
+from backend.interview_summary import build_interview_from_session, new_interview_data
+from backend.repository import FirebaseInterviewRepository
+from benchmarks.fakes.interview_data import make_interviews
+from benchmarks.fakes.pyrebase_fake import FakeFirebaseDatabase
+
+UID = "uid0000000"
+INTERVIEW_ID = "interview0000000"
+
+
+def _session(record, answered=None):
+    """Interview session state holding the first `answered` questions of a stored record"""
+    interview_data = new_interview_data()
+    interview_data['interview_id'] = INTERVIEW_ID
+    interview_data['question_count'] = len(record['questions'])
+    keys = list(record['questions'])[:answered]
+    interview_data['answers'] = {
+        key: dict(record['questions'][key], timestamp=record['interview_date']) for key in keys
+    }
+    return interview_data
+
+
+def test_summary_from_session_matches_the_stored_record():
+    record = make_interviews(2)[UID][INTERVIEW_ID]
+    summary = build_interview_from_session(_session(record), record['user_email'])
+
+    assert summary['questions'] == record['questions']
+    assert summary['total_score'] == record['total_score']
+    assert summary['average_score'] == record['average_score']
+    assert summary['total_questions'] == record['total_questions']
+    assert summary['interview_date'] == record['interview_date']
+
+
+def test_summary_from_session_needs_every_answer():
+    record = make_interviews(2)[UID][INTERVIEW_ID]
+    assert build_interview_from_session(_session(record, answered=9), record['user_email']) is None
+    assert build_interview_from_session(new_interview_data(), record['user_email']) is None
+
+
+def _summary_script(interview_data):
+    import streamlit as st
+    from backend import interview_summary
+
+    st.session_state.user = {"localId": "uid0000000", "email": "candidate0@example.com", "idToken": None}
+    st.session_state.interview_data = interview_data
+    interview_summary.show_interview_summary()
+
+
+class _SilentSpeech:
+    def speak(self, text):
+        pass
+
+
+def _show_summary(monkeypatch, answered):
+    from backend import interview_summary
+
+    data = make_interviews(200)
+    db = FakeFirebaseDatabase({"interviews": data})
+    monkeypatch.setattr(interview_summary, "get_repositories", lambda: (FirebaseInterviewRepository(db), None))
+    monkeypatch.setattr(interview_summary, "SpeechIO", _SilentSpeech)
+    record = data[UID][INTERVIEW_ID]
+    at = AppTest.from_function(_summary_script, args=(_session(record, answered),)).run()
+    assert not at.exception
+    assert not [error for error in at.error if error.value.startswith("❌")]
+    return db, record, at
+
+
+def test_summary_page_does_not_read_the_database(monkeypatch):
+    db, record, at = _show_summary(monkeypatch, answered=None)
+    assert db.requests == 0
+    assert any(f"{record['total_score']}/100" == metric.value for metric in at.metric)
+
+
+def test_summary_page_falls_back_to_one_interview_read(monkeypatch):
+    db, record, at = _show_summary(monkeypatch, answered=9)
+    assert db.requests == 1
+    assert db.bytes_read == len(json.dumps(record))
+    assert any(f"{record['total_score']}/100" == metric.value for metric in at.metric)
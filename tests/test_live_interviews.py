@@ -0,0 +1,152 @@
+import base64
+import json
+import threading
+import time
+import urllib.request
+
+from backend.live_interviews import LiveInterviewFeed, token_expiry
+from benchmarks.fakes.firebase_sse import FakeFirebaseSSEServer
+
+
+class _Stream:
+    """Minimal pyrebase-style stream: calls handler({"event", "path", "data"}) per SSE event"""
+
+    def __init__(self, url, handler):
+        self._response = urllib.request.urlopen(url)
+        self._handler = handler
+        self._closed = False
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        event = None
+        for line in self._response:
+            line = line.decode().strip()
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: ") and not self._closed and event != "keep-alive":
+                payload = json.loads(line[len("data: "):]) or {}
+                self._handler({"event": event, "path": payload.get("path"), "data": payload.get("data")})
+        self._response.close()
+
+    def close(self):
+        # Closing the response while the reader thread is blocked on it would wait for the next
+        # keep-alive; stop delivering instead and let the reader finish when the server hangs up
+        self._closed = True
+
+
+class _Database:
+    def __init__(self, url):
+        self.url = url
+        self.streams = 0
+
+    def child(self, path):
+        database = self
+
+        class _Ref:
+            def stream(self, handler, token=None):
+                database.streams += 1
+                return _Stream(f"{database.url}/{path}.json", handler)
+
+        return _Ref()
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_feed_follows_stream_and_recovers_after_auth_revoked():
+    server = FakeFirebaseSSEServer({"u1": {"i1": {"total_score": 7}}}).start()
+    db = _Database(server.url)
+    feed = LiveInterviewFeed()
+    try:
+        feed.subscribe("hr1", db)
+        _wait_for(lambda: feed.aggregate.ready)
+        assert feed.aggregate.snapshot() == {"u1": {"i1": {"total_score": 7}}}
+
+        server.put("/u2/i9", {"total_score": 5})
+        server.patch("/u1/i1", {"total_score": 8})
+        _wait_for(lambda: feed.aggregate.snapshot().get("u1", {}).get("i1") == {"total_score": 8})
+        assert feed.aggregate.snapshot()["u2"] == {"i9": {"total_score": 5}}
+
+        server.revoke()
+        _wait_for(lambda: not feed.running)
+        assert not feed.aggregate.ready
+
+        feed.subscribe("hr1", db)
+        _wait_for(lambda: feed.aggregate.ready)
+        assert db.streams == 2
+        assert set(feed.aggregate.snapshot()) == {"u1", "u2"}
+    finally:
+        feed.stop()
+        server.stop()
+
+
+def test_stop_clears_ready():
+    server = FakeFirebaseSSEServer({"u1": {"i1": {}}}).start()
+    feed = LiveInterviewFeed()
+    try:
+        feed.subscribe("hr1", _Database(server.url))
+        _wait_for(lambda: feed.aggregate.ready)
+        feed.stop()
+        assert not feed.aggregate.ready
+    finally:
+        server.stop()
+
+
+def _token(expires_at):
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": expires_at}).encode()).decode().rstrip("=")
+    return f"header.{claims}.signature"
+
+
+def test_last_unsubscribe_closes_the_stream_and_drops_the_copy():
+    server = FakeFirebaseSSEServer({"u1": {"i1": {}}}).start()
+    db = _Database(server.url)
+    feed = LiveInterviewFeed()
+    try:
+        feed.subscribe("hr1", db)
+        feed.subscribe("hr2", db)
+        _wait_for(lambda: feed.aggregate.ready)
+        assert db.streams == 1
+
+        feed.unsubscribe("hr1")
+        assert feed.running
+        feed.unsubscribe("hr2")
+        assert not feed.running
+        assert feed.aggregate.snapshot() == {}
+    finally:
+        feed.stop()
+        server.stop()
+
+
+def test_stream_closes_when_leases_lapse_or_the_token_expires():
+    server = FakeFirebaseSSEServer({"u1": {"i1": {}}}).start()
+    db = _Database(server.url)
+    feed = LiveInterviewFeed(lease_seconds=0.2)
+    try:
+        # A session that closed its tab never unsubscribes
+        feed.subscribe("hr1", db)
+        _wait_for(lambda: feed.aggregate.ready)
+        _wait_for(lambda: not feed.running)
+        assert feed.subscribers == 0
+
+        feed.lease_seconds = 60
+        feed.subscribe("hr1", db, _token(time.time() + 0.5))
+        assert feed.running
+        _wait_for(lambda: not feed.running)
+
+        # An expired token isn't used to reconnect
+        feed.subscribe("hr1", db, _token(time.time() - 1))
+        assert not feed.running
+        assert db.streams == 2
+    finally:
+        feed.stop()
+        server.stop()
+
+
+def test_token_expiry_reads_the_jwt_exp_claim():
+    assert token_expiry(_token(1700000000)) == 1700000000
+    assert token_expiry("not-a-jwt") is None
+    assert token_expiry(None) is None
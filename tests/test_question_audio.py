@@ -0,0 +1,85 @@
+import contextlib
+import queue
+import threading
+import time
+
+import pytest
+
+from backend import cloud_speech_io
+
+
+class _Recorder:
+    """Records what the speech handler puts on the page, in order"""
+
+    def __init__(self):
+        self.calls = []
+
+    def markdown(self, body, **kwargs):
+        self.calls.append(("markdown", body))
+
+    def audio(self, data, **kwargs):
+        self.calls.append(("audio", data))
+
+    def caption(self, body):
+        self.calls.append(("caption", body))
+
+    def success(self, *args):
+        pass
+
+    def warning(self, body):
+        self.calls.append(("warning", body))
+
+    def info(self, body):
+        self.calls.append(("info", body))
+
+    def empty(self):
+        return self
+
+    def container(self):
+        return contextlib.nullcontext()
+
+
+@pytest.fixture
+def page(monkeypatch):
+    recorder = _Recorder()
+    monkeypatch.setattr(cloud_speech_io, "st", recorder)
+    monkeypatch.setattr(cloud_speech_io, "TTS_BITRATE", 8000)  # 1 KB of "mp3" plays for one second
+    return recorder
+
+
+def _handler():
+    return cloud_speech_io.CloudSpeechIO.__new__(cloud_speech_io.CloudSpeechIO)
+
+
+def test_question_text_is_shown_before_the_audio(page, monkeypatch):
+    handler = _handler()
+    monkeypatch.setattr(cloud_speech_io, "TTS_BACKEND", "edge")
+    monkeypatch.setattr(handler, "_speak_progressive", lambda text: page.audio(b"x") or True, raising=False)
+    handler.speak("Tell me about a project.")
+    assert [kind for kind, _ in page.calls] == ["markdown", "audio"]
+
+
+def test_each_sentence_gets_its_own_deadline(page, monkeypatch):
+    monkeypatch.setattr(cloud_speech_io, "TTS_TIMEOUT", 0.3)
+    chunks = queue.Queue()
+
+    def synthesize():
+        for index in range(3):
+            time.sleep(0.2)  # 0.6 s in total, more than one TTS_TIMEOUT
+            chunks.put((index, b"a" * 100))
+        chunks.put(None)
+
+    threading.Thread(target=synthesize, daemon=True).start()
+    handler = _handler()
+    assert handler._play_chunks(chunks)
+    assert sum(len(data) for kind, data in page.calls if kind == "audio") == 300
+    assert not [body for kind, body in page.calls if kind == "caption"]
+    assert handler.audio_ends_at is not None
+
+
+def test_missing_later_sentence_falls_back_to_text(page, monkeypatch):
+    monkeypatch.setattr(cloud_speech_io, "TTS_TIMEOUT", 0.2)
+    chunks = queue.Queue()
+    chunks.put((0, b"a" * 100))  # the second sentence never arrives
+    assert _handler()._play_chunks(chunks)
+    assert [body for kind, body in page.calls if kind == "caption"]
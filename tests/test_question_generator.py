@@ -0,0 +1,32 @@
+from backend.question_generator import QuestionGenerator
+from benchmarks.fakes.groq_fake import FakeGroq
+
+
+def _generator(reply):
+    generator = QuestionGenerator(groq_api_key=None)
+    generator.client = FakeGroq(reply=lambda prompt: reply)
+    return generator
+
+
+def test_preamble_and_list_markers_are_not_asked():
+    reply = ("Here are three interview questions:\n"
+             "\n"
+             "1. **How did you structure the Python code in your chat app?**\n"
+             "2) Tell me about a bug you fixed in the chat app.\n"
+             "Question 3: \"What would you change about its design?\"\n"
+             "I hope these help!")
+    assert QuestionGenerator._split_candidates(reply) == [
+        "How did you structure the Python code in your chat app?",
+        "Tell me about a bug you fixed in the chat app.",
+        "What would you change about its design?",
+    ]
+
+    question, asked = _generator(reply).generate_ai_question(["Python"], ["Chat app"])
+    assert question == "How did you structure the Python code in your chat app?"
+    assert question in asked
+
+
+def test_reply_with_only_chatter_falls_back_to_a_template():
+    generator = _generator("Sure! Here is a question:\nGood luck.")
+    question, _ = generator.generate_ai_question(["Python"], ["Chat app"])
+    assert question and question != "Good luck."
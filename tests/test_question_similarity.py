@@ -0,0 +1,26 @@
+from backend.question_similarity import QuestionIndex, question_terms, subject_terms
+
+
+def test_same_template_about_different_skills_is_not_a_duplicate():
+    asked = "What challenges have you faced using Python?"
+    new = "What challenges have you faced using Java?"
+    assert not QuestionIndex([asked]).is_duplicate(new)
+    assert not QuestionIndex([asked], key_terms=subject_terms(["Python", "Java"])).is_duplicate(new)
+
+
+def test_paraphrase_is_a_duplicate():
+    index = QuestionIndex(["Tell me about your Python experience"], key_terms=subject_terms(["Python"]))
+    assert index.is_duplicate("Describe your experience with Python")
+
+
+def test_word_forms_share_a_term():
+    for forms in (["challenge", "challenges", "challenged", "challenging"],
+                  ["face", "faced", "facing"],
+                  ["apply", "applies", "applied", "applying"],
+                  ["plan", "planned", "planning"]):
+        assert len({question_terms(word) for word in forms}) == 1, forms
+
+
+def test_subject_terms_flattens_skill_groups():
+    skills = {"programming_languages": ["Python"], "machine_learning": ["Machine Learning"]}
+    assert {"python", "machin", "learn"} <= subject_terms(skills, ["Chat app"])
@@ -0,0 +1,42 @@
+import time
+
+import pytest
+
+from backend import telemetry
+from frontend.user_dashboard import timed_question_stream
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(telemetry, "ENABLED", True)
+    monkeypatch.setattr(telemetry, "TELEMETRY", "")
+    fresh = telemetry.Registry()
+    monkeypatch.setattr(telemetry, "registry", fresh)
+    return fresh
+
+
+def _tokens():
+    for token in ("Tell ", "me ", "about ", "Python."):
+        time.sleep(0.01)
+        yield token
+
+
+def test_question_generation_ends_with_the_token_stream(registry):
+    stream = timed_question_stream(_tokens(), "technical_skills")
+    text = "".join(stream)
+    time.sleep(0.3)  # speaking the question afterwards isn't generation time
+    del stream
+
+    assert text == "Tell me about Python."
+    generation = registry.histograms[("question_generation", "ok")]
+    assert generation.count == 1
+    assert 0.04 <= generation.sum < 0.3
+
+
+def test_stopping_early_is_not_an_error(registry):
+    stream = timed_question_stream(_tokens(), "technical_skills")
+    assert next(stream) == "Tell "
+    stream.close()
+
+    assert ("question_generation", "error") not in registry.histograms
+    assert registry.histograms[("question_generation", "ok")].count == 1